@@ -1,7 +1,7 @@
-import bpy, json, sys
-from bpy.props import StringProperty, IntProperty, FloatProperty, BoolProperty, PointerProperty
+import bpy, json, sys, os, stat, time, asyncio, weakref, collections, queue, threading, concurrent.futures, socket, tracemalloc, textwrap
+from bpy.props import StringProperty, IntProperty, FloatProperty, BoolProperty, EnumProperty, PointerProperty, CollectionProperty
 from bpy.types import Operator, PropertyGroup, Panel
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 #==================================================#
 #RAD GUI
@@ -22,26 +22,234 @@ from typing import List, Dict, Any
 #==================================================#
 
 
+#==================================================#
+#Transaction Class
+#==================================================#
+#Buffers the VARIABLE_CHANGED events of a domain (or a single instance of it)
+#while many properties are written, then raises a single event:
+#   EVENT_ID      - The domain
+#   EVENT_CLASS   - The domain class, or the instance the transaction was opened on
+#   OBJECT_TYPE   - VARIABLE
+#   EVENT_TYPE    - VARIABLE_BATCH_CHANGED
+#   CHANGES       - [{"EVENT_CLASS":Instance,"EVENT_ID":PropertyName,"VALUE":FinalValue}, ...]
+#Each property is listed once, in the order it was first changed. Nested
+#transactions hand their changes to the outer one.
+#
+#Transaction(IsAtomic=True) reads the values of every instance it covers when
+#it opens. If the block raises, the changed properties are written back and no
+#event is raised for them. Open it on the instance when only one is written,
+#on a whole domain it reads every scene / object holding the domain.
+class RADGUI_TRANSACTION():
+
+    def __init__(self,Owner: Any,IsAtomic: bool = False) -> None:
+
+        self.DomainClass: Any = Owner if isinstance(Owner,type) else type(Owner)
+        self.Target: Any = None if isinstance(Owner,type) else Owner
+        self.Changes: Dict[Any, Any] = {}
+        self.Context: Any = None
+        self.Outer: Any = None
+        self.IsAtomic: bool = IsAtomic
+        #Identity -> {PropertyName: Value} when the transaction opened
+        self.Snapshot: Dict[Any, Dict[str, Any]] = {}
+        #What an instance without a snapshot started from, a new sparse entry starts from the defaults
+        self.Fallback: Any = None
+
+    #Blender hands out a new python object on every access, so compare the underlying data
+    @staticmethod
+    def Identify(Object: Any) -> Any:
+        try:
+            return Object.as_pointer()
+        except:
+            return id(Object)
+
+    def Buffer(self,Object: Any,Context: Any,PropertyName: str) -> bool:
+
+        Key: Any = None
+
+        if (self.Target != None) and (self.Identify(Object) != self.Identify(self.Target)):
+            #Not ours, maybe an enclosing transaction wants it
+            if (self.Outer != None):
+                return self.Outer.Buffer(Object,Context,PropertyName)
+            return False
+
+        Key = (self.Identify(Object),PropertyName)
+        if (Key not in self.Changes):
+            self.Changes[Key] = (Object,PropertyName)
+        self.Context = Context
+
+        return True
+
+    #Every instance the transaction covers
+    def Instances(self) -> List[Any]:
+
+        Table: Any = None
+
+        if (self.Target != None):
+            return [self.Target]
+
+        if (self.DomainClass.Scope.upper() == "SCENE"):
+            return [getattr(x,self.DomainClass.Domain) for x in bpy.data.scenes if hasattr(x,self.DomainClass.Domain)]
+        elif (self.DomainClass.Scope.upper() == "OBJECT"):
+            return [getattr(x,self.DomainClass.Domain) for x in bpy.data.objects if hasattr(x,self.DomainClass.Domain)]
+        elif (self.DomainClass.Scope.upper() == "SPARSE"):
+            Table = self.DomainClass.Sparse.Table(self.DomainClass.Domain)
+            return list(Table.Entries) + [Table.Default]
+
+        return []
+
+    #Property values of an instance, arrays copied so later writes don't show through
+    def Read(self,Instance: Any) -> Dict[str, Any]:
+
+        Result: Dict[str, Any] = {}
+        Name: str = ""
+        Value: Any = None
+
+        for Name in getattr(self.DomainClass,"__annotations__",{}):
+            if (Name == "RADGUI_OWNER"):
+                continue
+            try:
+                Value = getattr(Instance,Name)
+            except:
+                continue
+            Result[Name] = tuple(Value) if (hasattr(Value,"__len__") == True) and (isinstance(Value,str) == False) else Value
+
+        return Result
+
+    #Writes the buffered properties back to their snapshot, returns the keys it restored
+    def Rollback(self) -> List[Any]:
+
+        Result: List[Any] = []
+        Key: Any = None
+        Object: Any = None
+        PropertyName: str = ""
+        Values: Any = None
+
+        for Key, (Object, PropertyName) in list(self.Changes.items()):
+            Values = self.Snapshot.get(Key[0],self.Fallback)
+            if (Values == None) or (PropertyName not in Values):
+                continue
+            try:
+                setattr(Object,PropertyName,Values[PropertyName])
+                Result.append(Key)
+            except:
+                #Owner went away during the transaction
+                pass
+
+        return Result
+
+    def __enter__(self) -> Any:
+
+        Instance: Any = None
+
+        if (self.IsAtomic == True):
+            for Instance in self.Instances():
+                self.Snapshot[self.Identify(Instance)] = self.Read(Instance)
+            if (self.Target == None) and (self.DomainClass.Scope.upper() == "SPARSE"):
+                self.Fallback = self.Read(self.DomainClass.Sparse.Table(self.DomainClass.Domain).Default)
+
+        self.Outer = self.DomainClass.ActiveTransaction
+        self.DomainClass.ActiveTransaction = self
+        return self
+
+    def __exit__(self,ExceptionType,ExceptionValue,Traceback) -> bool:
+
+        Remaining: List[Any] = []
+        Changes: List[Dict[str, Any]] = []
+        Object: Any = None
+        PropertyName: str = ""
+        Key: Any = None
+
+        #Still the active transaction, so writing the old values back only buffers more changes here
+        if (self.IsAtomic == True) and (ExceptionType != None):
+            for Key in self.Rollback():
+                self.Changes.pop(Key,None)
+        self.Snapshot = {}
+        self.Fallback = None
+
+        self.DomainClass.ActiveTransaction = self.Outer
+
+        #Without IsAtomic the properties stay written, so the event goes out even if the block raised
+        for Object, PropertyName in self.Changes.values():
+            if (self.Outer != None) and (self.Outer.Buffer(Object,self.Context,PropertyName) == True):
+                continue
+            Remaining.append((Object,PropertyName))
+
+        for Object, PropertyName in Remaining:
+            try:
+                Changes.append({"EVENT_CLASS":Object,"EVENT_ID":PropertyName,"VALUE":getattr(Object,PropertyName)})
+            except:
+                #Owner went away during the transaction
+                pass
+
+        self.Changes = {}
+
+        if (len(Changes) == 0):
+            return False
+
+        self.DomainClass.Console.WriteTags = {"RADGUI_TRANSACTION":2}
+        self.DomainClass.Console.Write("(RADGUI_TRANSACTION) {} - {} change(s) committed".format(self.DomainClass.Domain,len(Changes)))
+
+        self.DomainClass.EventManager.HandleEvent({
+            "EVENT_ID":self.DomainClass.Domain,
+            "EVENT_CLASS":self.DomainClass if self.Target == None else self.Target,
+            "CONTEXT":self.Context if self.Context != None else bpy.context,
+            "OBJECT_TYPE":"VARIABLE",
+            "EVENT_TYPE":"VARIABLE_BATCH_CHANGED",
+            "CHANGES":Changes
+        })
+
+        return False
+
+#with Domain.Transaction(): ... buffers the whole domain
+#with Context.scene.DOMAIN.Transaction(): ... buffers only that instance
+class RADGUI_TRANSACTION_METHOD():
+
+    def __get__(self,Instance: Any,Owner: Any) -> Any:
+        return lambda IsAtomic = False: RADGUI_TRANSACTION(Owner if Instance == None else Instance,IsAtomic)
+
 #==================================================#
 #Property Shell Class
 #==================================================#
 class RADGUI_PROPERTYGROUP_SHELL(PropertyGroup):
     Domain: str = ""
     Scope: str = "SCENE"
+    ActiveTransaction: Any = None
+    Transaction: Any = RADGUI_TRANSACTION_METHOD()
+    #[Name, Inputs, Handler] of each COMPUTED property, added to the graph on register
+    ComputedNodes: List[Any] = []
+    #Changes made to many objects in the same tick are raised as one event
+    Aggregate: bool = False
 
     @staticmethod
     def PropertyUpdate(Object, Context, PropertyName) -> None:
 
+        #Sparse domains - an edit of the shared defaults is moved onto the object it was meant for
+        if (Object.Scope == "SPARSE") and (Object.Sparse.Changed(Object,Context,PropertyName) == False):
+            return
+
+        #Computed properties reading this one get recomputed on the next tick
+        if ((Object.Domain + "." + PropertyName) in Object.Computed.Dependents):
+            Object.Computed.Notify(Object,Context,PropertyName)
+
+        #Inside a transaction the change is only noted down, one batch event is raised when it closes
+        if (Object.ActiveTransaction != None) and (Object.ActiveTransaction.Buffer(Object,Context,PropertyName) == True):
+            return
+
+        #Alt-drag and copy-to-selected update each object in turn, those get collected until the next tick
+        if (Object.Aggregate == True) and (Object.Aggregator.Buffer(Object,Context,PropertyName) == True):
+            return
+
         GeneratedEvent : Dict[str, Any] = {
                 "EVENT_ID":PropertyName,
                 "EVENT_CLASS":Object,
                 "CONTEXT":Context,
+                "DOMAIN":Object.Domain,
                 "OBJECT_TYPE":"VARIABLE",
                 "EVENT_TYPE":"VARIABLE_CHANGED",
                 "VALUE":getattr(Object,PropertyName)
             }
             
-        RADGUI_EVENT_MANAGER.HandleEvent(GeneratedEvent)
+        Object.EventManager.HandleEvent(GeneratedEvent)
 
     @classmethod
     def register(cls) -> None:
@@ -50,16 +258,26 @@ class RADGUI_PROPERTYGROUP_SHELL(PropertyGroup):
                 setattr(bpy.types.Scene,cls.Domain,PointerProperty(type=cls))
             elif (cls.Scope.upper() == "OBJECT"):
                 setattr(bpy.types.Object,cls.Domain,PointerProperty(type=cls))
+            elif (cls.Scope.upper() == "SPARSE"):
+                cls.Sparse.Attach(cls)
+
+            #Sparse values still belong to objects as far as the graph is concerned
+            cls.Computed.AddDomain(cls.Domain,"OBJECT" if cls.Scope.upper() == "SPARSE" else cls.Scope.upper())
+            for Node in cls.ComputedNodes:
+                cls.Computed.AddNode(cls.Domain,Node[0],Node[1],Node[2])
 
     @classmethod
     def unregister(cls) -> None:
         if (cls.Domain != ""):
+            cls.Computed.RemoveDomain(cls.Domain)
             if (cls.Scope.upper() == "SCENE"):
                 if hasattr(bpy.types.Scene,cls.Domain) == True:
                     delattr(bpy.types.Scene,cls.Domain)
             elif (cls.Scope.upper() == "OBJECT"):
                 if hasattr(bpy.types.Object,cls.Domain) == True:
                     delattr(bpy.types.Object,cls.Domain)
+            elif (cls.Scope.upper() == "SPARSE"):
+                cls.Sparse.Detach(cls)
 
 #==================================================#
 #Operator Shell Class
@@ -69,8 +287,8 @@ class RADGUI_OPERATOR_SHELL(Operator):
     EventID: bpy.props.StringProperty()
 
     def CompiledExecute(self,Context) -> None:
-        RADGUI_CONSOLE.WriteTags = {"OPERATOR":1}
-        RADGUI_CONSOLE.Write("Button "+str(self.__class__)+" Pressed!")
+        self.Console.WriteTags = {"OPERATOR":1}
+        self.Console.Write("Button "+str(self.__class__)+" Pressed!")
 
         if (self.EventID != ""):
 
@@ -81,12 +299,148 @@ class RADGUI_OPERATOR_SHELL(Operator):
                 "EVENT_TYPE":"BUTTON_PRESSED"
             }
             
-            RADGUI_EVENT_MANAGER.HandleEvent(GeneratedEvent)
+            self.EventManager.HandleEvent(GeneratedEvent)
 
     def execute(self,Context) -> Any:
         self.CompiledExecute(Context)
         return {'FINISHED'}
 
+#==================================================#
+#Batch Operator Shell Class
+#==================================================#
+#Runs as a modal operator instead of doing everything inside execute. Each
+#timer tick hands the handlers CHUNK_SIZE items at a time until TIME_BUDGET
+#seconds are used up, then gives the UI back. Esc / right click cancels.
+#
+#Events raised (EVENT_ID = the button's EventID):
+#   BATCH_STARTED, BATCH_CHUNK (ITEMS, OBJECTS), BATCH_FINISHED, BATCH_CANCELLED
+#   all carrying DONE and TOTAL
+class RADGUI_BATCH_OPERATOR_SHELL(RADGUI_OPERATOR_SHELL):
+    #ALL_OBJECTS or any context collection of objects - SELECTED_OBJECTS, VISIBLE_OBJECTS, ...
+    ItemSource: str = "SELECTED_OBJECTS"
+    ChunkSize: int = 100
+    TimeBudget: float = 0.02
+    Interval: float = 0.01
+
+    def CollectItems(self,Context) -> List[str]:
+
+        Source: Any = None
+
+        if (self.ItemSource.upper() == "ALL_OBJECTS"):
+            Source = bpy.data.objects
+        else:
+            Source = getattr(Context,self.ItemSource.lower(),[])
+
+        #Names rather than objects, the objects may be deleted while we run
+        return [x.name for x in Source]
+
+    def RaiseBatchEvent(self,Context,EventType: str,Extra: Dict[str, Any] = {}) -> None:
+
+        GeneratedEvent : Dict[str, Any] = {
+            "EVENT_ID":self.EventID,
+            "OBJECT_TYPE":"BUTTON",
+            "CONTEXT":Context,
+            "EVENT_TYPE":EventType,
+            "DONE":self.Done,
+            "TOTAL":len(self.Items)
+        }
+        GeneratedEvent.update(Extra)
+
+        self.EventManager.HandleEvent(GeneratedEvent)
+
+    #Hands out chunks until the budget for this tick is spent, True once everything is done
+    def ProcessChunks(self,Context,TimeBudget: float) -> bool:
+
+        StartTime: float = time.perf_counter()
+        Chunk: List[str] = []
+
+        while (self.Done < len(self.Items)):
+
+            Chunk = self.Items[self.Done:self.Done + max(1,self.ChunkSize)]
+            self.Done += len(Chunk)
+
+            self.RaiseBatchEvent(Context,"BATCH_CHUNK",{
+                "ITEMS":tuple(Chunk),
+                "OBJECTS":[x for x in (bpy.data.objects.get(y) for y in Chunk) if x != None]
+            })
+
+            if (TimeBudget > 0) and ((time.perf_counter() - StartTime) >= TimeBudget):
+                break
+
+        return (self.Done >= len(self.Items))
+
+    def Finish(self,Context,EventType: str) -> None:
+
+        WindowManager: Any = Context.window_manager
+
+        if (getattr(self,"Timer",None) != None):
+            WindowManager.event_timer_remove(self.Timer)
+            self.Timer = None
+
+        WindowManager.progress_end()
+        if (Context.workspace != None):
+            Context.workspace.status_text_set(None)
+
+        self.RaiseBatchEvent(Context,EventType)
+
+    def invoke(self,Context,Event) -> Any:
+
+        self.Console.WriteTags = {"OPERATOR":1}
+        self.Console.Write("Batch "+str(self.__class__)+" Started!")
+
+        WindowManager: Any = Context.window_manager
+
+        self.Items: List[str] = self.CollectItems(Context)
+        self.Done: int = 0
+        self.Timer: Any = None
+
+        self.RaiseBatchEvent(Context,"BATCH_STARTED")
+
+        if (len(self.Items) == 0):
+            self.RaiseBatchEvent(Context,"BATCH_FINISHED")
+            return {'FINISHED'}
+
+        WindowManager.progress_begin(0,len(self.Items))
+        self.Timer = WindowManager.event_timer_add(self.Interval,window=Context.window)
+        WindowManager.modal_handler_add(self)
+
+        return {'RUNNING_MODAL'}
+
+    def modal(self,Context,Event) -> Any:
+
+        if (Event.type == 'ESC') or (Event.type == 'RIGHTMOUSE'):
+            self.Console.WriteTags = {"OPERATOR":1}
+            self.Console.Write("Batch "+str(self.__class__)+" Cancelled at {}/{}".format(self.Done,len(self.Items)))
+            self.Finish(Context,"BATCH_CANCELLED")
+            return {'CANCELLED'}
+
+        if (Event.type != 'TIMER') or (Event.timer != self.Timer):
+            return {'PASS_THROUGH'}
+
+        IsDone: bool = self.ProcessChunks(Context,self.TimeBudget)
+
+        Context.window_manager.progress_update(self.Done)
+        if (Context.workspace != None):
+            Context.workspace.status_text_set("{}: {}/{} (Esc to cancel)".format(self.bl_label,self.Done,len(self.Items)))
+
+        if (IsDone == True):
+            self.Finish(Context,"BATCH_FINISHED")
+            return {'FINISHED'}
+
+        return {'RUNNING_MODAL'}
+
+    #Called from scripts there is no UI to keep alive, so just run it all
+    def execute(self,Context) -> Any:
+
+        self.Items: List[str] = self.CollectItems(Context)
+        self.Done: int = 0
+
+        self.RaiseBatchEvent(Context,"BATCH_STARTED")
+        self.ProcessChunks(Context,0)
+        self.RaiseBatchEvent(Context,"BATCH_FINISHED")
+
+        return {'FINISHED'}
+
 #==================================================#
 #Panel Shell Class
 #==================================================#
@@ -99,49 +453,279 @@ class RADGUI_PANEL_SHELL(Panel):
 
     #Occurs whenever the panel gets drawn
     def draw(self,Context) -> None:
+
+        Token: Any = None
+
+        if (self.Profiler.IsProfiling == True):
+            Token = self.Profiler.Begin()
+
         #Content array holds priority over a compiled draw function
         if (self.Content != []):
-            RADGUI_ENGINE.Draw(self,Context,self.Content)
+            self.Engine.Draw(self,Context,self.Content)
         else:
             self.CompiledDraw(Context)                        
 
+        if (Token != None):
+            self.Profiler.End("PANEL",self.bl_label if self.bl_label != "" else self.__class__.__name__,Token)
+
 #==================================================#
 #RAD GUI Console
 #==================================================#
 class RADGUI_CONSOLE():
     OutputFilter: Dict[str,int] = {}
     WriteTags: Dict[str,int] = {}
+    #Where written messages go, no sinks = print
+    Sinks: List[Any] = []
+    #Tag -> messages per second, [tokens, last refill] and drop counters per tag
+    RateLimits: Dict[str,float] = {}
+    RateState: Dict[str,List[float]] = {}
+    Dropped: Dict[str,int] = {}
+    PendingDrops: Dict[str,int] = {}
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_CONSOLE",(cls,),dict(Links,OutputFilter={},WriteTags={},Sinks=[],RateLimits={},RateState={},Dropped={},PendingDrops={}))
 
+    #Lets callers skip building expensive debug strings that would be filtered anyway
     @classmethod
-    def Write(cls,Input: str) -> None:
+    def IsWritable(cls) -> bool:
 
-        CanWrite: bool = False
         WriteKey: str = ""
         WriteValue: int = 0
 
-        #Determine if message is to be written in screen
-        #No filter or Tags = All Permitted
         if(cls.OutputFilter != {}) and (cls.WriteTags != {}):
             for WriteKey, WriteValue in cls.WriteTags.items():
                 if (WriteKey in cls.OutputFilter):
                     if (WriteValue <= cls.OutputFilter[WriteKey]):
-                        CanWrite = True
-                        break
-        else:
-            CanWrite = True
+                        return True
+            return False
+
+        return True
+
+    #Token bucket per tag, a burst of up to one second's worth is allowed
+    @classmethod
+    def IsWithinRate(cls,Tag: str) -> bool:
+
+        Now: float = 0.0
+        State: List[float] = []
+
+        if (Tag not in cls.RateLimits):
+            return True
+
+        Now = time.monotonic()
+
+        if (Tag not in cls.RateState):
+            cls.RateState[Tag] = [float(cls.RateLimits[Tag]),Now]
+
+        State = cls.RateState[Tag]
+        State[0] = min(float(cls.RateLimits[Tag]),State[0] + ((Now - State[1]) * float(cls.RateLimits[Tag])))
+        State[1] = Now
+
+        if (State[0] < 1.0):
+            cls.Dropped[Tag] = cls.Dropped.get(Tag,0) + 1
+            cls.PendingDrops[Tag] = cls.PendingDrops.get(Tag,0) + 1
+            return False
+
+        State[0] -= 1.0
+        return True
+
+    @classmethod
+    def BuildSink(cls,Definition: Dict[str,Any]) -> Any:
+
+        SinkType: str = str(Definition.get("TYPE","PRINT")).upper()
+
+        if (SinkType == "PRINT"):
+            return RADGUI_PRINT_SINK()
+        elif (SinkType == "RING"):
+            return RADGUI_RING_SINK(int(Definition.get("SIZE",1000)))
+        elif (SinkType == "FILE"):
+            return RADGUI_FILE_SINK(
+                str(Definition["PATH"]),
+                int(Definition.get("MAX_BYTES",1048576)),
+                int(Definition.get("BACKUPS",3)),
+                float(Definition.get("FLUSH_INTERVAL",0.5))
+            )
+
+        return None
+
+    @classmethod
+    def Emit(cls,Tag: str,Input: str) -> None:
+
+        Sink: Any = None
+
+        if (cls.Sinks == []):
+            print(Input)
+            return
+
+        for Sink in cls.Sinks:
+            Sink.Emit(Tag,Input)
+
+    @classmethod
+    def Write(cls,Input: str) -> None:
+
+        CanWrite: bool = False
+        Tag: str = ""
+
+        #Determine if message is to be written in screen
+        #No filter or Tags = All Permitted
+        CanWrite = cls.IsWritable()
         
         if(CanWrite == True):
-            print(Input)
+
+            #Rate limits go by the first tag the message was written under
+            if (cls.WriteTags != {}):
+                Tag = next(iter(cls.WriteTags))
+
+            if (cls.RateLimits != {}):
+                if (cls.IsWithinRate(Tag) == False):
+                    return
+                #Let the reader know what they missed once the tag is allowed through again
+                if (cls.PendingDrops.get(Tag,0) > 0):
+                    cls.Emit(Tag,"(RADGUI_CONSOLE) {} message(s) dropped for \"{}\"".format(cls.PendingDrops[Tag],Tag))
+                    cls.PendingDrops[Tag] = 0
+
+            cls.Emit(Tag,Input)
+
+    @classmethod
+    def CloseSinks(cls) -> None:
+
+        Sink: Any = None
+
+        for Sink in cls.Sinks:
+            Sink.Close()
+
+#==================================================#
+#RAD GUI Console Sinks
+#==================================================#
+#Every sink has Emit(Tag,Message) and Close()
+class RADGUI_PRINT_SINK():
+
+    def Emit(self,Tag: str,Input: str) -> None:
+        print(Input)
+
+    def Close(self) -> None:
+        pass
+
+#Keeps the last SIZE messages in memory, nothing touches the terminal
+class RADGUI_RING_SINK():
+
+    def __init__(self,Size: int = 1000) -> None:
+        self.Buffer: Any = collections.deque(maxlen=Size)
+
+    def Emit(self,Tag: str,Input: str) -> None:
+        self.Buffer.append((time.time(),Tag,Input))
+
+    def Lines(self) -> List[str]:
+        return [x[2] for x in self.Buffer]
+
+    def Close(self) -> None:
+        pass
+
+#Writes from a background thread in batches, rotating the file at MAX_BYTES.
+#Emit never blocks, if the queue is full the message is counted as dropped.
+class RADGUI_FILE_SINK():
+
+    def __init__(self,FileName: str,MaxBytes: int = 1048576,Backups: int = 3,FlushInterval: float = 0.5,QueueSize: int = 10000) -> None:
+        self.FileName: str = FileName
+        self.MaxBytes: int = MaxBytes
+        self.Backups: int = Backups
+        self.FlushInterval: float = FlushInterval
+        self.Queue: Any = queue.Queue(maxsize=QueueSize)
+        self.Dropped: int = 0
+        self.Thread: Any = threading.Thread(target=self.Run,name="RADGUI_FILE_SINK",daemon=True)
+        self.Thread.start()
+
+    def Emit(self,Tag: str,Input: str) -> None:
+        try:
+            self.Queue.put_nowait(Input)
+        except queue.Full:
+            self.Dropped += 1
+
+    def Rotate(self,FileOutput: Any) -> Any:
+
+        Index: int = 0
+
+        FileOutput.close()
+
+        #name.2 -> name.3, name.1 -> name.2, name -> name.1
+        for Index in range(self.Backups - 1,0,-1):
+            if os.path.exists("{}.{}".format(self.FileName,Index)):
+                os.replace("{}.{}".format(self.FileName,Index),"{}.{}".format(self.FileName,Index + 1))
+
+        if (self.Backups > 0):
+            os.replace(self.FileName,self.FileName + ".1")
+        else:
+            os.remove(self.FileName)
+
+        return open(self.FileName,"a")
+
+    def Run(self) -> None:
+
+        Batch: List[str] = []
+        Message: Any = None
+        IsClosing: bool = False
+
+        FileOutput: Any = open(self.FileName,"a")
+
+        while (IsClosing == False):
+
+            #Wait for the first message, then take whatever else already piled up
+            try:
+                Message = self.Queue.get(timeout=self.FlushInterval)
+            except queue.Empty:
+                continue
+
+            Batch = []
+            while True:
+                if (Message == None):
+                    IsClosing = True
+                    break
+                Batch.append(Message)
+                try:
+                    Message = self.Queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if (len(Batch) > 0):
+                try:
+                    FileOutput.write("\n".join(Batch) + "\n")
+                    FileOutput.flush()
+                    if (self.MaxBytes > 0) and (FileOutput.tell() >= self.MaxBytes):
+                        FileOutput = self.Rotate(FileOutput)
+                except:
+                    self.Dropped += len(Batch)
+
+        FileOutput.close()
+
+    def Close(self) -> None:
+        if (self.Thread.is_alive() == True):
+            #Blocking put, the sentinel has to get through even if the queue is full
+            self.Queue.put(None)
+            self.Thread.join()
 
 #==================================================#
 #RAD GUI Engine
 #==================================================#
 class RADGUI_ENGINE():
+    #(Text, Width Bucket, UI Scale) -> wrapped lines, least recently drawn first
+    LabelCache: Any = collections.OrderedDict()
+    LabelCacheSize: int = 256
+    #Widths within a bucket wrap the same, so resizing a panel doesn't re-wrap on every pixel
+    WidthBucket: int = 20
+    #Rough width of a character at a UI scale of 1, in pixels
+    CharacterWidth: float = 7.0
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_ENGINE",(cls,),dict(Links,LabelCache=collections.OrderedDict()))
+
     @classmethod
     def Draw(cls,Source,ContextEnvironment,Instructions: List[Dict[str, Any]] = []) -> None:
 
         #Console Filter
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_ENGINE":1}
+        cls.Console.WriteTags = {"RADGUI_ENGINE":1}
 
         #Layout Related Variables
         Layout: Any = Source.layout
@@ -233,18 +817,26 @@ class RADGUI_ENGINE():
                 #We make a Label
                 elif CurrentType == "LABEL":
 
-                    cls.WriteLabel(ContextObject,CurrentInstruction)
+                    cls.WriteLabel(ContextObject,CurrentInstruction,ContextEnvironment)
 
                 #We make a property
                 elif CurrentType == "PROPERTY":
                     
                     cls.WriteProperty(ContextObject,ContextEnvironment,CurrentInstruction)
 
+    #CUSTOM_ICON names an image from the ICONS config, and wins over ICON_VALUE
     @classmethod
-    def WriteOperator(cls,Context,Command: Dict[str, Any] = {}) -> None:
+    def IconValue(cls,Attributes: Dict[str, Any]) -> int:
+        if (Attributes["CUSTOM_ICON"] != ""):
+            return cls.Icons.Value(Attributes["CUSTOM_ICON"])
+        return Attributes["ICON_VALUE"]
+
+    #Resolves an OPERATOR instruction into its final attributes, empty if it can't be drawn
+    @classmethod
+    def ParseOperator(cls,Command: Dict[str, Any] = {}) -> Dict[str, Any]:
         
         #Console Filter
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_ENGINE":2}
+        cls.Console.WriteTags = {"RADGUI_ENGINE":2}
 
         #Define Operator Defaults
         Attributes: Dict[str, Any] = {
@@ -256,16 +848,17 @@ class RADGUI_ENGINE():
             "EMBOSS":True,
             "DEPRESS":False,
             "ICON_VALUE":0,
+            "CUSTOM_ICON":"",
             "EVENT_ID":""
         }
 
         #Required Attribute - Class Name
         if "CLASS" not in Command:
-            RADGUI_CONSOLE.Write("(OPERATOR) Required Attribute Missing: \"CLASS\"")
-            return
+            cls.Console.Write("(OPERATOR) Required Attribute Missing: \"CLASS\"")
+            return {}
         elif str(Command["CLASS"]).strip() == "":
-            RADGUI_CONSOLE.Write("(OPERATOR) Required Attribute - \"CLASS\" is blank")
-            return
+            cls.Console.Write("(OPERATOR) Required Attribute - \"CLASS\" is blank")
+            return {}
         else:
             Attributes["CLASS"] = str(Command["CLASS"]).lower()
 
@@ -286,10 +879,22 @@ class RADGUI_ENGINE():
             Attributes["DEPRESS"] = bool(Command["DEPRESS"])
         if "ICON_VALUE" in Command:
             Attributes["ICON_VALUE"] = int(Command["ICON_VALUE"])
+        if "CUSTOM_ICON" in Command:
+            Attributes["CUSTOM_ICON"] = str(Command["CUSTOM_ICON"]).strip()
         if "EVENT_ID" in Command:
             if str(Command["EVENT_ID"]).strip() != "":
                 Attributes["EVENT_ID"] = str(Command["EVENT_ID"]).strip()
 
+        return Attributes
+
+    @classmethod
+    def WriteOperator(cls,Context,Command: Dict[str, Any] = {}) -> None:
+
+        Attributes: Dict[str, Any] = cls.ParseOperator(Command)
+
+        if (Attributes == {}):
+            return
+
         CurrentAction = Context.operator(
             Attributes["CLASS"],
             text = Attributes["TEXT"],
@@ -298,17 +903,18 @@ class RADGUI_ENGINE():
             icon = Attributes["ICON"],
             emboss = Attributes["EMBOSS"],
             depress = Attributes["DEPRESS"],
-            icon_value = Attributes["ICON_VALUE"]
+            icon_value = cls.IconValue(Attributes)
             )
 
         if (Attributes["EVENT_ID"] != ""):
             CurrentAction.EventID = Attributes["EVENT_ID"]
 
+    #Resolves a PROPERTY instruction into its final attributes, VARIABLE becomes [SCOPE,DOMAIN,VARIABLE]
     @classmethod
-    def WriteProperty(cls,ContextObject,ContextEnvironment,Command: Dict[str, Any] = {}) -> None:
+    def ParseProperty(cls,Command: Dict[str, Any] = {}) -> Dict[str, Any]:
         
         #Console Filter
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_ENGINE":2}
+        cls.Console.WriteTags = {"RADGUI_ENGINE":2}
 
         #Define Property Defaults
         Attributes: Dict[str, Any] = {
@@ -327,24 +933,25 @@ class RADGUI_ENGINE():
             "EMBOSS":True,
             "INDEX":-1,
             "ICON_VALUE":0,
+            "CUSTOM_ICON":"",
             "INVERT_CHECKBOX":False
         }
 
         #Required Attribute - Variable
         if "VARIABLE" not in Command:
-            RADGUI_CONSOLE.Write("(PROPERTY) Required Attribute Missing: \"VARIABLE\"")
-            return
+            cls.Console.Write("(PROPERTY) Required Attribute Missing: \"VARIABLE\"")
+            return {}
         elif str(Command["VARIABLE"]).strip() == "" :
-            RADGUI_CONSOLE.Write("(PROPERTY) Required Attribute \"VARIABLE\" is Blank")
-            return
+            cls.Console.Write("(PROPERTY) Required Attribute \"VARIABLE\" is Blank")
+            return {}
         else:
-            RADGUI_CONSOLE.Write('(PROPERTY) Variable = \"'+str(Command["VARIABLE"])+'\"')
+            cls.Console.Write('(PROPERTY) Variable = \"'+str(Command["VARIABLE"])+'\"')
             #Get the scope, domain, and variable
             Attributes["VARIABLE"] = str(Command["VARIABLE"]).strip().split(".")
             #We need to be sure at least a variable and domain were defined
             if (len(Attributes["VARIABLE"]) != 2) and (len(Attributes["VARIABLE"]) != 3):
-                RADGUI_CONSOLE.Write("(PROPERTY) Required Attribute \"VARIABLE\" needs to be of format \'[SCOPE.]DOMAIN.VARIABLE\'")
-                return
+                cls.Console.Write("(PROPERTY) Required Attribute \"VARIABLE\" needs to be of format \'[SCOPE.]DOMAIN.VARIABLE\'")
+                return {}
             #Default Scope will be "SCENE"
             elif len(Attributes["VARIABLE"]) == 2:
                 Attributes["VARIABLE"].insert(0,"SCENE")
@@ -352,24 +959,9 @@ class RADGUI_ENGINE():
             else:
                 Attributes["VARIABLE"][0] = str(Attributes["VARIABLE"][0]).upper()
 
-            #Given SCOPE.DOMAIN.VARIABLE , verify domain exists in scope
-            if (Attributes["VARIABLE"][0] == "SCENE"):
-                if (hasattr(bpy.types.Scene,Attributes["VARIABLE"][1]) == False):
-                    RADGUI_CONSOLE.Write("(PROPERTY) The Domain \""+Attributes["VARIABLE"][1]+"\" in Required Attribute \"VARIABLE\" is not Present in the scene scope")
-                    return
-                else:
-                    Attributes["DATA"] = getattr(ContextEnvironment.scene,Attributes["VARIABLE"][1])
-
-            elif (Attributes["VARIABLE"][0] == "OBJECT"):
-                if (hasattr(bpy.types.Object,Attributes["VARIABLE"][1]) == False):
-                    RADGUI_CONSOLE.Write("(PROPERTY) The Domain \""+Attributes["VARIABLE"][1]+"\" in Required Attribute \"VARIABLE\" is not Present in the object scope")
-                    return
-                else:
-                    Attributes["DATA"] = getattr(ContextEnvironment.object,Attributes["VARIABLE"][1])
-
-            else:
-                RADGUI_CONSOLE.Write("(PROPERTY) Required Attribute \"VARIABLE\" uses an unknown scope \""+Attributes["VARIABLE"][0]+"\"")
-                return
+            if (Attributes["VARIABLE"][0] != "SCENE") and (Attributes["VARIABLE"][0] != "OBJECT"):
+                cls.Console.Write("(PROPERTY) Required Attribute \"VARIABLE\" uses an unknown scope \""+Attributes["VARIABLE"][0]+"\"")
+                return {}
 
             #Fill out variables if defined
             if "TEXT" in Command:
@@ -401,33 +993,61 @@ class RADGUI_ENGINE():
                 Attributes["INDEX"] = int(Command["INDEX"])
             if "ICON_VALUE" in Command:
                 Attributes["ICON_VALUE"] = int(Command["ICON_VALUE"])
+            if "CUSTOM_ICON" in Command:
+                Attributes["CUSTOM_ICON"] = str(Command["CUSTOM_ICON"]).strip()
             if "INVERT_CHECKBOX" in Command:
                 Attributes["INVERT_CHECKBOX"] = bool(Command["INVERT_CHECKBOX"])
 
-            ContextObject.prop(
-                Attributes["DATA"],
-                Attributes["VARIABLE"][2],
-                text = Attributes["TEXT"],
-                text_ctxt = Attributes["TEXT_CTXT"],
-                translate = Attributes["TRANSLATE"],
-                icon = Attributes["ICON"],
-                expand = Attributes["EXPAND"],
-                slider = Attributes["SLIDER"],
-                toggle = Attributes["TOGGLE"],
-                icon_only = Attributes["ICON_ONLY"],
-                event = Attributes["EVENT"],
-                full_event = Attributes["FULL_EVENT"],
-                emboss = Attributes["EMBOSS"],
-                index = Attributes["INDEX"],
-                icon_value = Attributes["ICON_VALUE"],
-                invert_checkbox = Attributes["INVERT_CHECKBOX"]
-            )
+        return Attributes
+
+    @classmethod
+    def WriteProperty(cls,ContextObject,ContextEnvironment,Command: Dict[str, Any] = {}) -> None:
+
+        Attributes: Dict[str, Any] = cls.ParseProperty(Command)
+
+        if (Attributes == {}):
+            return
+
+        #Given SCOPE.DOMAIN.VARIABLE , verify domain exists in scope
+        if (Attributes["VARIABLE"][0] == "SCENE"):
+            if (hasattr(bpy.types.Scene,Attributes["VARIABLE"][1]) == False):
+                cls.Console.Write("(PROPERTY) The Domain \""+Attributes["VARIABLE"][1]+"\" in Required Attribute \"VARIABLE\" is not Present in the scene scope")
+                return
+            else:
+                Attributes["DATA"] = getattr(ContextEnvironment.scene,Attributes["VARIABLE"][1])
+
+        elif (Attributes["VARIABLE"][0] == "OBJECT"):
+            if (hasattr(bpy.types.Object,Attributes["VARIABLE"][1]) == False):
+                cls.Console.Write("(PROPERTY) The Domain \""+Attributes["VARIABLE"][1]+"\" in Required Attribute \"VARIABLE\" is not Present in the object scope")
+                return
+            else:
+                Attributes["DATA"] = RADGUI_SPARSE_VIEW.Drawable(getattr(ContextEnvironment.object,Attributes["VARIABLE"][1]))
+
+        ContextObject.prop(
+            Attributes["DATA"],
+            Attributes["VARIABLE"][2],
+            text = Attributes["TEXT"],
+            text_ctxt = Attributes["TEXT_CTXT"],
+            translate = Attributes["TRANSLATE"],
+            icon = Attributes["ICON"],
+            expand = Attributes["EXPAND"],
+            slider = Attributes["SLIDER"],
+            toggle = Attributes["TOGGLE"],
+            icon_only = Attributes["ICON_ONLY"],
+            event = Attributes["EVENT"],
+            full_event = Attributes["FULL_EVENT"],
+            emboss = Attributes["EMBOSS"],
+            index = Attributes["INDEX"],
+            icon_value = cls.IconValue(Attributes),
+            invert_checkbox = Attributes["INVERT_CHECKBOX"]
+        )
 
+    #Resolves a LABEL instruction into its final attributes, empty if it can't be drawn
     @classmethod
-    def WriteLabel(cls,Context,Command: Dict[str, Any] = {}) -> None:
+    def ParseLabel(cls,Command: Dict[str, Any] = {}) -> Dict[str, Any]:
 
         #Console Filter
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_ENGINE":2}
+        cls.Console.WriteTags = {"RADGUI_ENGINE":2}
 
         #Define Label Defaults
         Attributes: Dict[str,Any] = {
@@ -435,18 +1055,20 @@ class RADGUI_ENGINE():
             "TEXT_CTXT":"",
             "TRANSLATE":True,
             "ICON":"NONE",
-            "ICON_VALUE":0
+            "ICON_VALUE":0,
+            "CUSTOM_ICON":"",
+            "WRAP":False
         }
 
         #Required Attribute - Text
         if "TEXT" not in Command:
-            RADGUI_CONSOLE.Write("(LABEL) Required Attribute Missing: \"TEXT\"")
-            return
+            cls.Console.Write("(LABEL) Required Attribute Missing: \"TEXT\"")
+            return {}
         elif str(Command["TEXT"]).strip() == "":
-            RADGUI_CONSOLE.Write("(LABEL) Required Attribute - \"TEXT\" is blank")
-            return
+            cls.Console.Write("(LABEL) Required Attribute - \"TEXT\" is blank")
+            return {}
         else:
-            Attributes["TEXT"] = str(Command["TEXT"]).lower()
+            Attributes["TEXT"] = str(Command["TEXT"])
 
         if "TEXT_CTXT" in Command:
             if str(Command["TEXT_CTXT"]).strip() != "":
@@ -458,41 +1080,308 @@ class RADGUI_ENGINE():
                 Attributes["ICON"] = str(Command["ICON"]).strip().upper()
         if "ICON_VALUE" in Command:
             Attributes["ICON_VALUE"] = int(Command["ICON_VALUE"])
+        if "CUSTOM_ICON" in Command:
+            Attributes["CUSTOM_ICON"] = str(Command["CUSTOM_ICON"]).strip()
+        if "WRAP" in Command:
+            Attributes["WRAP"] = bool(Command["WRAP"])
 
-        Context.label(
-            text = Attributes["TEXT"],
-            text_ctxt = Attributes["TEXT_CTXT"],
-            translate = Attributes["TRANSLATE"],
-            icon = Attributes["ICON"],
-            icon_value = Attributes["ICON_VALUE"]
-            )
+        return Attributes
 
-#==================================================#
-#RAD GUI Factory
-#==================================================#
+    #Breaks text into lines that fit Width pixels, keeping the text's own line breaks
+    @classmethod
+    def WrapText(cls,Text: str,Width: int,Scale: float = 1.0) -> Tuple[str, ...]:
 
-class RADGUI_FACTORY():
-    JSONContent: Dict[str,Any] = {}
-    DynamicClasses: List[Any] = []
-    ManualClasses: List[Any] = []
+        Key: Any = (Text,int(Width) // cls.WidthBucket,round(Scale,2))
+        Columns: int = 0
+        Lines: List[str] = []
+        Paragraph: str = ""
 
-    @classmethod
-    def BuildProperties(cls,Input: Dict[str,Any]) -> Any:
+        if (Key in cls.LabelCache):
+            cls.LabelCache.move_to_end(Key)
+            return cls.LabelCache[Key]
 
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_FACTORY":2}
+        #Measure against the bottom of the bucket, so every width in it gets lines that fit
+        Columns = max(1,int((Key[1] * cls.WidthBucket) / (cls.CharacterWidth * max(Key[2],0.1))))
 
-        Result: Any = None
-        Attributes: Dict[str, Any] = {}
-        ClassName: str = "PROPERTIES_" + str(len(cls.DynamicClasses)) + "_DYNAMIC"
+        for Paragraph in Text.split("\n"):
+            Lines.extend(textwrap.wrap(Paragraph,Columns) or [""])
+
+        cls.LabelCache[Key] = tuple(Lines)
+        if (len(cls.LabelCache) > cls.LabelCacheSize):
+            cls.LabelCache.popitem(last=False)
+
+        return cls.LabelCache[Key]
+
+    #A LABEL with WRAP - one label per line, as wide as the region it is drawn in
+    @classmethod
+    def WriteWrappedLabel(cls,ContextObject,ContextEnvironment,Attributes: Dict[str, Any] = {}) -> None:
+
+        Text: str = Attributes["TEXT"]
+        Width: int = 300
+        Scale: float = 1.0
+        Column: Any = None
+        LineIndex: int = 0
+        Line: str = ""
+
+        try:
+            Width = ContextEnvironment.region.width
+            Scale = ContextEnvironment.preferences.system.ui_scale
+        except:
+            pass
+
+        #Translate the whole text before breaking it, the pieces wouldn't be found in a translation
+        if (Attributes["TRANSLATE"] == True):
+            Text = bpy.app.translations.pgettext_iface(Text,Attributes["TEXT_CTXT"] if Attributes["TEXT_CTXT"] != "" else None)
+
+        Column = ContextObject.column(align=True)
+        for LineIndex, Line in enumerate(cls.WrapText(Text,Width,Scale)):
+            Column.label(
+                text = Line,
+                translate = False,
+                icon = Attributes["ICON"] if LineIndex == 0 else "NONE",
+                icon_value = cls.IconValue(Attributes) if LineIndex == 0 else 0
+                )
+
+    @classmethod
+    def WriteLabel(cls,Context,Command: Dict[str, Any] = {},ContextEnvironment: Any = None) -> None:
+
+        Attributes: Dict[str, Any] = cls.ParseLabel(Command)
+
+        if (Attributes == {}):
+            return
+
+        if (Attributes["WRAP"] == True):
+            cls.WriteWrappedLabel(Context,ContextEnvironment if ContextEnvironment != None else bpy.context,Attributes)
+            return
+
+        Context.label(
+            text = Attributes["TEXT"],
+            text_ctxt = Attributes["TEXT_CTXT"],
+            translate = Attributes["TRANSLATE"],
+            icon = Attributes["ICON"],
+            icon_value = cls.IconValue(Attributes)
+            )
+
+#==================================================#
+#RAD GUI Factory
+#==================================================#
+
+class RADGUI_FACTORY():
+    JSONContent: Dict[str,Any] = {}
+    DynamicClasses: List[Any] = []
+    ManualClasses: List[Any] = []
+    #COMPONENT definitions by name, and their expanded instructions by (name, parameters)
+    Components: Dict[str,Any] = {}
+    ComponentCache: Dict[Any,List[Any]] = {}
+    #Problems found by the last LoadBundle
+    LoadErrors: List[str] = []
+    #What each Build method insists on, so a bundle can be checked before anything gets built
+    Required: Dict[str, List[str]] = {
+        "PROPERTIES":["DOMAIN","CONTENT"],
+        "OPERATOR":["TEXT","CLASS","DOMAIN"],
+        "PANEL":["SPACE","REGION","CONTENT"]
+    }
+    #Folder of the loaded definitions, relative paths in the config start here
+    BasePath: str = ""
+    #In front of every generated class name. Panels are registered under their class name,
+    #so two apps building "PANEL_PT_0_DYNAMIC" would replace each other
+    Prefix: str = ""
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_FACTORY",(cls,),dict(Links,JSONContent={},DynamicClasses=[],ManualClasses=[],Components={},ComponentCache={},LoadErrors=[],BasePath="",Prefix=cls.MakePrefix(Name)))
+
+    #"My Addon" -> "MY_ADDON_", safe to put in front of a Blender class name
+    @staticmethod
+    def MakePrefix(Name: str) -> str:
+        if (Name.strip() == ""):
+            return ""
+        return "".join(x if x.isalnum() else "_" for x in Name.strip()).upper() + "_"
+
+    #Generated classes carry the instance they belong to, so their events stay inside it
+    @classmethod
+    def Bind(cls,Attributes: Dict[str,Any]) -> Dict[str,Any]:
+        Attributes["EventManager"] = cls.EventManager
+        Attributes["Console"] = cls.Console
+        Attributes["Engine"] = cls.Engine
+        Attributes["EnumCache"] = cls.EnumCache
+        Attributes["Computed"] = cls.Computed
+        Attributes["Sparse"] = cls.Sparse
+        Attributes["Profiler"] = cls.Profiler
+        Attributes["Aggregator"] = cls.Aggregator
+        return Attributes
+
+    #Parameter defaults for a property type, overridden by whatever the JSON defines
+    @classmethod
+    def PropertyParams(cls,CurrentType: str,Input: Dict[str,Any]) -> Dict[str,Any]:
+
+        Params: Dict[str,Any] = {}
+        ParamsIndex: str = ""
+
+        #Set Parameter Defaults
+        if (CurrentType == "STRING"):
+            Params = {
+                "DEFAULT":"",
+                "LENGTH_MAX":0,
+                "DESCRIPTION":"",
+                "TEXT":""
+            }
+
+        elif (CurrentType == "INTEGER"):
+            Params = {
+                "DEFAULT":0,
+                "HARD_MIN":-2147483648,
+                "HARD_MAX":2147483647,
+                "SOFT_MIN":-2147483648,
+                "SOFT_MAX":2147483647,
+                "STEP":1,
+                "DESCRIPTION":"",
+                "TEXT":""
+            }
+
+        elif (CurrentType == "FLOAT"):
+            Params = {
+                "DEFAULT":0.0,
+                "HARD_MIN":-3.402823e38,
+                "HARD_MAX":3.402823e38,
+                "SOFT_MIN":-3.402823e38,
+                "SOFT_MAX":3.402823e38,
+                "STEP":3,
+                "PRECISION":2,
+                "DESCRIPTION":"",
+                "TEXT":""
+            }
+
+        elif (CurrentType == "BOOL") or (CurrentType == "BOOLEAN"):
+            Params = {
+                "DEFAULT":False,
+                "DESCRIPTION":"",
+                "TEXT":""
+            }
+
+        #ITEMS for a fixed list, ITEMS_HANDLER ("module.Class.method") for a cached dynamic one
+        elif (CurrentType == "ENUM"):
+            Params = {
+                "DEFAULT":None,
+                "ITEMS":[],
+                "ITEMS_HANDLER":"",
+                "DEPENDS":[],
+                "TTL":0.0,
+                "DESCRIPTION":"",
+                "TEXT":"",
+                "NAME":""
+            }
+
+        #COMPUTED - stored as VALUE_TYPE (FLOAT), written by HANDLER whenever one of its INPUTS changes
+        elif (CurrentType == "COMPUTED"):
+            if (str(Input.get("VALUE_TYPE","FLOAT")).upper() == "COMPUTED"):
+                return Params
+
+            Params = cls.PropertyParams(str(Input.get("VALUE_TYPE","FLOAT")).upper(),Input)
+            if (Params == {}):
+                return Params
+
+            Params["VALUE_TYPE"] = str(Input.get("VALUE_TYPE","FLOAT")).upper()
+            Params["INPUTS"] = list(Input.get("INPUTS",[]))
+            Params["HANDLER"] = str(Input.get("HANDLER","")).strip()
+            return Params
+        
+        else:
+            return Params
+
+        #Override Params Dictionary
+        for ParamsIndex in Params:
+            if (ParamsIndex in Input):
+                Params[ParamsIndex] = Input[ParamsIndex]
+
+        return Params
+
+    #Which bpy.props function a property type uses, and the arguments it gets
+    @classmethod
+    def PropertyArguments(cls,CurrentType: str,Params: Dict[str,Any]) -> Any:
+
+        if (CurrentType == "STRING"):
+            return "StringProperty", {
+                "name":Params["TEXT"],
+                "description":Params["DESCRIPTION"],
+                "default":Params["DEFAULT"],
+                "maxlen":Params["LENGTH_MAX"]
+            }
+
+        elif (CurrentType == "INTEGER"):
+            return "IntProperty", {
+                "name":Params["TEXT"],
+                "description":Params["DESCRIPTION"],
+                "default":Params["DEFAULT"],
+                "min":Params["SOFT_MIN"],
+                "max":Params["HARD_MAX"],
+                "soft_min":Params["SOFT_MIN"],
+                "soft_max":Params["SOFT_MAX"],
+                "step":Params["STEP"]
+            }
+
+        elif (CurrentType == "FLOAT"):
+            return "FloatProperty", {
+                "name":Params["TEXT"],
+                "description":Params["DESCRIPTION"],
+                "default":Params["DEFAULT"],
+                "min":Params["HARD_MIN"],
+                "max":Params["HARD_MAX"],
+                "soft_min":Params["SOFT_MIN"],
+                "soft_max":Params["SOFT_MAX"],
+                "step":Params["STEP"],
+                "precision":Params["PRECISION"]
+            }
+
+        elif (CurrentType == "BOOL") or (CurrentType == "BOOLEAN"):
+            return "BoolProperty", {
+                "name":Params["TEXT"],
+                "description":Params["DESCRIPTION"],
+                "default":Params["DEFAULT"]
+            }
+
+        elif (CurrentType == "ENUM"):
+            Arguments: Dict[str,Any] = {
+                "name":Params["TEXT"],
+                "description":Params["DESCRIPTION"]
+            }
+
+            if (str(Params["ITEMS_HANDLER"]).strip() != ""):
+                Arguments["items"] = RADGUI_ENUM_CACHE.Callback(Params["NAME"],str(Params["ITEMS_HANDLER"]).strip(),list(Params["DEPENDS"]),float(Params["TTL"]))
+                #Blender only takes an index as the default of a dynamic enum
+                if isinstance(Params["DEFAULT"],int):
+                    Arguments["default"] = Params["DEFAULT"]
+            else:
+                Arguments["items"] = RADGUI_ENUM_CACHE.NormalizeItems(Params["ITEMS"])
+                if (Params["DEFAULT"] != None):
+                    Arguments["default"] = Params["DEFAULT"]
+
+            return "EnumProperty", Arguments
+
+        elif (CurrentType == "COMPUTED"):
+            return cls.PropertyArguments(Params["VALUE_TYPE"],Params)
+
+        return "", {}
+
+    @classmethod
+    def BuildProperties(cls,Input: Dict[str,Any]) -> Any:
+
+        cls.Console.WriteTags = {"RADGUI_FACTORY":2}
+
+        Result: Any = None
+        Attributes: Dict[str, Any] = {}
+        ClassName: str = cls.Prefix + "PROPERTIES_" + str(len(cls.DynamicClasses)) + "_DYNAMIC"
         Scope: str = ""
         CurrentName: str = ""
         CurrentType: str = ""
         Params: Dict[str,Any] = {}
         ContentIndex: Dict[str, Any] = {}
-        ParamsIndex: str = ""
+        PropertyType: str = ""
+        Arguments: Dict[str,Any] = {}
 
-        RADGUI_CONSOLE.Write("Building Properties-")
-        RADGUI_CONSOLE.Write(str(Input))
+        cls.Console.Write("Building Properties-")
+        cls.Console.Write(str(Input))
 
         #To-Do: Build Class Attributes
         #If it doesnt have a type, domain, and content it's not a property group
@@ -512,150 +1401,78 @@ class RADGUI_FACTORY():
 
         #Properties are defined through annotations rather than declarations
         Attributes["__annotations__"] = {}
+        Attributes["ComputedNodes"] = []
 
         #Domain - Where these properties can be found
         Attributes["Domain"] = Input["DOMAIN"]
 
-        #SCOPE - OBJECT / (SCENE)
+        #SCOPE - OBJECT / SPARSE (objects, but only those that differ from the defaults store anything) / (SCENE)
         if ("SCOPE" in Input):
             Scope = str(Input["SCOPE"]).upper()
-            if(Scope == "OBJECT") or (Scope == "SCENE"):
+            if (Scope == "SPARSE_OBJECT"):
+                Scope = "SPARSE"
+            if(Scope == "OBJECT") or (Scope == "SCENE") or (Scope == "SPARSE"):
                 Attributes["Scope"] = Scope
 
+        #AGGREGATE - Same-tick changes across objects are raised as one VARIABLE_MULTI_CHANGED
+        if ("AGGREGATE" in Input):
+            Attributes["Aggregate"] = bool(Input["AGGREGATE"])
+
+        #Sparse entries live in a side table, each needs to know its object
+        if (Attributes.get("Scope","") == "SPARSE"):
+            Attributes["__annotations__"]["RADGUI_OWNER"] = PointerProperty(type=bpy.types.Object)
+
         #Loop through each property
         for ContentIndex in Input["CONTENT"]:
 
-            RADGUI_CONSOLE.Write("Index - value=\""+str(ContentIndex)+"\" type=\""+str(type(ContentIndex))+"\"")
+            cls.Console.Write("Index - value=\""+str(ContentIndex)+"\" type=\""+str(type(ContentIndex))+"\"")
 
             #We add only variables with a name and a type
             if("NAME" not in ContentIndex) or ("TYPE" not in ContentIndex):
-                RADGUI_CONSOLE.Write("Left without Name or Type")
+                cls.Console.Write("Left without Name or Type")
                 continue
             #And no, it cant be empty
             elif (ContentIndex["NAME"].strip() == "") or (ContentIndex["TYPE"].strip() == ""):
-                RADGUI_CONSOLE.Write("Left because Name or Type is empty")
+                cls.Console.Write("Left because Name or Type is empty")
                 continue
 
             CurrentName = ContentIndex["NAME"]
             CurrentType = ContentIndex["TYPE"].upper()
-            Params.clear()
-
-            #Set Parameter Defaults
-            if (CurrentType == "STRING"):
-                Params = {
-                    "DEFAULT":"",
-                    "LENGTH_MAX":0,
-                    "DESCRIPTION":"",
-                    "TEXT":""
-                }
-
-            elif (CurrentType == "INTEGER"):
-                Params = {
-                    "DEFAULT":0,
-                    "HARD_MIN":-2147483648,
-                    "HARD_MAX":2147483647,
-                    "SOFT_MIN":-2147483648,
-                    "SOFT_MAX":2147483647,
-                    "STEP":1,
-                    "DESCRIPTION":"",
-                    "TEXT":""
-                }
+            Params = cls.PropertyParams(CurrentType,ContentIndex)
 
-            elif (CurrentType == "FLOAT"):
-                Params = {
-                    "DEFAULT":0.0,
-                    "HARD_MIN":-3.402823e38,
-                    "HARD_MAX":3.402823e38,
-                    "SOFT_MIN":-3.402823e38,
-                    "SOFT_MAX":3.402823e38,
-                    "STEP":3,
-                    "PRECISION":2,
-                    "DESCRIPTION":"",
-                    "TEXT":""
-                }
-
-            elif (CurrentType == "BOOL") or (CurrentType == "BOOLEAN"):
-                Params = {
-                    "DEFAULT":False,
-                    "DESCRIPTION":"",
-                    "TEXT":""
-                }
-            
-            else:
+            #Unknown property types are left out
+            if (Params == {}):
                 continue
 
-            #Override Params Dictionary
-            for ParamsIndex in Params:
-                if (ParamsIndex in ContentIndex):
-                    Params[ParamsIndex] = ContentIndex[ParamsIndex]
-
             #Annotate the current property based on the type again
-            if (CurrentType == "STRING"):
-                RADGUI_CONSOLE.Write("Adding a String")
-                Attributes["__annotations__"][CurrentName] = StringProperty(
-                    name= Params["TEXT"],
-                    description=Params["DESCRIPTION"],
-                    default=Params["DEFAULT"],
-                    maxlen=Params["LENGTH_MAX"],
-                    update=eval("lambda Part1,Part2: RADGUI_PROPERTYGROUP_SHELL.PropertyUpdate(Part1,Part2,'"+CurrentName+"')")
-                )
+            PropertyType, Arguments = cls.PropertyArguments(CurrentType,Params)
+            cls.Console.Write("Adding a " + PropertyType)
+            Attributes["__annotations__"][CurrentName] = getattr(bpy.props,PropertyType)(
+                update=eval("lambda Part1,Part2: RADGUI_PROPERTYGROUP_SHELL.PropertyUpdate(Part1,Part2,'"+CurrentName+"')"),
+                **Arguments
+            )
 
-            elif (CurrentType == "INTEGER"):
-                RADGUI_CONSOLE.Write("Adding an Integer")
-                Attributes["__annotations__"][CurrentName] = IntProperty(
-                    name= Params["TEXT"],
-                    description=Params["DESCRIPTION"],
-                    default=Params["DEFAULT"],
-                    min=Params["SOFT_MIN"],
-                    max=Params["HARD_MAX"],
-                    soft_min=Params["SOFT_MIN"],
-                    soft_max=Params["SOFT_MAX"],
-                    step= Params["STEP"],
-                    update=eval("lambda Part1,Part2: RADGUI_PROPERTYGROUP_SHELL.PropertyUpdate(Part1,Part2,'"+CurrentName+"')")
-                )
-                
-            elif (CurrentType == "FLOAT"):
-                RADGUI_CONSOLE.Write("Adding a Float")
-                Attributes["__annotations__"][CurrentName] = FloatProperty(
-                    name=Params["TEXT"],
-                    description=Params["DESCRIPTION"],
-                    default=Params["DEFAULT"],
-                    min=Params["HARD_MIN"],
-                    max=Params["HARD_MAX"],
-                    soft_min=Params["SOFT_MIN"],
-                    soft_max=Params["SOFT_MAX"],
-                    step=Params["STEP"],
-                    precision=Params["PRECISION"],
-                    update=eval("lambda Part1,Part2: RADGUI_PROPERTYGROUP_SHELL.PropertyUpdate(Part1,Part2,'"+CurrentName+"')")
-                )
-                
-            elif (CurrentType == "BOOL") or (CurrentType == "BOOLEAN"):
-                RADGUI_CONSOLE.Write("Adding a Boolean")
-                Attributes["__annotations__"][CurrentName] = BoolProperty(
-                    name=Params["TEXT"],
-                    description=Params["DESCRIPTION"],
-                    default= Params["DEFAULT"],
-                    update=eval("lambda Part1,Part2: RADGUI_PROPERTYGROUP_SHELL.PropertyUpdate(Part1,Part2,'"+CurrentName+"')")
-                )
+            if (CurrentType == "COMPUTED"):
+                Attributes["ComputedNodes"].append([CurrentName,Params["INPUTS"],Params["HANDLER"]])
 
-            RADGUI_CONSOLE.Write("Registering Properties Group with the following attributes:")
-            RADGUI_CONSOLE.Write(str(Attributes))
+            cls.Console.Write("Registering Properties Group with the following attributes:")
+            cls.Console.Write(str(Attributes))
 
-            Result = type(ClassName,(RADGUI_PROPERTYGROUP_SHELL,),Attributes)
+            Result = type(ClassName,(RADGUI_PROPERTYGROUP_SHELL,),cls.Bind(Attributes))
 
         return Result
 
     @classmethod
     def BuildOperator(cls,Input: Dict[str,Any]) -> Any:
 
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_FACTORY":2}
+        cls.Console.WriteTags = {"RADGUI_FACTORY":2}
 
         Result: Any = None
         Attributes: Dict[str,Any] = {}
-        ClassName: str = "OPERATOR_OT_" + str(len(cls.DynamicClasses)) + "_DYNAMIC"
+        ClassName: str = cls.Prefix + "OPERATOR_OT_" + str(len(cls.DynamicClasses)) + "_DYNAMIC"
 
-        RADGUI_CONSOLE.Write("Building Operator-")
-        RADGUI_CONSOLE.Write(str(Input))
+        cls.Console.Write("Building Operator-")
+        cls.Console.Write(str(Input))
 
         #To-Do: Build Class Attributes
         #If it doesnt have a type, text, class, and domain, it's not an operator
@@ -677,20 +1494,32 @@ class RADGUI_FACTORY():
         Attributes["__annotations__"] = {}
         Attributes["__annotations__"]["EventID"] = StringProperty(name= "Event_ID")
 
-        Result = type(ClassName,(RADGUI_OPERATOR_SHELL,),Attributes)
+        #MODE - (NORMAL) / BATCH, a batch operator works through ITEMS chunk by chunk without freezing the UI
+        if ("MODE" in Input) and (str(Input["MODE"]).upper() == "BATCH"):
+            if ("ITEMS" in Input):
+                Attributes["ItemSource"] = str(Input["ITEMS"]).upper()
+            if ("CHUNK_SIZE" in Input):
+                Attributes["ChunkSize"] = int(Input["CHUNK_SIZE"])
+            if ("TIME_BUDGET" in Input):
+                Attributes["TimeBudget"] = float(Input["TIME_BUDGET"])
+
+            Result = type(ClassName,(RADGUI_BATCH_OPERATOR_SHELL,),cls.Bind(Attributes))
+            return Result
+
+        Result = type(ClassName,(RADGUI_OPERATOR_SHELL,),cls.Bind(Attributes))
         return Result
 
     @classmethod
     def BuildPanel(cls,Input: Dict[str,Any]) -> Any:
 
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_FACTORY":2}
+        cls.Console.WriteTags = {"RADGUI_FACTORY":2}
 
         Result: Any = None
         Attributes: Dict[str,Any] = {}
-        ClassName: str = "PANEL_PT_"+ str(len(cls.DynamicClasses)) + "_DYNAMIC"
+        ClassName: str = cls.Prefix + "PANEL_PT_"+ str(len(cls.DynamicClasses)) + "_DYNAMIC"
 
-        RADGUI_CONSOLE.Write("Building PANEL-")
-        RADGUI_CONSOLE.Write(str(Input))
+        cls.Console.Write("Building PANEL-")
+        cls.Console.Write(str(Input))
 
         #To-Do: Build Class Attributes
         #If it doesnt have a Type, Space, Region, and Content, it's not a panel
@@ -709,7 +1538,7 @@ class RADGUI_FACTORY():
         #Now that we're here, lets build the panel attributes
         Attributes["bl_space_type"] = Input["SPACE"]
         Attributes["bl_region_type"] = Input["REGION"]
-        Attributes["Content"] = Input["CONTENT"]
+        Attributes["Content"] = cls.ExpandComponents(Input["CONTENT"])
 
         #Does it have a label? If not, a blank quote will do
         if ("LABEL" in Input):
@@ -717,13 +1546,130 @@ class RADGUI_FACTORY():
         else:
             Attributes["bl_label"] = ""
 
-        Result = type(ClassName,(RADGUI_PANEL_SHELL,),Attributes)
+        Result = type(ClassName,(RADGUI_PANEL_SHELL,),cls.Bind(Attributes))
+        return Result
+
+    #Collects the COMPONENT definitions so panels can use them no matter where they appear in the file
+    #
+    #   "NAME":{"TYPE":"COMPONENT","PARAMS":{"DOMAIN":"MyDom"},"CONTENT":[...,{"TYPE":"PROPERTY","VARIABLE":"{DOMAIN}.width"}]}
+    #
+    #A panel then uses it as an instruction - {"TYPE":"COMPONENT","NAME":"NAME","PARAMS":{"DOMAIN":"OtherDom"}}
+    @classmethod
+    def LoadComponents(cls,JSONContent: Dict[str,Any]) -> None:
+
+        ContentIndex: str = ""
+        CurrentEntry: Dict[str,Any] = {}
+
+        cls.Components = {}
+        cls.ComponentCache = {}
+
+        for ContentIndex in JSONContent:
+
+            CurrentEntry = JSONContent[ContentIndex]
+
+            if (str(CurrentEntry.get("TYPE","")).upper() != "COMPONENT"):
+                continue
+
+            if (isinstance(CurrentEntry.get("CONTENT",None),list) == False):
+                cls.Console.WriteTags = {"RADGUI_FACTORY":1}
+                cls.Console.Write("(RADGUI_FACTORY) Component \"{}\" has no CONTENT".format(ContentIndex))
+                continue
+
+            cls.Components[str(CurrentEntry.get("NAME",ContentIndex)).upper()] = CurrentEntry
+
+    #Puts the parameters into a component's instructions, "{DOMAIN}" becomes the DOMAIN parameter
+    @classmethod
+    def SubstituteParams(cls,Input: Any,Params: Dict[str,Any]) -> Any:
+
+        Result: Any = Input
+        ParamsIndex: str = ""
+
+        if isinstance(Input,dict):
+            return {Key: cls.SubstituteParams(Value,Params) for Key, Value in Input.items()}
+
+        if isinstance(Input,list):
+            return [cls.SubstituteParams(x,Params) for x in Input]
+
+        if (isinstance(Input,str) == False) or ("{" not in Input):
+            return Input
+
+        for ParamsIndex in Params:
+            #A string that is only the placeholder takes the parameter as is, so booleans and numbers survive
+            if (Input == "{" + ParamsIndex + "}"):
+                return Params[ParamsIndex]
+            Result = Result.replace("{" + ParamsIndex + "}",str(Params[ParamsIndex]))
+
+        return sys.intern(Result)
+
+    #Replaces COMPONENT instructions with the component's content. The expanded instructions are
+    #built once per component and parameters, then shared by every panel that uses them
+    @classmethod
+    def ExpandComponents(cls,Instructions: List[Dict[str,Any]],Stack: List[str] = []) -> List[Dict[str,Any]]:
+
+        Result: List[Dict[str,Any]] = []
+        CurrentInstruction: Dict[str,Any] = {}
+        ComponentName: str = ""
+        Params: Dict[str,Any] = {}
+        CacheKey: Any = None
+
+        for CurrentInstruction in Instructions:
+
+            if (str(CurrentInstruction.get("TYPE","")).upper() != "COMPONENT"):
+                Result.append(CurrentInstruction)
+                continue
+
+            ComponentName = str(CurrentInstruction.get("NAME","")).upper()
+
+            if (ComponentName not in cls.Components):
+                cls.Console.WriteTags = {"RADGUI_FACTORY":1}
+                cls.Console.Write("(RADGUI_FACTORY) Unknown component \"{}\"".format(ComponentName))
+                continue
+
+            if (ComponentName in Stack):
+                cls.Console.WriteTags = {"RADGUI_FACTORY":1}
+                cls.Console.Write("(RADGUI_FACTORY) Component \"{}\" includes itself - {}".format(ComponentName," > ".join(Stack)))
+                continue
+
+            #Parameters given by the panel override the component's defaults
+            Params = dict(cls.Components[ComponentName].get("PARAMS",{}))
+            Params.update(CurrentInstruction.get("PARAMS",{}))
+            CacheKey = (ComponentName,tuple(sorted((Key,repr(Value)) for Key, Value in Params.items())))
+
+            if (CacheKey not in cls.ComponentCache):
+                cls.ComponentCache[CacheKey] = cls.ExpandComponents(
+                    cls.SubstituteParams(cls.Components[ComponentName]["CONTENT"],Params),
+                    Stack + [ComponentName]
+                )
+
+            Result.extend(cls.ComponentCache[CacheKey])
+
         return Result
 
+    #json hook - definitions repeat the same keys, types, contexts and domains over and over, keep one copy of each
+    @classmethod
+    def InternPairs(cls,Pairs: List[Any]) -> Dict[str,Any]:
+        return {sys.intern(Key): cls.InternValue(Value) for Key, Value in Pairs}
+
+    @classmethod
+    def InternValue(cls,Value: Any) -> Any:
+        if isinstance(Value,str):
+            return sys.intern(Value)
+        if isinstance(Value,list):
+            return [cls.InternValue(x) for x in Value]
+        return Value
+
     @classmethod
     def LoadJSON(cls,Input: str = "") -> bool:
 
         Result: bool = False
+        Content: Any = None
+
+        if (Input.strip() != ""):
+            cls.BasePath = os.path.dirname(os.path.abspath(Input))
+
+        #A directory of definitions goes through the bundle loader
+        if (Input.strip() != "") and (os.path.isdir(Input) == True):
+            return cls.LoadBundle(Input)
 
         #We have a filename as an input read and build classes
         if(Input.strip() != ""):
@@ -731,8 +1677,13 @@ class RADGUI_FACTORY():
             try:            
                 #Load the JSON File into memory as a dict array
                 with open(Input,"r") as fileInput:
-                    cls.JSONContent = json.load(fileInput)
+                    Content = json.load(fileInput,object_pairs_hook=cls.InternPairs)
 
+                #So does a manifest listing them
+                if (str(Content.get("TYPE","")).upper() == "MANIFEST"):
+                    return cls.LoadBundle(Input)
+
+                cls.JSONContent = Content
                 Result = True
 
             except:
@@ -740,10 +1691,353 @@ class RADGUI_FACTORY():
             
         return Result
 
+    #Problems Register would silently skip the definition for, empty when there are none
+    @staticmethod
+    def CheckDefinition(Name: str,Definition: Dict[str, Any]) -> List[str]:
+
+        Result: List[str] = []
+        Attribute: str = ""
+        Value: Any = None
+
+        for Attribute in RADGUI_FACTORY.Required.get(str(Definition.get("TYPE","")).upper(),[]):
+            Value = Definition.get(Attribute,None)
+            if (Value == None) or ((isinstance(Value,(list,dict)) == True) and (len(Value) == 0)) or (str(Value).strip() == ""):
+                Result.append("\"{}\" has no {}".format(Name,Attribute))
+
+        return Result
+
+    #Settings of a CONFIG as (path, value) pairs. Associations and icons add up across configs,
+    #everything else replaces what an earlier config set
+    @staticmethod
+    def ConfigSettings(Config: Dict[str, Any]) -> List[Any]:
+
+        Result: List[Any] = []
+        Key: str = ""
+        Name: str = ""
+
+        for Key in Config:
+            if (Key == "TYPE"):
+                continue
+            elif (Key == "ICONS") and (isinstance(Config[Key],dict) == True):
+                Result.extend(((Key,Name),Config[Key][Name]) for Name in Config[Key] if Name != "DIRECTORY")
+            elif (Key == "EVENTS") and (isinstance(Config[Key],dict) == True):
+                for Name in Config[Key]:
+                    if (Name == "ASSOCIATIONS") and (isinstance(Config[Key][Name],dict) == True):
+                        Result.extend(((Key,Name,x),Config[Key][Name][x]) for x in Config[Key][Name])
+                    else:
+                        Result.append(((Key,Name),Config[Key][Name]))
+            else:
+                Result.append(((Key,),Config[Key]))
+
+        return Result
+
+    #Reads and checks one definition file. May run on a worker, so it only touches its own arguments
+    @staticmethod
+    def ParseDefinitionFile(FileName: str) -> List[Any]:
+
+        Content: Any = None
+        Problems: List[str] = []
+        ContentIndex: str = ""
+
+        try:
+            with open(FileName,"r") as fileInput:
+                Content = json.load(fileInput,object_pairs_hook=RADGUI_FACTORY.InternPairs)
+        except Exception as Error:
+            return [FileName,None,["{} - {}".format(FileName,Error)]]
+
+        if (isinstance(Content,dict) == False):
+            return [FileName,None,["{} - expected an object of definitions".format(FileName)]]
+
+        #A manifest sitting in a bundle directory only lists files, it defines nothing itself
+        if (str(Content.get("TYPE","")).upper() == "MANIFEST"):
+            return [FileName,{},[]]
+
+        for ContentIndex in Content:
+            if (isinstance(Content[ContentIndex],dict) == False) or ("TYPE" not in Content[ContentIndex]):
+                Problems.append("{} - \"{}\" has no TYPE".format(FileName,ContentIndex))
+                continue
+            Problems.extend("{} - {}".format(FileName,x) for x in RADGUI_FACTORY.CheckDefinition(ContentIndex,Content[ContentIndex]))
+
+        return [FileName,Content,Problems]
+
+    #The files of a bundle - every .json under a directory in path order, or the FILES of a manifest
+    #
+    #   {"TYPE":"MANIFEST","FILES":["modeling/panels.json","shading/"],"WORKERS":4,"PROCESSES":false}
+    #
+    #Manifest paths are relative to the manifest, and may themselves be directories.
+    #WORKERS / PROCESSES are LoadBundle's Workers / UseProcesses, for loads that don't give them
+    @classmethod
+    def BundleFiles(cls,Input: str) -> List[str]:
+
+        Result: List[str] = []
+        Manifest: Dict[str,Any] = {}
+        FileIndex: str = ""
+        Root: str = ""
+        Files: List[str] = []
+
+        if (os.path.isdir(Input) == True):
+            for Root, _, Files in sorted(os.walk(Input)):
+                Result.extend(os.path.join(Root,x) for x in sorted(Files) if x.lower().endswith(".json"))
+            return Result
+
+        with open(Input,"r") as fileInput:
+            Manifest = json.load(fileInput)
+
+        for FileIndex in Manifest.get("FILES",[]):
+            FileIndex = os.path.join(os.path.dirname(os.path.abspath(Input)),FileIndex)
+            if (os.path.isdir(FileIndex) == True):
+                Result.extend(cls.BundleFiles(FileIndex))
+            else:
+                Result.append(FileIndex)
+
+        return Result
+
+    #Loads many definition files at once. Files are parsed and checked one after the other, then
+    #merged in file order. Nothing is registered - call Register afterwards as usual, on the main thread.
+    #
+    #A key or operator defined by two files is a conflict, and so is a setting two CONFIGs give
+    #different values. Conflicts and bad files (including definitions Register would skip for a
+    #missing attribute) are written to the console and kept in LoadErrors, and JSONContent is left
+    #as it was.
+    #
+    #Parsing holds the GIL, so Workers threads only pay off when the files sit on a slow (network)
+    #disk. UseProcesses parses on that many processes instead - only outside Blender (e.g. the
+    #compiler), inside it they would start new Blenders. Either way the merge doesn't depend on
+    #which worker finished first. Workers = 0 takes both from the manifest, which is how LoadJSON
+    #on a manifest gets a pool.
+    @classmethod
+    def LoadBundle(cls,Input: str,Workers: int = 0,UseProcesses: bool = False) -> bool:
+
+        cls.Console.WriteTags = {"RADGUI_FACTORY":1}
+
+        Files: List[str] = []
+        Parsed: List[Any] = []
+        Merged: Dict[str,Any] = {}
+        Owners: Dict[str,str] = {}
+        Operators: Dict[str,str] = {}
+        Settings: Dict[Any,List[Any]] = {}
+        Errors: List[str] = []
+        Pool: Any = None
+        FileName: str = ""
+        Content: Dict[str,Any] = {}
+        Problems: List[str] = []
+        ContentIndex: str = ""
+        OperatorID: str = ""
+        Setting: Any = None
+        Value: Any = None
+        Manifest: Dict[str,Any] = {}
+
+        cls.BasePath = os.path.abspath(Input) if os.path.isdir(Input) == True else os.path.dirname(os.path.abspath(Input))
+
+        try:
+            if (os.path.isdir(Input) == False) and (Workers == 0):
+                with open(Input,"r") as fileInput:
+                    Manifest = json.load(fileInput)
+                Workers = int(Manifest.get("WORKERS",0))
+                UseProcesses = bool(Manifest.get("PROCESSES",False))
+            Files = cls.BundleFiles(Input)
+        except Exception as Error:
+            Errors.append("{} - {}".format(Input,Error))
+
+        if (len(Files) == 0) and (len(Errors) == 0):
+            Errors.append("{} - no definition files found".format(Input))
+
+        if (len(Errors) == 0) and (Workers > 1) and (len(Files) > 1):
+            Pool = concurrent.futures.ProcessPoolExecutor if UseProcesses == True else concurrent.futures.ThreadPoolExecutor
+            with Pool(max_workers=min(Workers,len(Files))) as Executor:
+                Parsed = list(Executor.map(RADGUI_FACTORY.ParseDefinitionFile,Files))
+        elif (len(Errors) == 0):
+            Parsed = [RADGUI_FACTORY.ParseDefinitionFile(x) for x in Files]
+
+        for FileName, Content, Problems in Parsed:
+
+            Errors.extend(Problems)
+
+            if (Content == None):
+                continue
+
+            for ContentIndex in Content:
+
+                #Already reported by ParseDefinitionFile
+                if (isinstance(Content[ContentIndex],dict) == False) or ("TYPE" not in Content[ContentIndex]):
+                    continue
+
+                if (ContentIndex in Owners):
+                    Errors.append("\"{}\" is defined in both {} and {}".format(ContentIndex,Owners[ContentIndex],FileName))
+                    continue
+
+                #Two files building the same operator would fail at register time, say so now
+                if (str(Content[ContentIndex].get("TYPE","")).upper() == "OPERATOR"):
+                    OperatorID = (str(Content[ContentIndex].get("DOMAIN","")) + "." + str(Content[ContentIndex].get("CLASS",""))).lower()
+                    if (OperatorID in Operators):
+                        Errors.append("Operator \"{}\" is defined in both {} and {}".format(OperatorID,Operators[OperatorID],FileName))
+                        continue
+                    Operators[OperatorID] = FileName
+
+                #Register applies every CONFIG in turn, a setting given twice would quietly go to the last file
+                if (str(Content[ContentIndex].get("TYPE","")).upper() in ("CONFIG","CONFIGURATION","SETTINGS")):
+                    for Setting, Value in cls.ConfigSettings(Content[ContentIndex]):
+                        if (Setting in Settings) and (Settings[Setting][1] != FileName) and (Settings[Setting][0] != Value):
+                            Errors.append("Setting \"{}\" is given different values in {} and {}".format(".".join(Setting),Settings[Setting][1],FileName))
+                        Settings.setdefault(Setting,[Value,FileName])
+
+                Owners[ContentIndex] = FileName
+                Merged[ContentIndex] = Content[ContentIndex]
+
+        cls.LoadErrors = Errors
+
+        if (len(Errors) != 0):
+            cls.Console.Write("(RADGUI_FACTORY.LOADBUNDLE) {} problem(s) loading \"{}\"".format(len(Errors),Input))
+            for ContentIndex in Errors:
+                cls.Console.Write("- " + ContentIndex)
+            return False
+
+        cls.Console.Write("(RADGUI_FACTORY.LOADBUNDLE) Loaded {} definition(s) from {} file(s)".format(len(Merged),len(Files)))
+        cls.JSONContent = Merged
+
+        return True
+
+    #IsRouted - the associations' criteria come from a compiled routing table, only their caches are set up here
+    @classmethod
+    def ApplyConfig(cls,Input: Dict[str,Any],IsRouted: bool = False) -> None:
+
+        cls.Console.WriteTags = {"RADGUI_FACTORY":1}
+        cls.Console.Write("(RADGUI_FACTORY.REGISTER) Setting Configuration")
+
+        #Console config
+        if("CONSOLE_FILTER" in Input):
+            cls.Console.Write("- Console Filter")
+            cls.Lifecycle.TrackSetting(cls.Console,"OutputFilter")
+            cls.Console.OutputFilter = Input["CONSOLE_FILTER"]
+        #Console sinks - [{"TYPE":"PRINT" / "RING" / "FILE", ...}]
+        if("CONSOLE_SINKS" in Input):
+            cls.Console.Write("- Console Sinks")
+            cls.Lifecycle.TrackSetting(cls.Console,"Sinks")
+            Sinks: List[Any] = []
+            for SinkIndex in Input["CONSOLE_SINKS"]:
+                Sink: Any = cls.Console.BuildSink(SinkIndex)
+                if (Sink == None):
+                    cls.Console.Write("-- Unknown sink type \"{}\"".format(SinkIndex.get("TYPE","")))
+                    continue
+                cls.Lifecycle.TrackCleanup(Sink.Close)
+                Sinks.append(Sink)
+            cls.Console.Sinks = Sinks
+        #Console rate limits - {TAG: messages per second}
+        if("CONSOLE_RATE_LIMIT" in Input):
+            cls.Console.Write("- Console Rate Limit")
+            cls.Lifecycle.TrackSetting(cls.Console,"RateLimits")
+            cls.Console.RateLimits = dict(Input["CONSOLE_RATE_LIMIT"])
+            cls.Console.RateState = {}
+        #Event log for later replay
+        if("EVENT_LOG" in Input):
+            cls.Console.Write("- Event Log")
+            cls.EventManager.Recorder.Start(str(Input["EVENT_LOG"]))
+        #Custom icons - {"NAME":"FILE", ...} and / or {"DIRECTORY":"FOLDER"} for every image in a folder
+        if("ICONS" in Input):
+            cls.Console.Write("- Icons")
+            cls.Icons.Configure(Input["ICONS"],cls.BasePath)
+            cls.Lifecycle.TrackCleanup(cls.Icons.Release)
+        #Memory profiling - {"FRAMES":1,"KEEP":10}
+        if("MEMORY_PROFILE" in Input):
+            cls.Console.Write("- Memory Profiler")
+            cls.Profiler.Start(int(Input["MEMORY_PROFILE"].get("FRAMES",1)),int(Input["MEMORY_PROFILE"].get("KEEP",10)))
+            cls.Lifecycle.TrackCleanup(cls.Profiler.Stop)
+        #External event feed - {"ADDRESS":"unix:/tmp/radgui.sock" / "tcp:127.0.0.1:7447","QUEUE_SIZE":10000,"BUDGET":0.005}
+        if("IPC" in Input):
+            cls.Console.Write("- IPC Server")
+            if (cls.EventManager.IPC.Start(str(Input["IPC"].get("ADDRESS","")),int(Input["IPC"].get("QUEUE_SIZE",10000)),float(Input["IPC"].get("BUDGET",0.005))) == True):
+                cls.Lifecycle.TrackCleanup(cls.EventManager.IPC.Stop)
+        #Event Registration
+        if ("EVENTS" in Input):
+            cls.Console.Write("- Event Registration")
+            
+            #Set Strict Mode
+            if "STRICT" in Input["EVENTS"]:
+                cls.Lifecycle.TrackSetting(cls.EventManager,"IsStrict")
+                cls.EventManager.IsStrict = bool(Input["EVENTS"]["STRICT"])
+            
+            #Register Events
+            if "ASSOCIATIONS" in Input["EVENTS"]:
+
+                MethodIndex: str = ""
+
+                for MethodIndex in Input["EVENTS"]["ASSOCIATIONS"]:
+
+                    Association: Any = Input["EVENTS"]["ASSOCIATIONS"][MethodIndex]
+
+                    #A list of criteria, or {"EVENTS":[criteria], "CACHE":{"KEYS":["EVENT_ID","VALUE"],"SIZE":128,"DEPENDS":["DOMAIN.PROPERTY"]}}
+                    #A cached handler is skipped for key values it has seen, see RADGUI_EVENT_MANAGER.SetCache
+                    if (isinstance(Association,dict) == True):
+                        if ("CACHE" in Association):
+                            cls.Lifecycle.TrackCleanup(lambda MethodID=MethodIndex: cls.EventManager.RemoveCache(MethodID))
+                            cls.EventManager.SetCache(
+                                MethodIndex,
+                                Association["CACHE"].get("KEYS",[]),
+                                Association["CACHE"].get("SIZE",128),
+                                Association["CACHE"].get("DEPENDS",["*"])
+                            )
+                        Association = Association.get("EVENTS",[])
+
+                    if (IsRouted == True):
+                        continue
+
+                    cls.Lifecycle.TrackEvent(cls.EventManager,MethodIndex,Association)
+                    cls.EventManager.AddEvent(MethodIndex,Association)
+
+    #Registers classes generated ahead of time by the RADGUI compiler, skipping the JSON path entirely
+    #Routes / Index are the compiled event routing table, see RADGUI_EVENT_MANAGER.LoadRoutes
+    @classmethod
+    def RegisterCompiled(cls,CompiledClasses: List[Any],Config: List[Dict[str,Any]] = [],InputClasses: List[Any] = [],Routes: Dict[str,Dict[str,Any]] = {},Index: Dict[str,List[str]] = {}) -> bool:
+
+        cls.Console.WriteTags = {"RADGUI_FACTORY":1}
+
+        Result: bool = False
+        ConfigIndex: Dict[str,Any] = {}
+        ManualIndex: Any = None
+        DynamicIndex: Any = None
+        BindName: str = ""
+        BindValue: Any = None
+        IsRouted: bool = False
+        MethodID: str = ""
+
+        cls.Console.Write("Compiled Classes-")
+        cls.Console.Write(str(CompiledClasses))
+
+        if (cls.Lifecycle.IsEmpty() == False):
+            cls.Console.Write("(RADGUI_FACTORY.REGISTER) Releasing previous registration")
+            cls.Unregister()
+
+        #The table was merged against an empty registry, anything already registered means merging again
+        IsRouted = (Routes != {}) and (cls.EventManager.RegisteredEvents == {})
+
+        for ConfigIndex in Config:
+            cls.ApplyConfig(ConfigIndex,IsRouted)
+
+        if (IsRouted == True):
+            for MethodID in cls.EventManager.LoadRoutes(Routes,Index):
+                cls.Lifecycle.TrackEvent(cls.EventManager,MethodID,Routes[MethodID]["REQUESTS"])
+
+        cls.ManualClasses = InputClasses
+        cls.DynamicClasses = list(CompiledClasses)
+
+        for ManualIndex in cls.ManualClasses:
+            bpy.utils.register_class(ManualIndex)
+            cls.Lifecycle.TrackClass(ManualIndex)
+
+        #Compiled classes are built once per module, so bind them to this instance here
+        for DynamicIndex in cls.DynamicClasses:
+            for BindName, BindValue in cls.Bind({}).items():
+                setattr(DynamicIndex,BindName,BindValue)
+            bpy.utils.register_class(DynamicIndex)
+            cls.Lifecycle.TrackClass(DynamicIndex)
+
+        Result = True
+        return Result
+
     @classmethod
     def Register(cls,InputClasses: List[Any] = []) -> bool:
 
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_FACTORY":1}
+        cls.Console.WriteTags = {"RADGUI_FACTORY":1}
 
         Result: bool = False
         CurrentType: str = ""
@@ -751,86 +2045,95 @@ class RADGUI_FACTORY():
         ContentIndex: str = ""
         ManualIndex: Any = None
         DynamicIndex: Any = None
+        RegisterToken: Any = None
+        BuildToken: Any = None
 
-        RADGUI_CONSOLE.Write("JSON Dict-")
-        RADGUI_CONSOLE.Write(str(cls.JSONContent))
-        RADGUI_CONSOLE.Write("")
-        RADGUI_CONSOLE.Write("Input Classes-")
-        RADGUI_CONSOLE.Write(str(InputClasses))
+        cls.Console.Write("JSON Dict-")
+        cls.Console.Write(str(cls.JSONContent))
+        cls.Console.Write("")
+        cls.Console.Write("Input Classes-")
+        cls.Console.Write(str(InputClasses))
 
         #We need some input, otherwise we leave
         if(cls.JSONContent == []) and (InputClasses == []):
             return Result
 
+        #Registering on top of a live registration would leak the first one
+        if (cls.Lifecycle.IsEmpty() == False):
+            cls.Console.Write("(RADGUI_FACTORY.REGISTER) Releasing previous registration")
+            cls.Unregister()
+
         cls.ManualClasses = InputClasses
 
+        if (cls.Profiler.IsProfiling == True):
+            RegisterToken = cls.Profiler.Begin()
+
         if (cls.JSONContent != []):
+            #Panels can use components defined anywhere in the file
+            cls.LoadComponents(cls.JSONContent)
+
             for ContentIndex in cls.JSONContent:
                 
-                RADGUI_CONSOLE.Write("Reviewing JSON Index")
-                RADGUI_CONSOLE.Write(ContentIndex)
+                cls.Console.Write("Reviewing JSON Index")
+                cls.Console.Write(ContentIndex)
 
                 #Move onto the next item if it doesnt even have a type
                 if "TYPE" not in cls.JSONContent[ContentIndex]:
                     continue
 
                 BuiltObject = None
+                BuildToken = None
                 CurrentType = str(cls.JSONContent[ContentIndex]["TYPE"]).upper()
 
-                if (CurrentType == "CONFIG") or (CurrentType == "CONFIGURATION") or (CurrentType == "SETTINGS"):
-                    RADGUI_CONSOLE.Write("(RADGUI_FACTORY.REGISTER) Setting Configuration")
-                    #Console config
-                    if("CONSOLE_FILTER" in cls.JSONContent[ContentIndex]):
-                        RADGUI_CONSOLE.Write("- Console Filter")
-                        RADGUI_CONSOLE.OutputFilter = cls.JSONContent[ContentIndex]["CONSOLE_FILTER"]
-                    #Event Registration
-                    if ("EVENTS" in cls.JSONContent[ContentIndex]):
-                        RADGUI_CONSOLE.Write("- Event Registration")
-                        
-                        #Set Strict Mode
-                        if "STRICT" in cls.JSONContent[ContentIndex]["EVENTS"]:
-                            RADGUI_EVENT_MANAGER.IsStrict = bool(cls.JSONContent[ContentIndex]["EVENTS"]["STRICT"])
-                        
-                        #Register Events
-                        if "ASSOCIATIONS" in cls.JSONContent[ContentIndex]["EVENTS"]:
-
-                            MethodIndex: str = ""
-
-                            for MethodIndex in cls.JSONContent[ContentIndex]["EVENTS"]["ASSOCIATIONS"]:
-                                RADGUI_EVENT_MANAGER.AddEvent(MethodIndex,cls.JSONContent[ContentIndex]["EVENTS"]["ASSOCIATIONS"][MethodIndex])
+                if (cls.Profiler.IsProfiling == True):
+                    BuildToken = cls.Profiler.Begin()
 
-                        #RADGUI_EVENT_MANAGER.RegisteredEvents = cls.JSONContent[ContentIndex]["EVENTS"]
+                if (CurrentType == "CONFIG") or (CurrentType == "CONFIGURATION") or (CurrentType == "SETTINGS"):
+                    cls.ApplyConfig(cls.JSONContent[ContentIndex])
 
                 elif (CurrentType == "PANEL"):
-                    RADGUI_CONSOLE.Write("(RADGUI_FACTORY.REGISTER) Loading into Panel Builder")
+                    cls.Console.Write("(RADGUI_FACTORY.REGISTER) Loading into Panel Builder")
                     BuiltObject = cls.BuildPanel(cls.JSONContent[ContentIndex])
 
                 elif (CurrentType == "PROPERTIES"):
-                    RADGUI_CONSOLE.Write("(RADGUI_FACTORY.REGISTER) Loading into Properties Builder")
+                    cls.Console.Write("(RADGUI_FACTORY.REGISTER) Loading into Properties Builder")
                     BuiltObject = cls.BuildProperties(cls.JSONContent[ContentIndex])
 
                 elif (CurrentType == "OPERATOR"):
-                    RADGUI_CONSOLE.Write("(RADGUI_FACTORY.REGISTER) Loading into Operator Builder")
+                    cls.Console.Write("(RADGUI_FACTORY.REGISTER) Loading into Operator Builder")
                     BuiltObject = cls.BuildOperator(cls.JSONContent[ContentIndex])
 
+                elif (CurrentType == "COMPONENT"):
+                    #Already collected by LoadComponents, only used inside panels
+                    pass
+
                 else:
-                    RADGUI_CONSOLE.Write("(RADGUI_FACTORY.REGISTER) Failed to understand type - \"" + CurrentType + "\"")
+                    cls.Console.Write("(RADGUI_FACTORY.REGISTER) Failed to understand type - \"" + CurrentType + "\"")
+
+                #Grouped by type, and named by the definition (and its domain)
+                if (BuildToken != None):
+                    cls.Profiler.End(CurrentType,ContentIndex + ((" (" + str(cls.JSONContent[ContentIndex]["DOMAIN"]) + ")") if "DOMAIN" in cls.JSONContent[ContentIndex] else ""),BuildToken)
 
                 if (BuiltObject != None):
                     cls.DynamicClasses.append(BuiltObject)
             
-            RADGUI_CONSOLE.Write("Dynamic Classes-")
-            RADGUI_CONSOLE.Write(str(cls.DynamicClasses))
+            cls.Console.Write("Dynamic Classes-")
+            cls.Console.Write(str(cls.DynamicClasses))
 
         #Register the classes that were manually coded
         if (cls.ManualClasses != []):
             for ManualIndex in cls.ManualClasses:
                 bpy.utils.register_class(ManualIndex)
+                cls.Lifecycle.TrackClass(ManualIndex)
         
         #Register classes that were dynamically created
         if (cls.DynamicClasses != []):
             for DynamicIndex in cls.DynamicClasses:
                 bpy.utils.register_class(DynamicIndex)
+                cls.Lifecycle.TrackClass(DynamicIndex)
+
+        if (RegisterToken != None):
+            cls.Profiler.End("REGISTER",cls.__name__,RegisterToken)
         
         #We got here in one piece, congrats
         Result = True
@@ -839,266 +2142,2686 @@ class RADGUI_FACTORY():
     @classmethod
     def Unregister(cls) -> bool:
         
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_FACTORY":1}
-        Result: bool = False
-        ManualIndex: Any = None
-        DynamicIndex: Any = None
+        cls.Console.WriteTags = {"RADGUI_FACTORY":1}
+        Result: bool = True
+        StepName: str = ""
+        Step: Any = None
+
+        #Each step runs on its own, so one failing doesn't leave the rest holding on to things
+        for StepName, Step in [
+            #Unregister everything Register created, and undo the settings and events it applied
+            ("Lifecycle.Release",cls.Lifecycle.Release),
+            #Close out any event log opened by the configuration
+            ("Recorder.Stop",cls.EventManager.Recorder.Stop),
+            #Drop any async handlers still waiting on something
+            ("Async.Shutdown",cls.EventManager.Async.Shutdown),
+            #And stop taking events from outside
+            ("IPC.Stop",cls.EventManager.IPC.Stop),
+            #Icon previews are held by Blender until they are given back
+            ("Icons.Release",cls.Icons.Release),
+            #Cached enum items belong to classes that no longer exist
+            ("EnumCache.Clear",cls.EnumCache.Clear),
+            #Same for recomputes still waiting on the next tick
+            ("Computed.Clear",cls.Computed.Clear),
+            ("Aggregator.Clear",cls.Aggregator.Clear)
+        ]:
+            try:
+                #Release reports classes and cleanups it couldn't undo
+                if (Step() == False):
+                    Result = False
+            except:
+                cls.Console.WriteTags = {"RADGUI_FACTORY":1}
+                cls.Console.Write("(RADGUI_FACTORY.UNREGISTER) {} failed".format(StepName))
+                Result = False
+
+        #Let go of the generated classes, so the next Register starts numbering from zero again
+        cls.DynamicClasses = []
+        cls.ManualClasses = []
+        cls.Components = {}
+        cls.ComponentCache = {}
+
+        return Result
+
+#==================================================#
+#RAD GUI Enum Cache
+#==================================================#
+#Blender calls dynamic enum item callbacks on every draw and hover, and
+#needs python to keep the returned strings alive. Items are computed once
+#by the handler, kept here, and only recomputed when one of the declared
+#DEPENDS values changes or the TTL (seconds, 0 = never) runs out. Only the
+#EntriesSize most recently drawn owners are kept, so entries of deleted
+#objects age out instead of piling up.
+class RADGUI_ENUM_CACHE():
+    #(Domain, Name, Owner) -> [Items, Dependency values, Time computed, Previous items], least recently used first
+    Entries: Any = collections.OrderedDict()
+    EntriesSize: int = 256
+    Handlers: Dict[str, Any] = {}
+    Hits: int = 0
+    Misses: int = 0
+
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_ENUM_CACHE",(cls,),dict(Links,Entries=collections.OrderedDict(),Handlers={},Hits=0,Misses=0))
+
+    #["ID", ["ID","Name"], ["ID","Name","Description",...]] -> Blender's tuples
+    @classmethod
+    def NormalizeItems(cls,Items: List[Any]) -> List[Any]:
+
+        Result: List[Any] = []
+        Item: Any = None
+
+        for Item in Items:
+            if isinstance(Item,str):
+                Result.append((Item,Item,""))
+            elif (len(Item) == 1):
+                Result.append((str(Item[0]),str(Item[0]),""))
+            elif (len(Item) == 2):
+                Result.append((str(Item[0]),str(Item[1]),""))
+            else:
+                Result.append(tuple(Item))
+
+        return Result
+
+    #The function handed to EnumProperty(items=...), the owning instance is found through the property group
+    @classmethod
+    def Callback(cls,PropertyName: str,Handler: str,Depends: List[str],TTL: float) -> Any:
+        return lambda Part1,Part2: Part1.EnumCache.Items(Part1,Part2,PropertyName,Handler,Depends,TTL)
+
+    @classmethod
+    def ReadDependency(cls,Owner: Any,Context: Any,Path: str) -> Any:
+
+        Parts: List[str] = Path.strip().split(".")
+        Data: Any = None
+        Value: Any = None
+
+        try:
+            #VARIABLE alone means a sibling in the same group
+            if (len(Parts) == 1):
+                Data = Owner
+            elif (len(Parts) == 2):
+                Data = getattr(Context.scene,Parts[0])
+            elif (Parts[0].upper() == "OBJECT"):
+                Data = getattr(Context.object,Parts[1])
+            else:
+                Data = getattr(Context.scene,Parts[1])
+
+            Value = getattr(Data,Parts[-1])
+        except:
+            return None
+
+        #Array properties are views into Blender memory, take a copy to compare later
+        if (isinstance(Value,(str,int,float,bool)) == False) and hasattr(Value,"__len__"):
+            try:
+                Value = tuple(Value)
+            except:
+                pass
+
+        return Value
+
+    @classmethod
+    def Items(cls,Owner: Any,Context: Any,PropertyName: str,Handler: str,Depends: List[str],TTL: float) -> List[Any]:
+
+        Key: Any = (Owner.Domain,PropertyName,Owner.as_pointer())
+        Entry: List[Any] = cls.Entries.get(Key,[])
+        Stamp: List[Any] = [cls.ReadDependency(Owner,Context,x) for x in Depends]
+        Now: float = time.monotonic()
+        Method: Any = None
+        Result: List[Any] = []
+
+        if (Entry != []) and (Entry[1] == Stamp) and ((TTL <= 0) or ((Now - Entry[2]) < TTL)):
+            cls.Hits += 1
+            cls.Entries.move_to_end(Key)
+            return Entry[0]
+
+        cls.Misses += 1
+
+        #Resolve the handler once, weakly, same as event targets
+        if (Handler in cls.Handlers):
+            Method = cls.Handlers[Handler]()
+        if (Method == None):
+            Resolved: List[Any] = Owner.EventManager.ResolveMethods(Handler)
+            if (len(Resolved) == 0):
+                return Entry[0] if (Entry != []) else []
+            cls.Handlers[Handler] = weakref.WeakMethod(Resolved[0])
+            Method = Resolved[0]
+
+        try:
+            Result = cls.NormalizeItems(Method({
+                "EVENT_ID":PropertyName,
+                "EVENT_CLASS":Owner,
+                "CONTEXT":Context,
+                "DOMAIN":Owner.Domain,
+                "OBJECT_TYPE":"VARIABLE",
+                "EVENT_TYPE":"ENUM_ITEMS"
+            }))
+        except:
+            cls.Console.WriteTags = {"RADGUI_ENUM_CACHE":1}
+            cls.Console.Write("~~ Failed to Execute Enum Items Method \"{}\"".format(Handler))
+            return Entry[0] if (Entry != []) else []
+
+        #Hold on to the previous list too, Blender may still be pointing into it this redraw
+        cls.Entries[Key] = [Result,Stamp,Now,(Entry[0] if (Entry != []) else [])]
+        cls.Entries.move_to_end(Key)
+        #What goes has not been drawn for a while, Blender is done with its strings
+        while (len(cls.Entries) > cls.EntriesSize):
+            cls.Entries.popitem(last=False)
+
+        return Result
+
+    #No arguments drops everything, otherwise only the matching domain / property
+    @classmethod
+    def Invalidate(cls,Domain: str = "",PropertyName: str = "") -> None:
+
+        Key: Any = None
+
+        for Key in list(cls.Entries):
+            if ((Domain == "") or (Key[0] == Domain)) and ((PropertyName == "") or (Key[1] == PropertyName)):
+                del cls.Entries[Key]
+
+    @classmethod
+    def Clear(cls) -> None:
+        cls.Entries = collections.OrderedDict()
+        cls.Handlers = {}
+
+#==================================================#
+#RAD GUI Icons
+#==================================================#
+#Custom image icons named in the ICONS config. Nothing is read while
+#registering - names are only mapped to files. Each file gets one preview,
+#however many names and panels use it. A timer loads them a few at a time
+#in the background, and anything drawn before its turn is loaded on the
+#spot. Blender itself reads the image data on a job the first time the
+#icon is drawn.
+#
+#Instructions use them with "CUSTOM_ICON":"NAME" in place of ICON_VALUE.
+class RADGUI_ICONS():
+    Collection: Any = None
+    #Name -> absolute file path
+    Paths: Dict[str, str] = {}
+    #Every file asked for, and the icon_value of those loaded so far
+    Files: Any = set()
+    Values: Dict[str, int] = {}
+    Waiting: Any = collections.deque()
+    IsScheduled: bool = False
+    #Seconds of loading per timer tick, and the wait between ticks
+    Budget: float = 0.004
+    Interval: float = 0.05
+    Extensions: Tuple[str, ...] = (".png",".jpg",".jpeg",".tga",".bmp",".tif",".tiff",".webp",".exr",".hdr")
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_ICONS",(cls,),dict(Links,Collection=None,Paths={},Files=set(),Values={},Waiting=collections.deque(),IsScheduled=False))
+
+    @classmethod
+    def Configure(cls,Input: Dict[str, Any],BasePath: str = "") -> None:
+
+        cls.Console.WriteTags = {"RADGUI_ICONS":1}
+
+        Directory: str = ""
+        FileName: str = ""
+        Name: str = ""
+
+        if ("DIRECTORY" in Input):
+            Directory = os.path.join(BasePath,str(Input["DIRECTORY"]))
+            try:
+                for FileName in sorted(os.listdir(Directory)):
+                    if (os.path.splitext(FileName)[1].lower() in cls.Extensions):
+                        cls.Add(os.path.splitext(FileName)[0],os.path.join(Directory,FileName))
+            except:
+                cls.Console.Write("(RADGUI_ICONS) Unable to read the folder \"{}\"".format(Directory))
+
+        for Name in Input:
+            if (Name != "DIRECTORY"):
+                cls.Add(Name,os.path.join(BasePath,str(Input[Name])))
+
+        cls.Console.Write("(RADGUI_ICONS) {} icon(s), {} file(s) to load".format(len(cls.Paths),len(cls.Waiting)))
+
+    @classmethod
+    def Add(cls,Name: str,FileName: str) -> None:
+
+        FileName = os.path.normcase(os.path.abspath(FileName))
+
+        #Same file under another name, it shares the preview
+        if (FileName not in cls.Files):
+            cls.Files.add(FileName)
+            cls.Waiting.append(FileName)
+        cls.Paths[Name] = FileName
+
+        if (cls.IsScheduled == False) and (len(cls.Waiting) != 0):
+            cls.IsScheduled = True
+            bpy.app.timers.register(cls.Load,first_interval=cls.Interval)
+
+    @classmethod
+    def Preview(cls,FileName: str) -> int:
+
+        if (FileName in cls.Values):
+            return cls.Values[FileName]
+
+        #Only pulled in once an icon is actually needed
+        if (cls.Collection == None):
+            import bpy.utils.previews
+            cls.Collection = bpy.utils.previews.new()
+
+        try:
+            cls.Values[FileName] = cls.Collection.load(FileName,FileName,"IMAGE").icon_id
+        except:
+            cls.Console.WriteTags = {"RADGUI_ICONS":1}
+            cls.Console.Write("(RADGUI_ICONS) Unable to load \"{}\"".format(FileName))
+            cls.Values[FileName] = 0
+
+        return cls.Values[FileName]
+
+    #The icon_value for a name, 0 (no icon) if it isn't known
+    @classmethod
+    def Value(cls,Name: str) -> int:
+        if (Name not in cls.Paths):
+            return 0
+        return cls.Preview(cls.Paths[Name])
+
+    #Timer - loads what is still waiting, a little at a time so the UI keeps up
+    @classmethod
+    def Load(cls) -> Any:
+
+        StartTime: float = time.perf_counter()
+
+        #At least one per tick, however small the budget, or a slow file would never get its turn
+        while (len(cls.Waiting) != 0):
+            cls.Preview(cls.Waiting.popleft())
+            if (time.perf_counter() - StartTime >= cls.Budget):
+                break
+
+        if (len(cls.Waiting) != 0):
+            return cls.Interval
+
+        cls.IsScheduled = False
+        return None
+
+    @classmethod
+    def Release(cls) -> None:
+
+        #Imported up front, importing bpy.utils.previews makes bpy local to the whole method
+        import bpy.utils.previews
+
+        if (cls.IsScheduled == True):
+            try:
+                bpy.app.timers.unregister(cls.Load)
+            except:
+                pass
+            cls.IsScheduled = False
+
+        if (cls.Collection != None):
+            bpy.utils.previews.remove(cls.Collection)
+            cls.Collection = None
+
+        cls.Paths = {}
+        cls.Files = set()
+        cls.Values = {}
+        cls.Waiting.clear()
+
+#==================================================#
+#RAD GUI Computed Properties
+#==================================================#
+#COMPUTED properties are stored like any other property, but written by
+#their HANDLER from their INPUTS ("VARIABLE" in the same group, or
+#"DOMAIN.VARIABLE"). A change marks everything downstream of it as dirty.
+#On the next tick each dirty property is recomputed once, inputs before
+#the properties that read them.
+#
+#The handler gets an event with EVENT_TYPE "COMPUTE" and INPUTS
+#{"DOMAIN.VARIABLE":Value} and returns the new value.
+class RADGUI_COMPUTED():
+    #"DOMAIN.NAME" -> {"DOMAIN","NAME","INPUTS","HANDLER"}
+    Nodes: Dict[str, Dict[str, Any]] = {}
+    #"DOMAIN.VARIABLE" -> computed properties reading it
+    Dependents: Dict[str, List[str]] = {}
+    #Domain -> SCENE / OBJECT
+    Scopes: Dict[str, str] = {}
+    #Position of each node in dependency order, rebuilt whenever the graph changes
+    Order: Dict[str, int] = {}
+    IsOrdered: bool = False
+    #(Node, Owner pointer) -> Owner (the scene or object holding the group)
+    Pending: Dict[Any, Any] = {}
+    IsScheduled: bool = False
+    Handlers: Dict[str, Any] = {}
+    Context: Any = None
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_COMPUTED",(cls,),dict(Links,Nodes={},Dependents={},Scopes={},Order={},IsOrdered=False,Pending={},IsScheduled=False,Handlers={},Context=None))
+
+    @staticmethod
+    def Identify(Owner: Any) -> Any:
+        try:
+            return Owner.as_pointer()
+        except:
+            return id(Owner)
+
+    @classmethod
+    def AddDomain(cls,Domain: str,Scope: str) -> None:
+        cls.Scopes[Domain] = Scope
+
+    @classmethod
+    def AddNode(cls,Domain: str,Name: str,Inputs: List[str],Handler: str) -> None:
+
+        Node: str = Domain + "." + Name
+        InputIndex: str = ""
+
+        #A bare VARIABLE is a sibling in the same group. Each input is one edge, however often it's listed
+        Inputs = list(dict.fromkeys((x if "." in x else Domain + "." + x) for x in Inputs))
+
+        cls.Nodes[Node] = {
+            "DOMAIN":Domain,
+            "NAME":Name,
+            "INPUTS":Inputs,
+            "HANDLER":Handler
+        }
+
+        for InputIndex in Inputs:
+            if (Node not in cls.Dependents.setdefault(InputIndex,[])):
+                cls.Dependents[InputIndex].append(Node)
+
+        cls.IsOrdered = False
+
+    @classmethod
+    def RemoveDomain(cls,Domain: str) -> None:
+
+        Node: str = ""
+        InputIndex: str = ""
+
+        cls.Scopes.pop(Domain,None)
+
+        for Node in list(cls.Nodes):
+            if (cls.Nodes[Node]["DOMAIN"] != Domain):
+                continue
+            for InputIndex in cls.Nodes[Node]["INPUTS"]:
+                if (Node in cls.Dependents.get(InputIndex,[])):
+                    cls.Dependents[InputIndex].remove(Node)
+                if (cls.Dependents.get(InputIndex,None) == []):
+                    del cls.Dependents[InputIndex]
+            del cls.Nodes[Node]
+
+        cls.IsOrdered = False
+
+    #Topological order of the computed properties, a cycle is reported and left out
+    @classmethod
+    def BuildOrder(cls) -> None:
+
+        InDegree: Dict[str, int] = {}
+        Ready: Any = collections.deque()
+        Node: str = ""
+        Dependent: str = ""
+
+        cls.Order = {}
+
+        for Node in cls.Nodes:
+            InDegree[Node] = len([x for x in cls.Nodes[Node]["INPUTS"] if x in cls.Nodes])
+            if (InDegree[Node] == 0):
+                Ready.append(Node)
+
+        while (len(Ready) != 0):
+            Node = Ready.popleft()
+            cls.Order[Node] = len(cls.Order)
+            for Dependent in cls.Dependents.get(Node,[]):
+                InDegree[Dependent] -= 1
+                if (InDegree[Dependent] == 0):
+                    Ready.append(Dependent)
+
+        if (len(cls.Order) != len(cls.Nodes)):
+            cls.Console.WriteTags = {"RADGUI_COMPUTED":1}
+            cls.Console.Write("(RADGUI_COMPUTED) Dependency cycle, never recomputed - {}".format([x for x in cls.Nodes if x not in cls.Order]))
+
+        cls.IsOrdered = True
+
+    #The scene an owner belongs to - itself, or for an object the current scene if it's in there
+    @staticmethod
+    def Scene(Owner: Any,Context: Any) -> Any:
+
+        Scenes: List[Any] = []
+
+        if isinstance(Owner,bpy.types.Scene):
+            return Owner
+
+        Scenes = list(getattr(Owner,"users_scene",[]))
+        if (len(Scenes) == 0) or (Context.scene in Scenes):
+            return Context.scene
+
+        return Scenes[0]
+
+    #Where a node has to be recomputed when an input held by Owner changed
+    @classmethod
+    def Owners(cls,Node: str,InputScope: str,Owner: Any,Context: Any) -> List[Any]:
+
+        NodeScope: str = cls.Scopes.get(cls.Nodes[Node]["DOMAIN"],"SCENE")
+
+        if (NodeScope == InputScope):
+            return [Owner]
+        #An object value feeding a scene property
+        if (NodeScope == "SCENE"):
+            return [cls.Scene(Owner,Context)]
+        #A scene value feeding a property of each object in that scene
+        return list(cls.Scene(Owner,Context).objects)
+
+    #Marks everything downstream of Object.PropertyName dirty and makes sure a flush is coming
+    @classmethod
+    def Notify(cls,Object: Any,Context: Any,PropertyName: str) -> None:
+
+        Stack: List[Any] = [(Object.Domain + "." + PropertyName,getattr(Object,"RADGUI_OWNER",None) or getattr(Object,"id_data",None) or Context.scene)]
+        Current: str = ""
+        CurrentOwner: Any = None
+        Node: str = ""
+        NodeOwner: Any = None
+        Key: Any = None
+
+        cls.Context = Context
+
+        while (len(Stack) != 0):
+
+            Current, CurrentOwner = Stack.pop()
+
+            for Node in cls.Dependents.get(Current,[]):
+                for NodeOwner in cls.Owners(Node,cls.Scopes.get(Current.split(".")[0],"SCENE"),CurrentOwner,Context):
+                    Key = (Node,cls.Identify(NodeOwner))
+                    #Already waiting, and so is everything after it
+                    if (Key in cls.Pending):
+                        continue
+                    cls.Pending[Key] = NodeOwner
+                    Stack.append((Node,NodeOwner))
+
+        #Also true while a flush is running, it picks up whatever gets dirty on the way
+        if (cls.IsScheduled == False) and (len(cls.Pending) != 0):
+            cls.IsScheduled = True
+            if (bpy.app.timers.is_registered(cls.Flush) == False):
+                bpy.app.timers.register(cls.Flush,first_interval=0.0)
+
+    @classmethod
+    def ReadInput(cls,Path: str,Owner: Any,Context: Any) -> Any:
+
+        Domain: str = Path.split(".")[0]
+
+        try:
+            #Scene values come from the scene of whatever is being computed
+            if (cls.Scopes.get(Domain,"SCENE") == "SCENE"):
+                return getattr(getattr(cls.Scene(Owner,Context),Domain),Path.split(".")[-1])
+            #Object values come from the object being computed, or the active one for a scene property
+            if (hasattr(Owner,Domain) == True):
+                return getattr(getattr(Owner,Domain),Path.split(".")[-1])
+            return getattr(getattr(Context.object,Domain),Path.split(".")[-1])
+        except:
+            return None
+
+    @classmethod
+    def Recompute(cls,Node: str,Owner: Any,Context: Any) -> None:
+
+        Group: Any = getattr(Owner,cls.Nodes[Node]["DOMAIN"],None)
+        Handler: str = cls.Nodes[Node]["HANDLER"]
+        Method: Any = None
+        Value: Any = None
+
+        if (Group == None):
+            return
+
+        #Resolve the handler once, weakly, same as event targets
+        if (Handler in cls.Handlers):
+            Method = cls.Handlers[Handler]()
+        if (Method == None):
+            Resolved: List[Any] = cls.EventManager.ResolveMethods(Handler)
+            if (len(Resolved) == 0):
+                return
+            cls.Handlers[Handler] = weakref.WeakMethod(Resolved[0])
+            Method = Resolved[0]
+
+        try:
+            Value = Method({
+                "EVENT_ID":cls.Nodes[Node]["NAME"],
+                "EVENT_CLASS":Group,
+                "CONTEXT":Context,
+                "DOMAIN":cls.Nodes[Node]["DOMAIN"],
+                "OBJECT_TYPE":"VARIABLE",
+                "EVENT_TYPE":"COMPUTE",
+                "INPUTS":{x: cls.ReadInput(x,Owner,Context) for x in cls.Nodes[Node]["INPUTS"]}
+            })
+        except:
+            cls.Console.WriteTags = {"RADGUI_COMPUTED":1}
+            cls.Console.Write("~~ Failed to Execute Compute Method \"{}\"".format(Handler))
+            return
+
+        #Writing raises VARIABLE_CHANGED as usual, unchanged values stop the ripple here
+        if (getattr(Group,cls.Nodes[Node]["NAME"]) != Value):
+            setattr(Group,cls.Nodes[Node]["NAME"],Value)
+
+    #Recomputes everything dirty, each once and in dependency order. Runs from a timer, or call it directly
+    @classmethod
+    def Flush(cls) -> Any:
+
+        Work: List[Any] = []
+        Key: Any = None
+        Context: Any = cls.Context if cls.Context != None else bpy.context
+
+        #Recomputing writes properties, which notifies again - the loop below takes care of those
+        cls.IsScheduled = True
+
+        if (cls.IsOrdered == False):
+            cls.BuildOrder()
+
+        try:
+            while (len(cls.Pending) != 0):
+                #Keys stay pending until their turn, so a recompute upstream can't queue them twice
+                Work = sorted(cls.Pending,key=lambda x: cls.Order.get(x[0],-1))
+                for Key in Work:
+                    if (Key not in cls.Pending):
+                        continue
+                    if (Key[0] not in cls.Order):
+                        del cls.Pending[Key]
+                        continue
+                    cls.Recompute(Key[0],cls.Pending.pop(Key),Context)
+        finally:
+            cls.IsScheduled = False
+            cls.Context = None
+
+        return None
+
+    @classmethod
+    def Clear(cls) -> None:
+
+        if (cls.IsScheduled == True):
+            try:
+                bpy.app.timers.unregister(cls.Flush)
+            except:
+                pass
+            cls.IsScheduled = False
+
+        cls.Pending = {}
+        cls.Handlers = {}
+        cls.Context = None
+
+#==================================================#
+#RAD GUI Change Aggregator
+#==================================================#
+#Editing an OBJECT property across a selection (Alt-drag, copy to
+#selected) runs its update once per object. For AGGREGATE domains those
+#updates are held until the next tick and raised as one event per property:
+#   EVENT_ID      - The property name
+#   EVENT_CLASS   - The domain class
+#   DOMAIN        - The domain
+#   OBJECT_TYPE   - VARIABLE
+#   EVENT_TYPE    - VARIABLE_MULTI_CHANGED
+#   OBJECTS       - [Owner, ...] the objects (or scene) holding the groups
+#   GROUPS        - [Group, ...] the property groups themselves
+#   VALUES        - [Value, ...] in the same order
+#A change that only touched one group is raised as the usual VARIABLE_CHANGED
+#(EVENT_ID, EVENT_CLASS - the group, DOMAIN, VALUE).
+#
+#Groups are not held on to until the tick, Blender may have freed them by
+#then (undo, deleting the object). Their owners are noted down by name and
+#pointer, and looked up again when the events go out.
+class RADGUI_AGGREGATOR():
+    #(Domain, PropertyName) -> {Owner pointer: ["SCENE" / "OBJECT", Owner name]}, in the order they changed
+    Pending: Dict[Any, Dict[Any, Any]] = {}
+    IsScheduled: bool = False
+    Context: Any = None
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_AGGREGATOR",(cls,),dict(Links,Pending={},IsScheduled=False,Context=None))
+
+    @staticmethod
+    def Identify(Object: Any) -> Any:
+        try:
+            return Object.as_pointer()
+        except:
+            return id(Object)
+
+    #False when the group has no owner to find it again by, its change is raised right away
+    @classmethod
+    def Buffer(cls,Object: Any,Context: Any,PropertyName: str) -> bool:
+
+        Owner: Any = getattr(Object,"RADGUI_OWNER",None) or getattr(Object,"id_data",None)
+
+        if (Owner == None) or (hasattr(Owner,"name") == False):
+            return False
+
+        cls.Pending.setdefault((Object.Domain,PropertyName),{})[cls.Identify(Owner)] = [
+            "SCENE" if isinstance(Owner,bpy.types.Scene) else "OBJECT",
+            Owner.name
+        ]
+        cls.Context = Context
+
+        if (cls.IsScheduled == False):
+            cls.IsScheduled = True
+            bpy.app.timers.register(cls.Flush,first_interval=0.0)
+
+        return True
+
+    #The group of Domain held by an owner noted down by Buffer, None if the owner is gone
+    @classmethod
+    def Resolve(cls,Domain: str,Pointer: Any,Kind: str,Name: str) -> Any:
+
+        Collection: Any = bpy.data.scenes if Kind == "SCENE" else bpy.data.objects
+        Owner: Any = Collection.get(Name,None)
+
+        #Renamed on the way, the pointer still finds it
+        if (Owner == None) or (cls.Identify(Owner) != Pointer):
+            Owner = None
+            for Candidate in Collection:
+                if (cls.Identify(Candidate) == Pointer):
+                    Owner = Candidate
+                    break
+
+        if (Owner == None):
+            return None
+
+        return getattr(Owner,Domain,None)
+
+    #Raises everything collected so far. Runs from a timer, or call it directly
+    @classmethod
+    def Flush(cls) -> Any:
+
+        Work: Dict[Any, Dict[Any, Any]] = cls.Pending
+        Context: Any = cls.Context if cls.Context != None else bpy.context
+        Key: Any = None
+        Pointer: Any = None
+        Group: Any = None
+        Groups: List[Any] = []
+        Values: List[Any] = []
+
+        cls.Pending = {}
+        cls.Context = None
+        cls.IsScheduled = False
+
+        for Key in Work:
+
+            Groups = []
+            Values = []
+
+            for Pointer in Work[Key]:
+                Group = cls.Resolve(Key[0],Pointer,*Work[Key][Pointer])
+                #Owner went away before the tick came around
+                if (Group == None):
+                    continue
+                try:
+                    Values.append(getattr(Group,Key[1]))
+                    Groups.append(Group)
+                except:
+                    pass
+
+            if (len(Groups) == 0):
+                continue
+
+            if (len(Groups) == 1):
+                cls.EventManager.HandleEvent({
+                    "EVENT_ID":Key[1],
+                    "EVENT_CLASS":Groups[0],
+                    "CONTEXT":Context,
+                    "DOMAIN":Key[0],
+                    "OBJECT_TYPE":"VARIABLE",
+                    "EVENT_TYPE":"VARIABLE_CHANGED",
+                    "VALUE":Values[0]
+                })
+                continue
+
+            cls.Console.WriteTags = {"RADGUI_AGGREGATOR":2}
+            cls.Console.Write("(RADGUI_AGGREGATOR) {}.{} - {} object(s) changed".format(Key[0],Key[1],len(Groups)))
+
+            cls.EventManager.HandleEvent({
+                "EVENT_ID":Key[1],
+                "EVENT_CLASS":type(Groups[0]),
+                "CONTEXT":Context,
+                "DOMAIN":Key[0],
+                "OBJECT_TYPE":"VARIABLE",
+                "EVENT_TYPE":"VARIABLE_MULTI_CHANGED",
+                "OBJECTS":[getattr(x,"RADGUI_OWNER",None) or getattr(x,"id_data",None) for x in Groups],
+                "GROUPS":Groups,
+                "VALUES":Values
+            })
+
+        return None
+
+    @classmethod
+    def Clear(cls) -> None:
+
+        if (cls.IsScheduled == True):
+            try:
+                bpy.app.timers.unregister(cls.Flush)
+            except:
+                pass
+            cls.IsScheduled = False
+
+        cls.Pending = {}
+        cls.Context = None
+
+#==================================================#
+#RAD GUI Sparse Storage
+#==================================================#
+#SPARSE domains are read and written through Object.DOMAIN like OBJECT
+#ones, but objects don't carry the group. Only objects whose values differ
+#from the defaults get an entry, kept in one side table per file:
+#
+#   Scene.RADGUI_SPARSE_<DOMAIN>.Entries - one group per deviating object (RADGUI_OWNER)
+#   Scene.RADGUI_SPARSE_<DOMAIN>.Default - a group holding nothing but defaults
+#
+#Every scene can hold the table, but only one - the home, flagged IsHome -
+#is ever used, whatever scene is active. The first write picks the home.
+#
+#Objects without an entry hand out a RADGUI_SPARSE_VIEW that reads the
+#defaults and creates the entry on first write. Panels draw the Default
+#group instead, and an edit there is moved onto the active object. Edited
+#entries are checked a little later, and dropped if back at their defaults.
+#Saving the file sweeps everything, entries of deleted objects included.
+class RADGUI_SPARSE():
+    #Domain -> side table class
+    Tables: Dict[str, Any] = {}
+    #Domain -> name of the home scene, checked again on every use
+    Homes: Dict[str, str] = {}
+    #Table pointer -> [Entry count, {Object pointer: Entry position}]
+    Index: Dict[Any, List[Any]] = {}
+    #Domain -> pointers of the objects whose entries changed since the last compaction
+    Dirty: Dict[str, Any] = {}
+    IsCompacting: bool = False
+    IsPromoting: bool = False
+    #Seconds between an edit and its compaction, a slider drag only pays once
+    Delay: float = 2.0
+    #save_pre handler doing the full sweep
+    Sweeper: Any = None
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_SPARSE",(cls,),dict(Links,Tables={},Homes={},Index={},Dirty={},IsCompacting=False,IsPromoting=False,Sweeper=None))
+
+    @classmethod
+    def Attach(cls,DomainClass: Any) -> None:
+
+        Domain: str = DomainClass.Domain
+        Table: Any = type(Domain + "_SPARSE_TABLE",(PropertyGroup,),{
+            "__annotations__":{
+                "Entries":CollectionProperty(type=DomainClass),
+                "Default":PointerProperty(type=DomainClass),
+                "IsHome":BoolProperty(default=False)
+            }
+        })
+
+        bpy.utils.register_class(Table)
+        setattr(bpy.types.Scene,"RADGUI_SPARSE_" + Domain,PointerProperty(type=Table))
+        #A plain python property, Object.DOMAIN keeps working without storing anything on the object
+        setattr(bpy.types.Object,Domain,property(lambda Object: cls.View(Object,Domain)))
+        cls.Tables[Domain] = Table
+
+        #Persistent, so it outlives loading another file
+        if (cls.Sweeper == None):
+            cls.Sweeper = bpy.app.handlers.persistent(lambda *Arguments: cls.Compact(True))
+            bpy.app.handlers.save_pre.append(cls.Sweeper)
+
+    @classmethod
+    def Detach(cls,DomainClass: Any) -> None:
+
+        Domain: str = DomainClass.Domain
+
+        if (Domain not in cls.Tables):
+            return
+
+        if hasattr(bpy.types.Object,Domain) == True:
+            delattr(bpy.types.Object,Domain)
+        if hasattr(bpy.types.Scene,"RADGUI_SPARSE_" + Domain) == True:
+            delattr(bpy.types.Scene,"RADGUI_SPARSE_" + Domain)
+
+        bpy.utils.unregister_class(cls.Tables.pop(Domain))
+        cls.Homes.pop(Domain,None)
+        cls.Dirty.pop(Domain,None)
+        cls.Index = {}
+
+        #Last sparse domain gone, nothing left to compact
+        if (len(cls.Tables) == 0):
+            if (cls.Sweeper != None) and (cls.Sweeper in bpy.app.handlers.save_pre):
+                bpy.app.handlers.save_pre.remove(cls.Sweeper)
+            cls.Sweeper = None
+            if (cls.IsCompacting == True):
+                try:
+                    bpy.app.timers.unregister(cls.Compact)
+                except:
+                    pass
+                cls.IsCompacting = False
+
+    #The table of the file. Until something is written there is no home yet, and the
+    #(still empty) table of the current scene stands in - drawing isn't allowed to write
+    @classmethod
+    def Table(cls,Domain: str,IsWriting: bool = False) -> Any:
+
+        TableName: str = "RADGUI_SPARSE_" + Domain
+        Scene: Any = bpy.data.scenes.get(cls.Homes.get(Domain,""),None)
+
+        if (Scene == None) or (getattr(Scene,TableName).IsHome == False):
+            Scene = None
+            for Candidate in bpy.data.scenes:
+                if (getattr(Candidate,TableName).IsHome == True):
+                    Scene = Candidate
+                    break
+
+        if (Scene == None):
+            Scene = bpy.context.scene if getattr(bpy.context,"scene",None) != None else bpy.data.scenes[0]
+            if (IsWriting == False):
+                return getattr(Scene,TableName)
+            getattr(Scene,TableName).IsHome = True
+
+        cls.Homes[Domain] = Scene.name
+        return getattr(Scene,TableName)
+
+    #Where the object's entry sits in the table, -1 if it has none
+    @classmethod
+    def Position(cls,Table: Any,Pointer: Any) -> int:
+
+        Key: Any = Table.as_pointer()
+        Entries: Any = Table.Entries
+
+        #Entries are only ever appended between compactions, so a changed count is the only way to go stale
+        if (Key not in cls.Index) or (cls.Index[Key][0] != len(Entries)):
+            cls.Index[Key] = [len(Entries),{x.RADGUI_OWNER.as_pointer(): Index for Index, x in enumerate(Entries) if x.RADGUI_OWNER != None}]
+
+        return cls.Index[Key][1].get(Pointer,-1)
+
+    @classmethod
+    def Find(cls,Table: Any,Object: Any) -> Any:
+
+        Position: int = cls.Position(Table,Object.as_pointer())
+
+        if (Position == -1):
+            return None
+
+        return Table.Entries[Position]
+
+    #What Object.DOMAIN hands out
+    @classmethod
+    def View(cls,Object: Any,Domain: str) -> Any:
+
+        Table: Any = cls.Table(Domain)
+        Entry: Any = cls.Find(Table,Object)
+
+        if (Entry != None):
+            return Entry
+
+        return RADGUI_SPARSE_VIEW(cls,Table,Object)
+
+    @classmethod
+    def Materialize(cls,Domain: str,Object: Any) -> Any:
+
+        Table: Any = cls.Table(Domain,True)
+        Entry: Any = cls.Find(Table,Object)
+
+        if (Entry != None):
+            return Entry
+
+        Entry = Table.Entries.add()
+        Entry.RADGUI_OWNER = Object
+        cls.Index[Table.as_pointer()][1][Object.as_pointer()] = len(Table.Entries) - 1
+        cls.Index[Table.as_pointer()][0] = len(Table.Entries)
+
+        return Entry
+
+    #Called by PropertyUpdate. False when the change was on the defaults and got moved to an entry
+    #instead - the entry's own update raises the event then
+    @classmethod
+    def Changed(cls,Group: Any,Context: Any,PropertyName: str) -> bool:
+
+        Value: Any = None
+
+        #Entries know their object, the defaults don't
+        if (Group.RADGUI_OWNER != None):
+            cls.Dirty.setdefault(Group.Domain,set()).add(Group.RADGUI_OWNER.as_pointer())
+            if (cls.IsCompacting == False):
+                cls.IsCompacting = True
+                bpy.app.timers.register(cls.Compact,first_interval=cls.Delay)
+            return True
+
+        #Resetting the defaults below is not an edit
+        if (cls.IsPromoting == True):
+            return False
+
+        Value = getattr(Group,PropertyName)
+
+        cls.IsPromoting = True
+        try:
+            Group.property_unset(PropertyName)
+        finally:
+            cls.IsPromoting = False
+
+        if (Context.object != None):
+            setattr(cls.Materialize(Group.Domain,Context.object),PropertyName,Value)
+
+        return False
+
+    #Drops entries that are back at the defaults. The timer only looks at the entries edited since
+    #the last run, a full sweep (on save) looks at all of them and drops those of deleted objects
+    @classmethod
+    def Compact(cls,IsFull: bool = False) -> Any:
+
+        Work: Dict[str, Any] = cls.Dirty
+        Domain: str = ""
+        Table: Any = None
+        Names: List[str] = []
+        Positions: List[int] = []
+        Position: int = 0
+        Entry: Any = None
+
+        cls.Dirty = {}
+        if (IsFull == False):
+            cls.IsCompacting = False
+
+        for Domain in (list(cls.Tables) if IsFull == True else Work):
+
+            if (Domain not in cls.Tables):
+                continue
+
+            Table = cls.Table(Domain)
+            Names = [x for x in Table.Default.bl_rna.properties.keys() if x not in ("rna_type","name","RADGUI_OWNER")]
+
+            if (IsFull == True):
+                Positions = list(range(len(Table.Entries)))
+            else:
+                Positions = [cls.Position(Table,x) for x in Work[Domain]]
+
+            #Back to front, so removing one doesn't move the rest
+            for Position in sorted((x for x in Positions if x != -1),reverse=True):
+                Entry = Table.Entries[Position]
+                if (Entry.RADGUI_OWNER == None) or all(cls.Plain(getattr(Entry,x)) == cls.Plain(getattr(Table.Default,x)) for x in Names):
+                    Table.Entries.remove(Position)
+
+            cls.Index.pop(Table.as_pointer(),None)
+
+        return None
+
+    #Array properties are views into Blender memory
+    @staticmethod
+    def Plain(Value: Any) -> Any:
+        if (isinstance(Value,(str,int,float,bool)) == False) and hasattr(Value,"__len__"):
+            return tuple(Value)
+        return Value
+
+#Stands in for the group of an object that has no entry yet
+class RADGUI_SPARSE_VIEW():
+
+    #Odd names so they can't hide a property of the domain
+    def __init__(self,Sparse: Any,Table: Any,Object: Any) -> None:
+        object.__setattr__(self,"SparseStore",Sparse)
+        object.__setattr__(self,"SparseTable",Table)
+        object.__setattr__(self,"SparseObject",Object)
+
+    def __getattr__(self,Name: str) -> Any:
+        return getattr(self.SparseTable.Default,Name)
+
+    def __setattr__(self,Name: str,Value: Any) -> None:
+        setattr(self.SparseStore.Materialize(self.SparseTable.Default.Domain,self.SparseObject),Name,Value)
+
+    #UILayout.prop needs the real thing
+    @staticmethod
+    def Drawable(Data: Any) -> Any:
+        if isinstance(Data,RADGUI_SPARSE_VIEW):
+            return Data.SparseTable.Default
+        return Data
+
+#==================================================#
+#RAD GUI Lifecycle
+#==================================================#
+#Remembers everything a Register call did, so Unregister can hand all of
+#it back. Repeated enable/disable cycles then leave nothing behind.
+class RADGUI_LIFECYCLE():
+    Classes: List[Any] = []
+    Events: List[List[Any]] = []
+    Settings: List[List[Any]] = []
+    Cleanups: List[Any] = []
+
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_LIFECYCLE",(cls,),dict(Links,Classes=[],Events=[],Settings=[],Cleanups=[]))
+
+    @classmethod
+    def IsEmpty(cls) -> bool:
+        return (len(cls.Classes) == 0) and (len(cls.Events) == 0) and (len(cls.Settings) == 0) and (len(cls.Cleanups) == 0)
+
+    #Anything else Register set up that needs tearing down (threads, files, ...)
+    @classmethod
+    def TrackCleanup(cls,Cleanup: Any) -> None:
+        cls.Cleanups.append(Cleanup)
+
+    @classmethod
+    def TrackClass(cls,Class: Any) -> None:
+        cls.Classes.append(Class)
+
+    #Only our own criteria are taken back, the method stays while anyone else still uses it
+    @classmethod
+    def TrackEvent(cls,EventManager: Any,MethodID: str,InputEvents: List[Dict[str,Any]]) -> None:
+        cls.Events.append([EventManager,MethodID,list(InputEvents)])
+
+    #Call before the setting changes, only the first (original) value is kept
+    @classmethod
+    def TrackSetting(cls,Owner: Any,Name: str) -> None:
+
+        Setting: List[Any] = []
+
+        for Setting in cls.Settings:
+            if (Setting[0] is Owner) and (Setting[1] == Name):
+                return
+
+        cls.Settings.append([Owner,Name,getattr(Owner,Name)])
+
+    @classmethod
+    def Release(cls) -> bool:
+
+        Result: bool = True
+        Class: Any = None
+        Event: List[Any] = []
+        Setting: List[Any] = []
+        Cleanup: Any = None
+
+        #Reverse order, so nothing is removed before whatever depends on it
+        for Class in reversed(cls.Classes):
+            try:
+                bpy.utils.unregister_class(Class)
+            except:
+                cls.Console.WriteTags = {"RADGUI_LIFECYCLE":1}
+                cls.Console.Write("(RADGUI_LIFECYCLE) Failed to unregister class {}".format(str(Class)))
+                Result = False
+
+        for Event in reversed(cls.Events):
+            Event[0].RemoveEvent(Event[1],Event[2])
+
+        for Setting in reversed(cls.Settings):
+            setattr(Setting[0],Setting[1],Setting[2])
+
+        for Cleanup in reversed(cls.Cleanups):
+            try:
+                Cleanup()
+            except:
+                cls.Console.WriteTags = {"RADGUI_LIFECYCLE":1}
+                cls.Console.Write("(RADGUI_LIFECYCLE) Failed to clean up {}".format(str(Cleanup)))
+                Result = False
+
+        cls.Classes = []
+        cls.Events = []
+        cls.Settings = []
+        cls.Cleanups = []
+
+        return Result
+
+#==================================================#
+#RAD GUI Event Manager
+#==================================================#
+class RADGUI_EVENT_MANAGER():
+    RegisteredEvents: Dict[str, Dict[str, Any]] = {}
+    IsStrict: bool = False
+    IsTiming: bool = False
+    HandlerStats: Dict[str, Dict[str, Any]] = {}
+    #EVENT_TYPE -> methods that could react to it, rebuilt whenever the registry changes
+    DispatchIndex: Dict[str, List[str]] = {}
+    IsIndexed: bool = False
+    #Memoized outcomes of cacheable associations - MethodID -> {"KEYS","SIZE","DEPENDS","ENTRIES","HITS","MISSES"}
+    Caches: Dict[str, Dict[str, Any]] = {}
+    #What a cache tells events apart by unless told otherwise. DOMAIN and OWNER (the object holding
+    #the group, for domains that aren't per scene) are worked out when the event doesn't carry them
+    CacheKeys: List[str] = ["DOMAIN","OWNER","EVENT_ID","EVENT_TYPE","VALUE"]
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_EVENT_MANAGER",(cls,),dict(Links,RegisteredEvents={},IsStrict=False,IsTiming=False,HandlerStats={},DispatchIndex={},IsIndexed=False,Caches={}))
+
+    @classmethod
+    def BuildIndex(cls) -> None:
+
+        Result: Dict[str, List[str]] = {}
+        MethodID: str = ""
+        Criteria: Dict[str, Any] = {}
+        EventTypes: List[str] = []
+        Wildcards: List[str] = []
+        EventType: str = ""
+
+        #Criteria without an EVENT_TYPE could match anything
+        for MethodID in cls.RegisteredEvents:
+            for Criteria in cls.RegisteredEvents[MethodID]["EVENTS"]:
+                if ("EVENT_TYPE" in Criteria):
+                    if (str(Criteria["EVENT_TYPE"]) not in EventTypes):
+                        EventTypes.append(str(Criteria["EVENT_TYPE"]))
+                elif (MethodID not in Wildcards):
+                    Wildcards.append(MethodID)
+
+        Result["*"] = Wildcards
+
+        #Each list keeps registration order so handlers fire in the same order as a full scan
+        for EventType in EventTypes:
+            Result[EventType] = []
+            for MethodID in cls.RegisteredEvents:
+                if (MethodID in Wildcards):
+                    Result[EventType].append(MethodID)
+                    continue
+                for Criteria in cls.RegisteredEvents[MethodID]["EVENTS"]:
+                    if ("EVENT_TYPE" in Criteria) and (str(Criteria["EVENT_TYPE"]) == EventType):
+                        Result[EventType].append(MethodID)
+                        break
+
+        cls.DispatchIndex = Result
+        cls.IsIndexed = True
+
+    #Installs a routing table worked out ahead of time (see RADGUI_COMPILER), only the handlers are looked up
+    #Routes is MethodID -> {"EVENTS","REQUESTS"} as AddEvent would have left them, Index is what BuildIndex would build
+    #Returns the MethodIDs that were installed
+    @classmethod
+    def LoadRoutes(cls,Routes: Dict[str, Dict[str, Any]],Index: Dict[str, List[str]]) -> List[str]:
+
+        cls.Console.WriteTags = {"RADGUI_EVENT_MANAGER":1}
+        cls.Console.Write("(RADGUI_EVENT_MANAGER) Loading {} compiled route(s)".format(len(Routes)))
+        cls.Console.WriteTags = {"RADGUI_EVENT_MANAGER":2}
+
+        Result: List[str] = []
+        MethodID: str = ""
+        ConsideredMethods: List[Any] = []
+
+        for MethodID in Routes:
+
+            #Same as AddEvent, an association whose handler can't be found is left out
+            ConsideredMethods = cls.ResolveMethods(MethodID)
+            if (len(ConsideredMethods) == 0):
+                continue
+
+            #Copies, RemoveEvent edits these in place and the table is kept for the next register
+            cls.RegisteredEvents[MethodID] = {
+                "TARGETS":[weakref.WeakMethod(x) for x in ConsideredMethods],
+                "EVENTS":[dict(x) for x in Routes[MethodID]["EVENTS"]],
+                "REQUESTS":[dict(x) for x in Routes[MethodID]["REQUESTS"]]
+            }
+            Result.append(MethodID)
+
+        #Methods left out above are skipped by HandleEvent, the index stays good as is
+        cls.DispatchIndex = {Key: list(Value) for Key, Value in Index.items()}
+        cls.IsIndexed = True
+
+        return Result
+
+    #Finds the bound method(s) a "module.Class.method" reference points to, empty if none qualify
+    @classmethod
+    def ResolveMethods(cls,MethodID: str) -> List[Any]:
+
+        TargetModuleName:str = ""
+        TargetClassName: str = ""
+        TargetMethodName: str = ""
+        LoadedModules: List[str] = []
+        ConsideredModules: List[str] = []
+        ModuleIndex: str = ""
+        ModuleContents: List[str] = []
+        ConsideredClass: Any = None
+        ClassContents: List[str] = []
+        ConsideredMethod: Any = None
+        ConsideredMethods: List[Any] = []
+
+        #We do our best to get the right module, class, & method
+        TargetModuleName: str = ".".join(MethodID.split(".")[:-2])
+        TargetClassName: str = MethodID.split(".")[-2]
+        TargetMethodName: str = MethodID.split(".")[-1]
+
+        #Does the defined module even exist in loaded modules?
+        LoadedModules = sys.modules.keys()
+        ConsideredModules = list(filter(lambda x: TargetModuleName in x, LoadedModules))
+
+        #We can only continue if we see any modules
+        if (len(ConsideredModules) == 0):
+            cls.Console.Write("(RADGUI_EVENT_MANAGER) No modules like \"{}\" found in the system".format(TargetModuleName))
+
+        #Strict Mode requires that only the exact module to exist
+        elif (cls.IsStrict == True):
+            if (TargetModuleName in ConsideredModules):
+                ConsideredModules = [TargetModuleName]
+
+            else:
+                cls.Console.Write("(RADGUI_EVENT_MANAGER) Strict Mode found no modules exactly like \"{}\"".format(TargetModuleName))
+                return []
+
+        cls.Console.Write("(RADGUI_EVENT_MANAGER) Found {} Possible Module(s) - {}".format(len(ConsideredModules),ConsideredModules))
+
+        #Find all the classes that match the class name in all modules
+        for ModuleIndex in ConsideredModules:
+            #List all the classes in the Module
+            ModuleContents = dir(sys.modules[ModuleIndex])
+
+            #Move onto the next Index if the class cant be found
+            if (TargetClassName not in ModuleContents):
+                continue
+
+            #We do have the class in the module? Lets try and check it out
+            try:
+                ConsideredClass = getattr(sys.modules[ModuleIndex],TargetClassName)
+                ClassContents = dir(ConsideredClass)
+            except:
+                cls.Console.Write("(RADGUI_EVENT_MANAGER) Had issue getting contents of Class \"{}\" in Module \"{}\"".format(TargetClassName,ModuleIndex))
+                continue
+
+            #Move onto the next Index if the method cant be found
+            if (TargetMethodName not in ClassContents):
+                continue
+
+            #Verify type is a method
+            try:
+                ConsideredMethod = getattr(ConsideredClass,TargetMethodName)
+                if ConsideredMethod.__class__.__name__ != 'method':
+                    cls.Console.Write("(RADGUI_EVENT_MANAGER) {}.{}.{} is actually not a method but a \"{}\"".format(ModuleIndex,TargetClassName,TargetMethodName,ConsideredMethod.__class__.__name__))
+                    continue
+                else:
+                    ConsideredMethods.append(ConsideredMethod)
+                    cls.Console.Write("(RADGUI_EVENT_MANAGER) {}.{}.{} added to considered methods".format(ModuleIndex,TargetClassName,TargetMethodName))
+            except:
+                cls.Console.Write("(RADGUI_EVENT_MANAGER) Had issue getting properties of method \"{}\" in Class \"{}\"".format(TargetMethodName,TargetClassName))
+                continue
+
+        #We're left with all the functions that might be the one described
+        #Do we have anything?
+        if (len(ConsideredMethods) == 0):
+            cls.Console.Write("(RADGUI_EVENT_MANAGER) No Methods found")
+            return []
+        elif ((cls.IsStrict == True) and (len(ConsideredMethods) > 1)):
+            cls.Console.Write("(RADGUI_EVENT_MANAGER) Somehow, more than one method was found in {} that matched search criteria.".format(TargetClassName))
+            cls.Console.Write("(RADGUI_EVENT_MANAGER) Strict mode only allows for one method to be associated in a reference")
+            return []
+
+        return ConsideredMethods
+
+    @classmethod
+    def AddEvent(cls,MethodID: str,InputEvents: List[Dict[str,Any]]) -> None:
+        
+        cls.Console.WriteTags = {"RADGUI_EVENT_MANAGER":1}
+        cls.Console.Write("(RADGUI_EVENT_MANAGER) Adding event for module {}".format(MethodID))
+        cls.Console.WriteTags = {"RADGUI_EVENT_MANAGER":2}
+
+        #Method name and at least one event should be provided
+        if ((MethodID.strip() == "") or (len(InputEvents) == 0)):
+            cls.Console.Write("(RADGUI_EVENT_MANAGER) Empty arguments provided to event registration")
+            return
+
+        #Consider it better to work on a local copy of the index, and add/modify the registered events without issue
+        SandboxIndex: Dict[str, Dict[str, Any]] = {}
+
+        #Add the method in if it did not exist
+        if (MethodID in cls.RegisteredEvents):
+            
+            #Fill out sandbox
+            SandboxIndex = {
+                MethodID : cls.RegisteredEvents[MethodID]
+            }
+            
+        else:
+
+            SandboxIndex = {
+                MethodID : {
+                    "TARGETS":[],
+                    "EVENTS":[],
+                    #Every criteria list ever added, duplicates included. EVENTS is built from these,
+                    #so one owner taking its criteria back can't take another owner's with it
+                    "REQUESTS":[]
+                }
+            }
+
+            ConsideredMethods: List[Any] = cls.ResolveMethods(MethodID)
+
+            if (len(ConsideredMethods) == 0):
+                return
+
+            #Push Methods to the Sandbox
+            #Weak references, so a reloaded module's old classes can still be collected
+            SandboxIndex[MethodID]["TARGETS"] = [weakref.WeakMethod(x) for x in ConsideredMethods]
+            cls.Console.Write("(RADGUI_EVENT_MANAGER) Considered Methods Added to Sandbox")
+
+        SandboxIndex[MethodID]["REQUESTS"] = SandboxIndex[MethodID]["REQUESTS"] + list(InputEvents)
+        SandboxIndex[MethodID]["EVENTS"] = cls.MergeEvents(SandboxIndex[MethodID]["EVENTS"],InputEvents)
+
+        #Move the Sandbox back to the Registered Events
+        cls.RegisteredEvents[MethodID] = SandboxIndex[MethodID]
+        cls.IsIndexed = False
+        if (cls.Console.IsWritable() == True):
+            cls.Console.Write("(RADGUI_EVENT_MANAGER) REGISTERED EVENTS = \n {}".format(str(cls.RegisteredEvents)))
+
+    #Optimize Event list that would call method - returns a new list, Events is left alone
+    @classmethod
+    def MergeEvents(cls,Events: List[Dict[str,Any]],InputEvents: List[Dict[str,Any]]) -> List[Dict[str,Any]]:
+
+        Result: List[Dict[str,Any]] = list(Events)
+        IsSubset: bool = False
+        IsSuperset:bool = False
+        IsMatch: bool = False
+        ToAdd: bool = False
+        InputEventIndex: Dict[str,Any] = {}
+        CalculatedEventIndex: Dict[str,Any] = {}
+
+        #If it has no events yet, just optimize the list provided
+        if (len(Result) == 0):
+            Result = list(InputEvents)
+
+        #Loop through each item to add in InputEvents
+        for InputEventIndex in InputEvents:
+
+            cls.Console.Write("-- For [{}] in [{}]".format(str(InputEventIndex),str(InputEvents)))
+            IsSubset = False
+            IsSuperset = False
+            IsMatch = False
+            ToAdd = False               
+
+            for CalculatedEventIndex in list(Result):
+                
+                cls.Console.Write("-->-- For [{}] in [{}]".format(str(CalculatedEventIndex),str(Result)))
+                IsSubset = set(InputEventIndex.items()).issubset(set(CalculatedEventIndex.items()))
+                IsSuperset = set(InputEventIndex.items()).issuperset(set(CalculatedEventIndex.items()))
+                IsMatch = (InputEventIndex == CalculatedEventIndex)
+
+                #Dont Wanna duplicate data
+                if (IsMatch == True):
+                    cls.Console.Write("-->-- Matches")
+                    ToAdd = False
+                    break
+
+                #Dont want to add more narrow Event Criteria when looser criteria already exists
+                if (IsSuperset==True):
+                    cls.Console.Write("-->-- Is Superset")
+                    ToAdd = False
+                    break
+
+                #Remove more narrow Event Criteria
+                if (IsSubset == True):
+                    cls.Console.Write("-->-- Is Subset")
+                    cls.Console.Write("-- Removing [{}]".format(CalculatedEventIndex))
+                    Result.remove(CalculatedEventIndex)
+
+                #If you got here, it might be up for consideration
+                ToAdd = True
+            
+            if (ToAdd == True):
+                cls.Console.Write("-- Adding [{}]".format(InputEventIndex))
+                Result.append(InputEventIndex)
+
+        return Result
+        
+    @classmethod
+    def RemoveEvent(cls,MethodID: str,InputEvents: List[Dict[str,Any]] = []) -> None:
+        cls.Console.WriteTags = {"RADGUI_EVENT_MANAGER":1}
+        cls.Console.Write("(RADGUI_EVENT_MANAGER) Removing event associations associated with method \"{}\"".format(MethodID))
+        cls.Console.WriteTags = {"RADGUI_EVENT_MANAGER":2}
+
+        #Continue if Method is named
+        if (MethodID.strip() == ""):
+            cls.Console.Write("(RADGUI_EVENT_MANAGER) No method named to remove")
+            return
+
+        #Continue if Method exists
+        if (MethodID not in cls.RegisteredEvents):
+            cls.Console.Write("(RADGUI_EVENT_MANAGER) \"{}\" is already not registered".format(MethodID))
+            return
+
+        cls.IsIndexed = False
+
+        #Without defining any special events in particular, just remove the whole thing
+        if (len(InputEvents) == 0):
+            del cls.RegisteredEvents[MethodID]
+            cls.Caches.pop(MethodID,None)
+            return
+
+        #Take back one request per criteria given, whatever others added stays
+        InputEventIndex: Dict[str,Any] = {}
+
+        for InputEventIndex in InputEvents:
+            if (InputEventIndex in cls.RegisteredEvents[MethodID]["REQUESTS"]):
+                cls.RegisteredEvents[MethodID]["REQUESTS"].remove(InputEventIndex)
+
+        #Nobody wants this method anymore
+        if (len(cls.RegisteredEvents[MethodID]["REQUESTS"]) == 0):
+            del cls.RegisteredEvents[MethodID]
+            cls.Caches.pop(MethodID,None)
+            return
+
+        #Narrower criteria folded into looser ones come back if the looser ones went away
+        cls.RegisteredEvents[MethodID]["EVENTS"] = cls.MergeEvents([],cls.RegisteredEvents[MethodID]["REQUESTS"])
+
+    #Returns what each association's handler returned, by MethodID
+    @classmethod
+    def HandleEvent(cls,InputEvent: Dict[str, Any]) -> Dict[str, Any]:
+        cls.Console.WriteTags = {"RADGUI_EVENT_MANAGER":1}
+        #Formatting the whole event is the expensive part, skip it when the message would be filtered
+        if (cls.Console.IsWritable() == True):
+            cls.Console.Write("(RADGUI_EVENT_MANAGER) Event Raised \n {}".format(str(InputEvent)))
+        cls.Console.WriteTags = {"RADGUI_EVENT_MANAGER":2}
+
+        #Move through each Key which holds a reference to the class and function
+        CurrentRegisteredIndex: str = ""
+        CurrentEventsIndex: Dict[str, Any] = {}
+        MethodIndex: Any = None
+        Method: Any = None
+        IsSubset:bool = False
+        StartTime: float = 0.0
+        Outcome: Any = None
+        Candidates: List[str] = []
+        Outcomes: Dict[str, Any] = {}
+        CacheKey: Any = None
+        IsCacheable: bool = False
+
+        #Stream the event out to the log before anyone gets a chance to act on it
+        if (cls.Recorder.IsRecording == True):
+            cls.Recorder.Record(InputEvent)
+
+        if (cls.IsIndexed == False):
+            cls.BuildIndex()
+
+        #Property changes make remembered outcomes that read those properties stale
+        if (len(cls.Caches) != 0) and (str(InputEvent.get("OBJECT_TYPE","")) == "VARIABLE"):
+            cls.InvalidateChanged(InputEvent)
+
+        #Only look at methods that could care about this EVENT_TYPE
+        if (str(InputEvent.get("EVENT_TYPE")) in cls.DispatchIndex):
+            Candidates = cls.DispatchIndex[str(InputEvent.get("EVENT_TYPE"))]
+        else:
+            Candidates = cls.DispatchIndex["*"]
+
+        for CurrentRegisteredIndex in list(Candidates):
+
+            #A handler earlier in this dispatch may have removed it
+            if (CurrentRegisteredIndex not in cls.RegisteredEvents):
+                continue
+            
+            IsSubset = False
+                        
+            for CurrentEventsIndex in list(cls.RegisteredEvents[CurrentRegisteredIndex]["EVENTS"]):
+                
+                IsSubset = cls.Matches(CurrentEventsIndex,InputEvent)
+                cls.Console.Write("-- REGISTERED EVENT [{}] - IS SUBSET [{}]".format(CurrentRegisteredIndex,IsSubset))
+
+                if (IsSubset == True):
+
+                    #A cacheable handler that has seen these key fields before is skipped, its
+                    #remembered outcome is what this dispatch returns for it
+                    IsCacheable = (CurrentRegisteredIndex in cls.Caches)
+                    if (IsCacheable == True):
+                        CacheKey = cls.CacheKey(CurrentRegisteredIndex,InputEvent)
+                        if (CacheKey in cls.Caches[CurrentRegisteredIndex]["ENTRIES"]):
+                            cls.Caches[CurrentRegisteredIndex]["ENTRIES"].move_to_end(CacheKey)
+                            cls.Caches[CurrentRegisteredIndex]["HITS"] += 1
+                            Outcomes[CurrentRegisteredIndex] = cls.Caches[CurrentRegisteredIndex]["ENTRIES"][CacheKey]
+                            cls.Console.Write("-- CACHED [{}]".format(CurrentRegisteredIndex))
+                            break
+                        cls.Caches[CurrentRegisteredIndex]["MISSES"] += 1
+                    
+                    for MethodIndex in list(cls.RegisteredEvents[CurrentRegisteredIndex]["TARGETS"]):
+
+                        #The class behind the method is gone (module reloaded or removed)
+                        Method = MethodIndex()
+                        if (Method == None):
+                            cls.Console.Write("-- Dropping dead target of [{}]".format(CurrentRegisteredIndex))
+                            cls.RegisteredEvents[CurrentRegisteredIndex]["TARGETS"].remove(MethodIndex)
+                            continue
+
+                        try:
+                            #Only pay for the clock and the memory count when someone is measuring
+                            if (cls.IsTiming == True):
+                                StartTime = time.perf_counter()
+                            if (cls.Profiler.IsProfiling == True):
+                                Outcome = cls.Profiler.Measure("HANDLER",CurrentRegisteredIndex,Method,InputEvent)
+                            else:
+                                Outcome = Method(InputEvent)
+                            if (cls.IsTiming == True):
+                                cls.RecordTiming(CurrentRegisteredIndex,time.perf_counter() - StartTime)
+
+                            #"async def" handlers hand back a coroutine, let the timer loop drive it
+                            if asyncio.iscoroutine(Outcome):
+                                cls.Async.Schedule(CurrentRegisteredIndex + ":" + str(InputEvent.get("EVENT_ID","")),Outcome)
+                                IsCacheable = False
+                            else:
+                                Outcomes[CurrentRegisteredIndex] = Outcome
+                        except:
+                            cls.Console.Write("~~ Failed to Execute Method")
+                            IsCacheable = False
+                            continue
+
+                    #Only clean, finished results are worth remembering
+                    if (IsCacheable == True) and (CurrentRegisteredIndex in Outcomes):
+                        cls.CacheStore(CurrentRegisteredIndex,CacheKey,Outcomes[CurrentRegisteredIndex])
+
+                    #Nothing left to call, forget the association entirely
+                    if (len(cls.RegisteredEvents[CurrentRegisteredIndex]["TARGETS"]) == 0):
+                        del cls.RegisteredEvents[CurrentRegisteredIndex]
+                        cls.Caches.pop(CurrentRegisteredIndex,None)
+                        cls.IsIndexed = False
+
+                    #One call per event, however many of its criteria match
+                    break
+
+        return Outcomes
+
+    #Declares an association cacheable - "skip if seen". Once its handler ran for a combination of the
+    #KEYS fields (CacheKeys when none are given), matching events with the same combination don't call it again: whatever it does
+    #besides returning is not repeated. The outcome it returned is handed back by HandleEvent (and
+    #RADGUI_APP.HandleEvent), the only place it can be read - the shells raising events ignore it.
+    #So only handlers that are pure functions of the KEYS fields, and whose result is read by whoever
+    #raises the event, belong here.
+    #Up to SIZE combinations are kept (least recently used goes first). A change to a property in
+    #DEPENDS ("DOMAIN.PROPERTY", "DOMAIN.*" or "*") forgets all of them, unless the change is itself
+    #an event of the association - the KEYS already tell those apart.
+    @classmethod
+    def SetCache(cls,MethodID: str,Keys: List[str] = [],Size: int = 128,Depends: List[str] = ["*"]) -> None:
+
+        Keys = list(Keys) if len(Keys) != 0 else list(cls.CacheKeys)
+
+        cls.Console.WriteTags = {"RADGUI_EVENT_MANAGER":1}
+        cls.Console.Write("(RADGUI_EVENT_MANAGER) Caching \"{}\" on {} ({} entries)".format(MethodID,Keys,Size))
+
+        cls.Caches[MethodID] = {
+            "KEYS":list(Keys),
+            "SIZE":max(1,int(Size)),
+            "DEPENDS":list(Depends),
+            "ENTRIES":collections.OrderedDict(),
+            "HITS":0,
+            "MISSES":0
+        }
+
+    @classmethod
+    def RemoveCache(cls,MethodID: str) -> None:
+        cls.Caches.pop(MethodID,None)
+
+    @classmethod
+    def CacheKey(cls,MethodID: str,InputEvent: Dict[str, Any]) -> Any:
+
+        Result: Any = tuple(cls.CacheField(InputEvent,x) for x in cls.Caches[MethodID]["KEYS"])
+
+        #Lists and such can't be dict keys, their text will do
+        try:
+            hash(Result)
+        except TypeError:
+            Result = repr(Result)
+
+        return Result
+
+    @staticmethod
+    def CacheField(InputEvent: Dict[str, Any],FieldName: str) -> Any:
+
+        EventClass: Any = InputEvent.get("EVENT_CLASS",None)
+        Owner: Any = None
+
+        if (FieldName in InputEvent):
+            return InputEvent[FieldName]
+
+        if (FieldName == "DOMAIN"):
+            return getattr(EventClass,"Domain",None)
+
+        #Scene domains only have the one group, objects need telling apart
+        if (FieldName == "OWNER") and (str(getattr(EventClass,"Scope","SCENE")).upper() != "SCENE"):
+            Owner = getattr(EventClass,"RADGUI_OWNER",None) or getattr(EventClass,"id_data",None)
+            try:
+                return Owner.as_pointer()
+            except:
+                return None if Owner == None else id(Owner)
+
+        return None
+
+    @classmethod
+    def CacheStore(cls,MethodID: str,CacheKey: Any,Outcome: Any) -> None:
+
+        Entries: Any = cls.Caches[MethodID]["ENTRIES"]
+
+        Entries[CacheKey] = Outcome
+        Entries.move_to_end(CacheKey)
+        while (len(Entries) > cls.Caches[MethodID]["SIZE"]):
+            Entries.popitem(last=False)
+
+    #Forget remembered outcomes - of every cache, of one association, or only the one for InputEvent
+    @classmethod
+    def InvalidateCache(cls,MethodID: str = "",InputEvent: Dict[str, Any] = {}) -> None:
+
+        CacheIndex: str = ""
+
+        for CacheIndex in list(cls.Caches):
+
+            if (MethodID != "") and (CacheIndex != MethodID):
+                continue
+
+            if (len(InputEvent) == 0):
+                cls.Caches[CacheIndex]["ENTRIES"].clear()
+            else:
+                cls.Caches[CacheIndex]["ENTRIES"].pop(cls.CacheKey(CacheIndex,InputEvent),None)
+
+    #"DOMAIN.PROPERTY" of each property a VARIABLE event says was changed
+    @staticmethod
+    def ChangedProperties(InputEvent: Dict[str, Any]) -> List[str]:
+
+        Changes: List[Dict[str, Any]] = []
+
+        if ("CHANGES" in InputEvent):
+            Changes = list(InputEvent["CHANGES"])
+        else:
+            Changes = [{"EVENT_CLASS":InputEvent.get("EVENT_CLASS"),"EVENT_ID":InputEvent.get("EVENT_ID"),"DOMAIN":InputEvent.get("DOMAIN")}]
+
+        return [str(x.get("DOMAIN") or getattr(x.get("EVENT_CLASS"),"Domain","")) + "." + str(x.get("EVENT_ID")) for x in Changes]
+
+    @classmethod
+    def InvalidateChanged(cls,InputEvent: Dict[str, Any]) -> None:
+
+        Changed: List[str] = cls.ChangedProperties(InputEvent)
+        CacheIndex: str = ""
+        Depends: List[str] = []
+
+        for CacheIndex in list(cls.Caches):
+
+            Depends = cls.Caches[CacheIndex]["DEPENDS"]
+            if (len(cls.Caches[CacheIndex]["ENTRIES"]) == 0):
+                continue
+            if not any((x == "*") or (x == y) or (x.endswith(".*") and y.startswith(x[:-1])) for x in Depends for y in Changed):
+                continue
+
+            #The association's own events are told apart by the key
+            if (CacheIndex in cls.RegisteredEvents) and any(cls.Matches(x,InputEvent) for x in cls.RegisteredEvents[CacheIndex]["EVENTS"]):
+                continue
+
+            cls.Console.WriteTags = {"RADGUI_EVENT_MANAGER":2}
+            cls.Console.Write("-- {} changed, forgetting cached outcomes of [{}]".format(Changed,CacheIndex))
+            cls.Caches[CacheIndex]["ENTRIES"].clear()
+
+    #Hits, misses and size of each cache
+    @classmethod
+    def CacheStats(cls,MethodID: str = "") -> Dict[str, Dict[str, Any]]:
+
+        Result: Dict[str, Dict[str, Any]] = {}
+        CacheIndex: str = ""
+
+        for CacheIndex in cls.Caches:
+            if (MethodID != "") and (CacheIndex != MethodID):
+                continue
+            Result[CacheIndex] = {
+                "HITS":cls.Caches[CacheIndex]["HITS"],
+                "MISSES":cls.Caches[CacheIndex]["MISSES"],
+                "ENTRIES":len(cls.Caches[CacheIndex]["ENTRIES"]),
+                "SIZE":cls.Caches[CacheIndex]["SIZE"]
+            }
+
+        return Result
+
+    #Same as a subset test on the items, but events may carry unhashable values (lists of items, ...)
+    @classmethod
+    def Matches(cls,Criteria: Dict[str, Any],InputEvent: Dict[str, Any]) -> bool:
+
+        Key: str = ""
+        Value: Any = None
+
+        for Key, Value in Criteria.items():
+            if (Key not in InputEvent) or (InputEvent[Key] != Value):
+                return False
+
+        return True
+
+    @classmethod
+    def RecordTiming(cls,MethodID: str,Elapsed: float) -> None:
+
+        #Keep running totals rather than samples so the stats stay bounded
+        if (MethodID not in cls.HandlerStats):
+            cls.HandlerStats[MethodID] = {
+                "CALLS":0,
+                "TOTAL":0.0,
+                "MAX":0.0
+            }
+
+        cls.HandlerStats[MethodID]["CALLS"] += 1
+        cls.HandlerStats[MethodID]["TOTAL"] += Elapsed
+        if (Elapsed > cls.HandlerStats[MethodID]["MAX"]):
+            cls.HandlerStats[MethodID]["MAX"] = Elapsed
+
+#==================================================#
+#RAD GUI Async Handlers
+#==================================================#
+#Coroutines returned by "async def" handlers run on a private event loop.
+#The loop is never left running, instead bpy.app.timers steps it once per
+#tick so the UI stays responsive while handlers wait on I/O.
+class RADGUI_ASYNC():
+    Loop: Any = None
+    InFlight: Dict[str, Any] = {}
+    IsStepping: bool = False
+    Interval: float = 0.01
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_ASYNC",(cls,),dict(Links,Loop=None,InFlight={},IsStepping=False))
+
+    @classmethod
+    def Schedule(cls,Key: str,Coroutine: Any) -> Any:
+
+        cls.Console.WriteTags = {"RADGUI_ASYNC":2}
+
+        Task: Any = None
+
+        if (cls.Loop == None) or (cls.Loop.is_closed() == True):
+            cls.Loop = asyncio.new_event_loop()
+
+        #A newer event for the same handler and EVENT_ID makes the older run stale
+        if (Key in cls.InFlight) and (cls.InFlight[Key].done() == False):
+            cls.Console.Write("(RADGUI_ASYNC) Cancelling stale handler run \"{}\"".format(Key))
+            cls.InFlight[Key].cancel()
+
+        Task = cls.Loop.create_task(Coroutine)
+        Task.add_done_callback(lambda Finished, Key=Key: cls.Finish(Key,Finished))
+        cls.InFlight[Key] = Task
+
+        if (cls.IsStepping == False):
+            cls.IsStepping = True
+            bpy.app.timers.register(cls.Step,first_interval=0.0,persistent=True)
+
+        return Task
+
+    @classmethod
+    def Finish(cls,Key: str,Task: Any) -> None:
+
+        #Only forget the key if a newer task hasn't already taken its place
+        if (cls.InFlight.get(Key) is Task):
+            del cls.InFlight[Key]
+
+        if (Task.cancelled() == True):
+            return
+
+        if (Task.exception() != None):
+            cls.Console.WriteTags = {"RADGUI_ASYNC":1}
+            cls.Console.Write("~~ Failed to Execute Async Method \"{}\" - {}".format(Key,repr(Task.exception())))
+
+    @classmethod
+    def Step(cls) -> Any:
+
+        if (cls.Loop == None) or (cls.Loop.is_closed() == True):
+            cls.IsStepping = False
+            return None
+
+        #Run everything that is ready right now, then hand control back to Blender
+        cls.Loop.call_soon(cls.Loop.stop)
+        cls.Loop.run_forever()
+
+        #Done callbacks land a pass after their task, so wait for InFlight to drain as well
+        if (len(asyncio.all_tasks(cls.Loop)) == 0) and (len(cls.InFlight) == 0):
+            cls.IsStepping = False
+            return None
+
+        return cls.Interval
+
+    @classmethod
+    def Shutdown(cls) -> None:
+
+        Task: Any = None
+
+        if (cls.Loop == None) or (cls.Loop.is_closed() == True):
+            return
+
+        for Task in asyncio.all_tasks(cls.Loop):
+            Task.cancel()
+
+        #Give the cancellations one pass to unwind before closing
+        cls.Loop.call_soon(cls.Loop.stop)
+        cls.Loop.run_forever()
+        cls.Loop.close()
+
+        cls.Loop = None
+        cls.InFlight = {}
+
+#==================================================#
+#RAD GUI Memory Profiler
+#==================================================#
+#Opt-in, built on tracemalloc. While profiling, every definition built by
+#Register, every panel draw and every handler call is measured and the
+#memory it left behind is added up under (CATEGORY, NAME):
+#   REGISTER / <TYPE> (PANEL, PROPERTIES, ...) / PANEL / HANDLER
+#Something that keeps growing call after call is holding on to memory.
+#
+#Cycle() takes a snapshot, call it once per repetition (a register and
+#unregister, N redraws, ...). Diff() then shows which source lines grew
+#between cycles.
+class RADGUI_MEMORY_PROFILER():
+    IsProfiling: bool = False
+    #This profiler counts among the Users of tracemalloc
+    IsOwner: bool = False
+    #Shared by every spawned profiler - how many are profiling, and whether tracemalloc was
+    #started by them. It may already be running for someone else, only stop what we started,
+    #and only once the last of them is done
+    Users: int = 0
+    IsTracer: bool = False
+    #(Category, Name) -> {"CALLS","NET","MAX"}
+    Stats: Dict[Any, Dict[str, Any]] = {}
+    Snapshots: Any = collections.deque(maxlen=10)
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_MEMORY_PROFILER",(cls,),dict(Links,IsProfiling=False,IsOwner=False,Stats={},Snapshots=collections.deque(maxlen=10)))
+
+    #Frames - how much of each traceback to keep, Keep - how many cycle snapshots to hold
+    @classmethod
+    def Start(cls,Frames: int = 1,Keep: int = 10) -> None:
+
+        cls.Console.WriteTags = {"RADGUI_MEMORY_PROFILER":1}
+
+        if (cls.IsOwner == False):
+            if (RADGUI_MEMORY_PROFILER.Users == 0) and (tracemalloc.is_tracing() == False):
+                tracemalloc.start(max(1,Frames))
+                RADGUI_MEMORY_PROFILER.IsTracer = True
+            RADGUI_MEMORY_PROFILER.Users += 1
+            cls.IsOwner = True
+
+        cls.Stats = {}
+        cls.Snapshots = collections.deque(maxlen=max(2,Keep))
+        cls.IsProfiling = True
+
+        cls.Console.Write("(RADGUI_MEMORY_PROFILER) Profiling memory")
+
+    @classmethod
+    def Stop(cls) -> None:
+
+        cls.IsProfiling = False
+
+        if (cls.IsOwner == True):
+            cls.IsOwner = False
+            RADGUI_MEMORY_PROFILER.Users -= 1
+            if (RADGUI_MEMORY_PROFILER.Users == 0) and (RADGUI_MEMORY_PROFILER.IsTracer == True):
+                tracemalloc.stop()
+                RADGUI_MEMORY_PROFILER.IsTracer = False
+
+        cls.Snapshots.clear()
+
+    @classmethod
+    def Begin(cls) -> int:
+        return tracemalloc.get_traced_memory()[0]
+
+    @classmethod
+    def End(cls,Category: str,Name: str,Token: int) -> None:
+
+        Key: Any = (Category,Name)
+        Net: int = tracemalloc.get_traced_memory()[0] - Token
+
+        if (Key not in cls.Stats):
+            cls.Stats[Key] = {
+                "CALLS":0,
+                "NET":0,
+                "MAX":0
+            }
+
+        cls.Stats[Key]["CALLS"] += 1
+        cls.Stats[Key]["NET"] += Net
+        if (Net > cls.Stats[Key]["MAX"]):
+            cls.Stats[Key]["MAX"] = Net
+
+    @classmethod
+    def Measure(cls,Category: str,Name: str,Method: Any,*Arguments) -> Any:
+
+        Token: int = cls.Begin()
+
+        try:
+            return Method(*Arguments)
+        finally:
+            cls.End(Category,Name,Token)
+
+    @classmethod
+    def Cycle(cls) -> None:
+        if (cls.IsProfiling == True):
+            cls.Snapshots.append(tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False,tracemalloc.__file__)]))
+
+    #Growth by source line between the latest snapshot and the one Cycles back (0 = the oldest kept)
+    @classmethod
+    def Diff(cls,Cycles: int = 0,Top: int = 10) -> List[Dict[str, Any]]:
 
-        try:
-            #UnRegister classes that were dynamically created
-            if (cls.DynamicClasses != []):
-                for DynamicIndex in cls.DynamicClasses:
-                    bpy.utils.unregister_class(DynamicIndex)
+        Result: List[Dict[str, Any]] = []
+        Old: Any = None
+        Difference: Any = None
 
-            #UnRegister the classes that were manually coded
-            if (cls.ManualClasses != []):
-                for ManualIndex in cls.ManualClasses:
-                    bpy.utils.unregister_class(ManualIndex)
+        if (len(cls.Snapshots) < 2):
+            return Result
 
-            Result = True
+        Old = cls.Snapshots[0] if (Cycles <= 0) or (Cycles >= len(cls.Snapshots)) else cls.Snapshots[-1 - Cycles]
 
-        except:
-            RADGUI_CONSOLE.Write("(RADGUI_FACTORY.UNREGISTER) Failed to unregister classes")
+        for Difference in cls.Snapshots[-1].compare_to(Old,"lineno")[:Top]:
+            Result.append({
+                "WHERE":str(Difference.traceback),
+                "SIZE":Difference.size_diff,
+                "COUNT":Difference.count_diff
+            })
+
+        return Result
+
+    #Everything measured, biggest total first, and written out to the console
+    @classmethod
+    def Report(cls,Top: int = 10) -> Dict[str, Any]:
+
+        cls.Console.WriteTags = {"RADGUI_MEMORY_PROFILER":1}
+
+        Result: Dict[str, Any] = {
+            "CALLS":[],
+            "GROWTH":cls.Diff(0,Top)
+        }
+        Key: Any = None
+        Entry: Dict[str, Any] = {}
+
+        for Key in sorted(cls.Stats,key=lambda x: cls.Stats[x]["NET"],reverse=True):
+            Result["CALLS"].append({
+                "CATEGORY":Key[0],
+                "NAME":Key[1],
+                "CALLS":cls.Stats[Key]["CALLS"],
+                "NET":cls.Stats[Key]["NET"],
+                "PER_CALL":cls.Stats[Key]["NET"] / cls.Stats[Key]["CALLS"],
+                "MAX":cls.Stats[Key]["MAX"]
+            })
+
+        for Entry in Result["CALLS"][:Top]:
+            cls.Console.Write("(RADGUI_MEMORY_PROFILER) {} {} - {} call(s), {} bytes kept ({:.0f} per call, max {})".format(
+                Entry["CATEGORY"],Entry["NAME"],Entry["CALLS"],Entry["NET"],Entry["PER_CALL"],Entry["MAX"]
+            ))
+        for Entry in Result["GROWTH"]:
+            cls.Console.Write("(RADGUI_MEMORY_PROFILER) {:+} bytes, {:+} blocks - {}".format(Entry["SIZE"],Entry["COUNT"],Entry["WHERE"]))
 
         return Result
 
 #==================================================#
-#RAD GUI Event Manager
+#RAD GUI IPC Server
 #==================================================#
-class RADGUI_EVENT_MANAGER():
-    RegisteredEvents: Dict[str, Dict[str, Any]] = {}
-    IsStrict: bool = False
+#Lets tools outside Blender push events into a running session. A local
+#listener (unix socket, or TCP bound to the loopback only) reads
+#newline-delimited JSON on background threads - one event, or a list of
+#events, per line. Blender data is only touched on the main thread, where
+#a timer drains the queue for at most BUDGET seconds per tick. When the
+#queue is full the readers stop reading, and the sender's socket fills up
+#and blocks.
+#
+#A {"EVENT_TYPE":"SET_VARIABLE","VARIABLE":"DOMAIN.NAME","VALUE":..} event
+#writes the scene property, raising VARIABLE_CHANGED as a UI edit would.
+#Anything else goes to the event manager as is, with CONTEXT filled in.
+class RADGUI_IPC():
+    Address: str = ""
+    Server: Any = None
+    Threads: List[Any] = []
+    Queue: Any = None
+    IsRunning: bool = False
+    IsDraining: bool = False
+    Budget: float = 0.005
+    Interval: float = 0.01
+    #Events dispatched and lines that could not be read
+    Received: int = 0
+    Rejected: int = 0
+    #(device, inode) of the unix socket file this server made, the only file Stop may remove
+    SocketFile: Any = None
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_IPC",(cls,),dict(Links,Address="",Server=None,Threads=[],Queue=None,IsRunning=False,IsDraining=False,Received=0,Rejected=0,SocketFile=None))
+
+    #(device, inode) of the socket at Path, None if there is none
+    @staticmethod
+    def SocketIdentity(Path: str) -> Any:
+
+        Status: Any = None
+
+        try:
+            Status = os.stat(Path)
+        except OSError:
+            return None
+
+        if (stat.S_ISSOCK(Status.st_mode) == False):
+            return None
+
+        return (Status.st_dev,Status.st_ino)
 
+    #"unix:/path/to.sock", "tcp:127.0.0.1:7447", "tcp:[::1]:7447" or just a port number
     @classmethod
-    def AddEvent(cls,MethodID: str,InputEvents: List[Dict[str,Any]]) -> None:
-        
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_EVENT_MANAGER":1}
-        RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) Adding event for module {}".format(MethodID))
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_EVENT_MANAGER":2}
+    def Start(cls,Address: str,QueueSize: int = 10000,Budget: float = 0.005) -> bool:
 
-        #Method name and at least one event should be provided
-        if ((MethodID.strip() == "") or (len(InputEvents) == 0)):
-            RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) Empty arguments provided to event registration")
-            return
+        cls.Console.WriteTags = {"RADGUI_IPC":1}
 
-        #Consider it better to work on a local copy of the index, and add/modify the registered events without issue
-        SandboxIndex: Dict[str, Dict[str, Any]] = {}
+        Host: str = "127.0.0.1"
+        Port: str = Address
 
-        #Add the method in if it did not exist
-        if (MethodID in cls.RegisteredEvents):
-            
-            #Fill out sandbox
-            SandboxIndex = {
-                MethodID : cls.RegisteredEvents[MethodID]
-            }
-            
-        else:
+        if (cls.IsRunning == True):
+            cls.Stop()
 
-            SandboxIndex = {
-                MethodID : {
-                    "TARGETS":[],
-                    "EVENTS":[]
-                }
-            }
+        try:
+            if Address.lower().startswith("unix:"):
+                Address = Address[5:]
+                #A socket left behind by a crashed session is fair game, anything else is someone's file
+                if os.path.lexists(Address):
+                    if (cls.SocketIdentity(Address) == None) or (os.path.islink(Address) == True):
+                        cls.Console.Write("(RADGUI_IPC) Refusing to replace \"{}\", it is not a socket".format(Address))
+                        return False
+                    os.remove(Address)
+                cls.Server = socket.socket(socket.AF_UNIX,socket.SOCK_STREAM)
+                cls.Server.bind(Address)
+                cls.SocketFile = cls.SocketIdentity(Address)
+            else:
+                if Address.lower().startswith("tcp:"):
+                    Host, _, Port = Address[4:].rpartition(":")
+                    #IPv6 hosts come in brackets
+                    Host = Host.strip("[]")
+                #Nothing but this machine gets to drive the session
+                if (Host not in ("127.0.0.1","localhost","::1")):
+                    cls.Console.Write("(RADGUI_IPC) Refusing to listen on non-local address \"{}\"".format(Host))
+                    return False
+                cls.Server = socket.socket(socket.AF_INET6 if Host == "::1" else socket.AF_INET,socket.SOCK_STREAM)
+                cls.Server.setsockopt(socket.SOL_SOCKET,socket.SO_REUSEADDR,1)
+                cls.Server.bind((Host,int(Port)))
+
+            cls.Server.listen()
+            #Lets the accept loop notice Stop
+            cls.Server.settimeout(0.25)
+        except Exception as Error:
+            cls.Console.Write("(RADGUI_IPC) Failed to listen on \"{}\" - {}".format(Address,Error))
+            cls.Server = None
+            return False
+
+        cls.Address = Address
+        cls.Queue = queue.Queue(maxsize=max(1,QueueSize))
+        cls.Budget = Budget
+        cls.IsRunning = True
+        cls.Threads = [threading.Thread(target=cls.Accept,name="RADGUI_IPC",daemon=True)]
+        cls.Threads[0].start()
+
+        if (cls.IsDraining == False):
+            cls.IsDraining = True
+            bpy.app.timers.register(cls.Drain,first_interval=cls.Interval,persistent=True)
+
+        cls.Console.Write("(RADGUI_IPC) Listening on \"{}\"".format(Address))
+        return True
+
+    #Background thread - one reader thread per connection
+    @classmethod
+    def Accept(cls) -> None:
 
-            TargetModuleName:str = ""
-            TargetClassName: str = ""
-            TargetMethodName: str = ""
-            LoadedModules: List[str] = []
-            ConsideredModules: List[str] = []
-            ModuleIndex: str = ""
-            ModuleContents: List[str] = []
-            ConsideredClass: Any = None
-            ClassContents: List[str] = []
-            ConsideredMethod: Any = None
-            ConsideredMethods: List[Any] = []
-
-            #We do our best to get the right module, class, & method
-            TargetModuleName: str = ".".join(MethodID.split(".")[:-2])
-            TargetClassName: str = MethodID.split(".")[-2]
-            TargetMethodName: str = MethodID.split(".")[-1]
-
-            #Does the defined module even exist in loaded modules?
-            LoadedModules = LoadedModules = sys.modules.keys()
-            ConsideredModules = list(filter(lambda x: TargetModuleName in x, LoadedModules))
-
-            #We can only continue if we see any modules
-            if (len(ConsideredModules) == 0):
-                RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) No modules like \"{}\" found in the system".format(TargetModuleName))
-
-            #Strict Mode requires that only the exact module to exist
-            elif (cls.IsStrict == True):
-                if (TargetModuleName in ConsideredModules):
-                    ConsideredModules = [TargetModuleName]
+        Connection: Any = None
+        Reader: Any = None
 
-                else:
-                    RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) Strict Mode found no modules exactly like \"{}\"".format(TargetModuleName))
-                    return
+        while (cls.IsRunning == True):
+            try:
+                Connection, _ = cls.Server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+
+            Reader = threading.Thread(target=cls.Read,args=(Connection,),name="RADGUI_IPC_READER",daemon=True)
+            cls.Threads.append(Reader)
+            Reader.start()
 
-            RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) Found {} Possible Module(s) - {}".format(len(ConsideredModules),ConsideredModules))
+    #Background thread - never touches Blender, only parses and queues
+    @classmethod
+    def Read(cls,Connection: Any) -> None:
 
-            #Find all the classes that match the class name in all modules
-            for ModuleIndex in ConsideredModules:
-                #List all the classes in the Module
-                ModuleContents = dir(sys.modules[ModuleIndex])
+        Buffer: bytes = b""
+        Received: bytes = b""
+        CurrentLine: bytes = b""
 
-                #Move onto the next Index if the class cant be found
-                if (TargetClassName not in ModuleContents):
-                    continue
+        #A timeout only means the client is quiet, it lets the loop notice Stop.
+        #Reading through makefile() would give up on the connection after the first one
+        Connection.settimeout(0.25)
 
-                #We do have the class in the module? Lets try and check it out
+        with Connection:
+            while (cls.IsRunning == True):
                 try:
-                    ConsideredClass = getattr(sys.modules[ModuleIndex],TargetClassName)
-                    ClassContents = dir(ConsideredClass)
-                except:
-                    RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) Had issue getting contents of Class \"{}\" in Module \"{}\"".format(TargetClassName,ModuleIndex))
+                    Received = Connection.recv(65536)
+                except socket.timeout:
                     continue
+                except OSError:
+                    break
 
-                #Move onto the next Index if the method cant be found
-                if (TargetMethodName not in ClassContents):
-                    continue
+                #Client hung up, whatever it sent without a newline still counts
+                if (Received == b""):
+                    if (Buffer.strip() != b""):
+                        cls.ReadLine(Buffer)
+                    break
+
+                Buffer += Received
+                while (b"\n" in Buffer):
+                    CurrentLine, _, Buffer = Buffer.partition(b"\n")
+                    if (CurrentLine.strip() != b""):
+                        cls.ReadLine(CurrentLine)
+
+    #One NDJSON line - an event or a list of them
+    @classmethod
+    def ReadLine(cls,CurrentLine: bytes) -> None:
+
+        Content: Any = None
+        CurrentEvent: Any = None
+
+        try:
+            Content = json.loads(CurrentLine)
+        except:
+            cls.Rejected += 1
+            return
 
-                #Verify type is a method
+        for CurrentEvent in (Content if isinstance(Content,list) else [Content]):
+            if (isinstance(CurrentEvent,dict) == False):
+                cls.Rejected += 1
+                continue
+            #Full queue - wait here, the sender backs up behind us
+            while (cls.IsRunning == True):
                 try:
-                    ConsideredMethod = getattr(ConsideredClass,TargetMethodName)
-                    if ConsideredMethod.__class__.__name__ != 'method':
-                        RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) {}.{}.{} is actually not a method but a \"{}\"".format(ModuleIndex,TargetClassName,TargetMethodName,ConsideredMethod.__class__.__name__))
-                        continue
-                    else:
-                        ConsideredMethods.append(ConsideredMethod)
-                        RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) {}.{}.{} added to considered methods".format(ModuleIndex,TargetClassName,TargetMethodName))
-                except:
-                    RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) Had issue getting properties of method \"{}\" in Class \"{}\"".format(TargetMethodName,TargetClassName))
+                    cls.Queue.put(CurrentEvent,timeout=0.25)
+                    break
+                except queue.Full:
                     continue
 
-            #We're left with all the functions that might be the one described
-            #Do we have anything?
-            if (len(ConsideredMethods) == 0):
-                RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) No Methods found")
-                return
-            elif ((cls.IsStrict == True) and (len(ConsideredMethods) > 1)):
-                RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) Somehow, more than one method was found in {} that matched search criteria.".format(TargetClassName))
-                RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) Strict mode only allows for one method to be associated in a reference")
-                return
+    #Main thread, from a timer
+    @classmethod
+    def Drain(cls) -> Any:
 
-            #Push Methods to the Sandbox
-            SandboxIndex[MethodID]["TARGETS"] = ConsideredMethods
-            RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) Considered Methods Added to Sandbox")
+        StartTime: float = time.perf_counter()
+        CurrentEvent: Dict[str, Any] = {}
 
-        #Optimize Event list that would call method
-        IsSubset: bool = False
-        IsSuperset:bool = False
-        IsMatch: bool = False
-        ToAdd: bool = False
-        InputEventIndex: Dict[str,Any] = {}
-        CalculatedEventIndex: Dict[str,Any] = {}
+        if (cls.Queue == None):
+            cls.IsDraining = False
+            return None
 
-        #If it has no events yet, just optimize the list provided
-        if (len(SandboxIndex[MethodID]["EVENTS"]) == 0):
-            SandboxIndex[MethodID]["EVENTS"] = InputEvents
+        while ((time.perf_counter() - StartTime) < cls.Budget):
+            try:
+                CurrentEvent = cls.Queue.get_nowait()
+            except queue.Empty:
+                break
 
-        #Loop through each item to add in InputEvents
-        for InputEventIndex in InputEvents:
+            try:
+                cls.Dispatch(CurrentEvent)
+            except:
+                cls.Console.WriteTags = {"RADGUI_IPC":1}
+                cls.Console.Write("~~ Failed to handle external event {}".format(str(CurrentEvent)[:200]))
+            cls.Received += 1
 
-            RADGUI_CONSOLE.Write("-- For [{}] in [{}]".format(str(InputEventIndex),str(InputEvents)))
-            IsSubset = False
-            IsSuperset = False
-            IsMatch = False
-            ToAdd = False               
+        if (cls.IsRunning == False) and (cls.Queue.empty() == True):
+            cls.IsDraining = False
+            return None
 
-            for CalculatedEventIndex in list(SandboxIndex[MethodID]["EVENTS"]):
-                
-                RADGUI_CONSOLE.Write("-->-- For [{}] in [{}]".format(str(CalculatedEventIndex),str(SandboxIndex[MethodID]["EVENTS"])))
-                IsSubset = set(InputEventIndex.items()).issubset(set(CalculatedEventIndex.items()))
-                IsSuperset = set(InputEventIndex.items()).issuperset(set(CalculatedEventIndex.items()))
-                IsMatch = (InputEventIndex == CalculatedEventIndex)
+        #Still behind, come straight back
+        if (cls.Queue.empty() == False):
+            return 0.0
 
-                #Dont Wanna duplicate data
-                if (IsMatch == True):
-                    RADGUI_CONSOLE.Write("-->-- Matches")
-                    ToAdd = False
-                    break
+        return cls.Interval
 
-                #Dont want to add more narrow Event Criteria when looser criteria already exists
-                if (IsSuperset==True):
-                    RADGUI_CONSOLE.Write("-->-- Is Superset")
-                    ToAdd = False
-                    break
+    @classmethod
+    def Dispatch(cls,CurrentEvent: Dict[str, Any]) -> None:
 
-                #Remove more narrow Event Criteria
-                if (IsSubset == True):
-                    RADGUI_CONSOLE.Write("-->-- Is Subset")
-                    RADGUI_CONSOLE.Write("-- Removing [{}]".format(CalculatedEventIndex))
-                    SandboxIndex[MethodID]["EVENTS"].remove(CalculatedEventIndex)
+        Parts: List[str] = []
 
-                #If you got here, it might be up for consideration
-                ToAdd = True
-            
-            if (ToAdd == True):
-                RADGUI_CONSOLE.Write("-- Adding [{}]".format(InputEventIndex))
-                SandboxIndex[MethodID]["EVENTS"].append(InputEventIndex)
+        if (str(CurrentEvent.get("EVENT_TYPE","")).upper() == "SET_VARIABLE"):
+            Parts = str(CurrentEvent.get("VARIABLE","")).split(".")
+            if (len(Parts) != 2):
+                cls.Rejected += 1
+                return
+            setattr(getattr(bpy.context.scene,Parts[0]),Parts[1],CurrentEvent.get("VALUE"))
+            return
+
+        CurrentEvent["CONTEXT"] = bpy.context
+        cls.EventManager.HandleEvent(CurrentEvent)
 
-        #Move the Sandbox back to the Registered Events
-        cls.RegisteredEvents[MethodID] = SandboxIndex[MethodID]
-        RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) REGISTERED EVENTS = \n {}".format(str(cls.RegisteredEvents)))
-        
     @classmethod
-    def RemoveEvent(cls,MethodID: str,InputEvents: List[Dict[str,Any]] = []) -> None:
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_EVENT_MANAGER":1}
-        RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) Removing event associations associated with method \"{}\"".format(MethodID))
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_EVENT_MANAGER":2}
+    def Stop(cls) -> None:
 
-        #Continue if Method is named
-        if (MethodID.strip() == ""):
-            RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) No method named to remove")
+        Thread: Any = None
+
+        if (cls.IsRunning == False):
             return
 
-        #Continue if Method exists
-        if (MethodID not in cls.RegisteredEvents):
-            RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) \"{}\" is already not registered".format(MethodID))
+        cls.IsRunning = False
+
+        try:
+            cls.Server.close()
+        except:
+            pass
+
+        for Thread in cls.Threads:
+            Thread.join(1.0)
+
+        #Only the socket we made - something else may have taken the path since
+        if (cls.SocketFile != None) and (cls.SocketIdentity(cls.Address) == cls.SocketFile):
+            try:
+                os.remove(cls.Address)
+            except:
+                pass
+        cls.SocketFile = None
+
+        #Whatever was still queued is dropped, the timer sees the empty queue and stops
+        cls.Server = None
+        cls.Threads = []
+        cls.Queue = queue.Queue()
+
+        cls.Console.WriteTags = {"RADGUI_IPC":1}
+        cls.Console.Write("(RADGUI_IPC) Stopped listening on \"{}\"".format(cls.Address))
+
+#==================================================#
+#RAD GUI Event Recorder
+#==================================================#
+#One JSON line per event. Only plain data can be written down - strings,
+#numbers, booleans, None, and lists / dicts of those. Anything else
+#(CONTEXT, Blender objects, lists holding them) is left out. The property
+#group in EVENT_CLASS is kept as where to find it again:
+#   EVENT_DOMAIN  - The domain
+#   EVENT_OWNER   - ["OBJECT" / "SCENE", name of the object or scene]
+#and the replayer looks it up again from those. Dicts inside the event
+#(the CHANGES of VARIABLE_BATCH_CHANGED) are written down the same way.
+class RADGUI_EVENT_RECORDER():
+    #Stands for a value that can't be written down
+    Nothing: Any = object()
+    IsRecording: bool = False
+    LogFile: Any = None
+    StartTime: float = 0.0
+    PendingLines: int = 0
+    FlushEvery: int = 64
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_EVENT_RECORDER",(cls,),dict(Links,IsRecording=False,LogFile=None,StartTime=0.0,PendingLines=0))
+
+    @classmethod
+    def Start(cls,FileName: str) -> bool:
+
+        cls.Console.WriteTags = {"RADGUI_EVENT_RECORDER":1}
+
+        Result: bool = False
+
+        #Only one log at a time
+        if (cls.IsRecording == True):
+            cls.Stop()
+
+        if (FileName.strip() == ""):
+            cls.Console.Write("(RADGUI_EVENT_RECORDER) No file named to record into")
+            return Result
+
+        try:
+            #Append only, so a crashed session still leaves everything before the crash
+            cls.LogFile = open(FileName,"a")
+            cls.StartTime = time.perf_counter()
+            cls.PendingLines = 0
+            cls.LogFile.write(json.dumps({"RADGUI_LOG":1,"START":time.time()},separators=(",",":")) + "\n")
+            cls.IsRecording = True
+            Result = True
+            cls.Console.Write("(RADGUI_EVENT_RECORDER) Recording events to \"{}\"".format(FileName))
+        except:
+            cls.Console.Write("(RADGUI_EVENT_RECORDER) Failed to open \"{}\" for recording".format(FileName))
+
+        return Result
+
+    @classmethod
+    def Stop(cls) -> None:
+
+        cls.IsRecording = False
+
+        if (cls.LogFile != None):
+            try:
+                cls.LogFile.close()
+            except:
+                pass
+            cls.LogFile = None
+
+    #The value as JSON that reads back the same, Nothing if it can't be written down
+    @classmethod
+    def Flatten(cls,Value: Any) -> Any:
+
+        Result: Any = None
+
+        if isinstance(Value,(str,int,float,bool)) or (Value is None):
+            return Value
+        if isinstance(Value,(list,tuple)):
+            Result = [cls.Flatten(x) for x in Value]
+            return cls.Nothing if any(x is cls.Nothing for x in Result) else Result
+        if isinstance(Value,dict) and all(isinstance(x,str) for x in Value):
+            return cls.Serialize(Value)
+
+        return cls.Nothing
+
+    @classmethod
+    def Serialize(cls,InputEvent: Dict[str, Any]) -> Dict[str, Any]:
+
+        Result: Dict[str, Any] = {}
+        FieldName: str = ""
+        FieldValue: Any = None
+        EventClass: Any = InputEvent.get("EVENT_CLASS",None)
+        Owner: Any = None
+
+        #Blender objects (EVENT_CLASS, CONTEXT, ...) can't outlive the session, so only plain data is kept
+        for FieldName, FieldValue in InputEvent.items():
+            if (FieldName == "EVENT_CLASS"):
+                continue
+            FieldValue = cls.Flatten(FieldValue)
+            if (FieldValue is not cls.Nothing):
+                Result[FieldName] = FieldValue
+
+        #The property group behind the event, by name
+        if (hasattr(EventClass,"Domain") == True):
+            Result["EVENT_DOMAIN"] = EventClass.Domain
+            Owner = getattr(EventClass,"RADGUI_OWNER",None) or getattr(EventClass,"id_data",None)
+            if (Owner != None) and (hasattr(Owner,"name") == True):
+                Result["EVENT_OWNER"] = ["SCENE" if getattr(EventClass,"Scope","SCENE") == "SCENE" else "OBJECT",Owner.name]
+
+        return Result
+
+    @classmethod
+    def Record(cls,InputEvent: Dict[str, Any]) -> None:
+
+        if (cls.LogFile == None):
             return
 
-        #Without defining any special events in particular, just remove the whole thing
-        if (len(InputEvents) == 0):
-            del cls.RegisteredEvents[MethodID]
+        try:
+            cls.LogFile.write(json.dumps({"T":round(time.perf_counter() - cls.StartTime,6),"E":cls.Serialize(InputEvent)},separators=(",",":")) + "\n")
+            cls.PendingLines += 1
+
+            #Batch the flushes, an event storm shouldn't turn into a storm of syscalls
+            if (cls.PendingLines >= cls.FlushEvery):
+                cls.LogFile.flush()
+                cls.PendingLines = 0
+        except:
+            cls.Console.WriteTags = {"RADGUI_EVENT_RECORDER":1}
+            cls.Console.Write("(RADGUI_EVENT_RECORDER) Failed to write event, recording stopped")
+            cls.Stop()
+
+#==================================================#
+#RAD GUI Event Replayer
+#==================================================#
+#Replays run from a timer, a step hands out every event that is due and
+#comes back when the next one is. Blender keeps drawing and taking input
+#while a replay runs.
+class RADGUI_EVENT_REPLAYER():
+    IsReplaying: bool = False
+    Entries: List[Dict[str, Any]] = []
+    Position: int = 0
+    Speed: float = 1.0
+    Context: Any = None
+    BaseTime: float = 0.0
+    StartTime: float = 0.0
+    #Time spent handing out events, throughput is measured against this rather than the wall clock
+    BusyTime: float = 0.0
+    #Seconds of events per step when replaying as fast as possible
+    Budget: float = 0.02
+    WasRecording: bool = False
+    WasTiming: bool = False
+    OnFinished: Any = None
+    #Summary of the last finished replay
+    Result: Dict[str, Any] = {}
+
+    #A copy of this class with its own state, used by RADGUI_APP to keep addons apart
+    @classmethod
+    def Spawn(cls,Name: str,Links: Dict[str,Any] = {}) -> Any:
+        return type(Name + "_EVENT_REPLAYER",(cls,),dict(Links,IsReplaying=False,Entries=[],Position=0,Context=None,OnFinished=None,Result={}))
+
+    @classmethod
+    def Load(cls,FileName: str) -> List[Dict[str, Any]]:
+
+        Result: List[Dict[str, Any]] = []
+        CurrentLine: str = ""
+        CurrentEntry: Dict[str, Any] = {}
+
+        with open(FileName,"r") as fileInput:
+            for CurrentLine in fileInput:
+                if (CurrentLine.strip() == ""):
+                    continue
+                CurrentEntry = json.loads(CurrentLine)
+                #Header lines mark where each recording session began
+                if ("E" not in CurrentEntry) or ("T" not in CurrentEntry):
+                    continue
+                Result.append(CurrentEntry)
+
+        return Result
+
+    #A recorded event (or a part of it) with every property group looked up again, where it still exists
+    @classmethod
+    def Restore(cls,Value: Any) -> Any:
+
+        Result: Dict[str, Any] = {}
+
+        if isinstance(Value,list):
+            return [cls.Restore(x) for x in Value]
+        if (isinstance(Value,dict) == False):
+            return Value
+
+        Result = {x: cls.Restore(y) for x, y in Value.items()}
+        cls.Resolve(Result)
+
+        return Result
+
+    #Looks the property group of a recorded event up again, if it still exists
+    @classmethod
+    def Resolve(cls,CurrentEvent: Dict[str, Any]) -> None:
+
+        Owner: Any = None
+
+        if ("EVENT_DOMAIN" not in CurrentEvent) or ("EVENT_OWNER" not in CurrentEvent):
             return
 
-        #We must remove all events in MethodID that match InputEvents
-        InputEventIndex: Dict[str,Any] = {}
-        CalculatedEventIndex: Dict[str,Any] = {}
+        try:
+            if (CurrentEvent["EVENT_OWNER"][0] == "OBJECT"):
+                Owner = bpy.data.objects[CurrentEvent["EVENT_OWNER"][1]]
+            else:
+                Owner = bpy.data.scenes[CurrentEvent["EVENT_OWNER"][1]]
+            CurrentEvent["EVENT_CLASS"] = getattr(Owner,CurrentEvent["EVENT_DOMAIN"])
+        except:
+            pass
 
-        for InputEventIndex in InputEvents:
-            for CalculatedEventIndex in list(cls.RegisteredEvents[MethodID]["EVENTS"]):
-                if (InputEventIndex == CalculatedEventIndex):
-                    cls.RegisteredEvents[MethodID]["EVENTS"].remove(CalculatedEventIndex)
+    #Speed - 1.0 is original speed, 2.0 twice as fast, 0 (or less) as fast as possible
+    #OnFinished(Result) is called once the last event went out, the summary is also kept in Result
+    @classmethod
+    def Replay(cls,FileName: str,Speed: float = 1.0,Context: Any = None,OnFinished: Any = None) -> bool:
+
+        cls.Console.WriteTags = {"RADGUI_EVENT_REPLAYER":1}
+
+        Entries: List[Dict[str, Any]] = []
+
+        try:
+            Entries = cls.Load(FileName)
+        except:
+            cls.Console.Write("(RADGUI_EVENT_REPLAYER) Failed to read \"{}\"".format(FileName))
+            return False
+
+        if (len(Entries) == 0):
+            cls.Console.Write("(RADGUI_EVENT_REPLAYER) \"{}\" holds no events".format(FileName))
+            return False
+
+        #One replay at a time
+        if (cls.IsReplaying == True):
+            cls.Stop()
+
+        cls.Entries = Entries
+        cls.Position = 0
+        cls.Speed = Speed
+        cls.Context = Context
+        cls.OnFinished = OnFinished
+        cls.BusyTime = 0.0
+
+        #Don't record our own replay back into a log, and measure every handler call
+        cls.WasRecording = cls.EventManager.Recorder.IsRecording
+        cls.WasTiming = cls.EventManager.IsTiming
+        cls.EventManager.Recorder.IsRecording = False
+        cls.EventManager.IsTiming = True
+        cls.EventManager.HandlerStats = {}
+
+        cls.BaseTime = float(Entries[0]["T"])
+        cls.StartTime = time.perf_counter()
+        cls.IsReplaying = True
+
+        bpy.app.timers.register(cls.Step,first_interval=0.0)
+        return True
+
+    #Timer - hands out whatever is due, then sleeps until the next event
+    @classmethod
+    def Step(cls) -> Any:
+
+        StepTime: float = time.perf_counter()
+        WaitTime: float = 0.0
+        CurrentEvent: Dict[str, Any] = {}
+
+        if (cls.IsReplaying == False):
+            return None
+
+        try:
+            while (cls.Position < len(cls.Entries)):
+
+                if (cls.Speed > 0):
+                    #Hold the event back until its (scaled) original time comes up
+                    WaitTime = ((float(cls.Entries[cls.Position]["T"]) - cls.BaseTime) / cls.Speed) - (time.perf_counter() - cls.StartTime)
+                    if (WaitTime > 0):
+                        break
+                elif ((time.perf_counter() - StepTime) >= cls.Budget):
+                    #As fast as possible, but let Blender have a frame now and then
+                    WaitTime = 0.0
                     break
 
+                CurrentEvent = cls.Restore(cls.Entries[cls.Position]["E"])
+                cls.Position += 1
+                CurrentEvent["CONTEXT"] = cls.Context if cls.Context != None else bpy.context
+
+                cls.EventManager.HandleEvent(CurrentEvent)
+        except:
+            cls.Console.WriteTags = {"RADGUI_EVENT_REPLAYER":1}
+            cls.Console.Write("(RADGUI_EVENT_REPLAYER) Replay stopped at event {}".format(cls.Position))
+            cls.Position = len(cls.Entries)
+
+        cls.BusyTime += time.perf_counter() - StepTime
+
+        if (cls.Position < len(cls.Entries)):
+            return max(0.0,WaitTime)
+
+        cls.Finish()
+        return None
+
+    #Ends the replay early, what ran so far is still summed up
     @classmethod
-    def HandleEvent(cls,InputEvent: Dict[str, Any]) -> None:
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_EVENT_MANAGER":1}
-        RADGUI_CONSOLE.Write("(RADGUI_EVENT_MANAGER) Event Raised \n {}".format(str(InputEvent)))
-        RADGUI_CONSOLE.WriteTags = {"RADGUI_EVENT_MANAGER":2}
+    def Stop(cls) -> None:
 
-        #Move through each Key which holds a reference to the class and function
-        CurrentRegisteredIndex: str = ""
-        CurrentEventsIndex: Dict[str, Any] = {}
-        MethodIndex: Any = None
-        IsSubset:bool = False
+        if (cls.IsReplaying == False):
+            return
 
-        for CurrentRegisteredIndex in list(cls.RegisteredEvents):
-            
-            IsSubset = False
-                        
-            for CurrentEventsIndex in list(cls.RegisteredEvents[CurrentRegisteredIndex]["EVENTS"]):
-                
-                IsSubset = set(CurrentEventsIndex.items()).issubset(set(InputEvent.items()))
-                RADGUI_CONSOLE.Write("-- REGISTERED EVENT [{}] - IS SUBSET [{}]".format(CurrentRegisteredIndex,IsSubset))
+        try:
+            bpy.app.timers.unregister(cls.Step)
+        except:
+            pass
 
-                if (IsSubset == True):
-                    
-                    for MethodIndex in cls.RegisteredEvents[CurrentRegisteredIndex]["TARGETS"]:
-                        try:
-                            MethodIndex(InputEvent)
-                        except:
-                            RADGUI_CONSOLE.Write("~~ Failed to Execute Method")
-                            continue
\ No newline at end of file
+        cls.Finish()
+
+    @classmethod
+    def Finish(cls) -> None:
+
+        Result: Dict[str, Any] = {
+            "EVENTS":cls.Position,
+            "ELAPSED":time.perf_counter() - cls.StartTime,
+            "BUSY":cls.BusyTime,
+            "THROUGHPUT":0.0,
+            "HANDLERS":{}
+        }
+        MethodID: str = ""
+        Stats: Dict[str, Any] = {}
+        OnFinished: Any = cls.OnFinished
+
+        cls.IsReplaying = False
+        cls.Entries = []
+        cls.Context = None
+        cls.OnFinished = None
+        cls.EventManager.Recorder.IsRecording = cls.WasRecording
+        cls.EventManager.IsTiming = cls.WasTiming
+
+        if (Result["BUSY"] > 0):
+            Result["THROUGHPUT"] = Result["EVENTS"] / Result["BUSY"]
+
+        for MethodID, Stats in cls.EventManager.HandlerStats.items():
+            Result["HANDLERS"][MethodID] = {
+                "CALLS":Stats["CALLS"],
+                "MEAN":Stats["TOTAL"] / Stats["CALLS"],
+                "MAX":Stats["MAX"],
+                "TOTAL":Stats["TOTAL"]
+            }
+
+        cls.Result = Result
+
+        cls.Console.WriteTags = {"RADGUI_EVENT_REPLAYER":1}
+        cls.Console.Write("(RADGUI_EVENT_REPLAYER) Replayed {} events in {:.3f}s ({:.1f} events/s while busy)".format(Result["EVENTS"],Result["ELAPSED"],Result["THROUGHPUT"]))
+        for MethodID, Stats in Result["HANDLERS"].items():
+            cls.Console.Write("-- {} - calls {} / mean {:.6f}s / max {:.6f}s".format(MethodID,Stats["CALLS"],Stats["MEAN"],Stats["MAX"]))
+
+        if (OnFinished != None):
+            try:
+                OnFinished(Result)
+            except:
+                cls.Console.Write("(RADGUI_EVENT_REPLAYER) Failed to report the replay result")
+
+#==================================================#
+#RAD GUI Application
+#==================================================#
+#Owns a private copy of every RADGUI service. Addons built on their own
+#RADGUI_APP never see each other's definitions, events or console
+#settings, and a dispatch only scans the owning addon's associations.
+class RADGUI_APP():
+
+    def __init__(self,Name: str) -> None:
+        self.Name: str = Name
+        self.Console: Any = RADGUI_CONSOLE.Spawn(Name)
+        self.Async: Any = RADGUI_ASYNC.Spawn(Name,{"Console":self.Console})
+        self.Recorder: Any = RADGUI_EVENT_RECORDER.Spawn(Name,{"Console":self.Console})
+        self.Profiler: Any = RADGUI_MEMORY_PROFILER.Spawn(Name,{"Console":self.Console})
+        self.EventManager: Any = RADGUI_EVENT_MANAGER.Spawn(Name,{"Console":self.Console,"Recorder":self.Recorder,"Async":self.Async,"Profiler":self.Profiler})
+        self.IPC: Any = RADGUI_IPC.Spawn(Name,{"Console":self.Console,"EventManager":self.EventManager})
+        self.EventManager.IPC = self.IPC
+        self.Replayer: Any = RADGUI_EVENT_REPLAYER.Spawn(Name,{"Console":self.Console,"EventManager":self.EventManager})
+        self.Icons: Any = RADGUI_ICONS.Spawn(Name,{"Console":self.Console})
+        self.Engine: Any = RADGUI_ENGINE.Spawn(Name,{"Console":self.Console,"Icons":self.Icons})
+        self.Lifecycle: Any = RADGUI_LIFECYCLE.Spawn(Name,{"Console":self.Console})
+        self.EnumCache: Any = RADGUI_ENUM_CACHE.Spawn(Name,{"Console":self.Console})
+        self.Computed: Any = RADGUI_COMPUTED.Spawn(Name,{"Console":self.Console,"EventManager":self.EventManager})
+        self.Sparse: Any = RADGUI_SPARSE.Spawn(Name,{"Console":self.Console})
+        self.Aggregator: Any = RADGUI_AGGREGATOR.Spawn(Name,{"Console":self.Console,"EventManager":self.EventManager})
+        self.Factory: Any = RADGUI_FACTORY.Spawn(Name,{"Console":self.Console,"Engine":self.Engine,"EventManager":self.EventManager,"Lifecycle":self.Lifecycle,"EnumCache":self.EnumCache,"Computed":self.Computed,"Sparse":self.Sparse,"Profiler":self.Profiler,"Aggregator":self.Aggregator,"Icons":self.Icons})
+
+    def LoadJSON(self,Input: str = "") -> bool:
+        return self.Factory.LoadJSON(Input)
+
+    def LoadBundle(self,Input: str,Workers: int = 0,UseProcesses: bool = False) -> bool:
+        return self.Factory.LoadBundle(Input,Workers,UseProcesses)
+
+    def Register(self,InputClasses: List[Any] = []) -> bool:
+        return self.Factory.Register(InputClasses)
+
+    def RegisterCompiled(self,CompiledClasses: List[Any],Config: List[Dict[str,Any]] = [],InputClasses: List[Any] = [],Routes: Dict[str,Dict[str,Any]] = {},Index: Dict[str,List[str]] = {}) -> bool:
+        return self.Factory.RegisterCompiled(CompiledClasses,Config,InputClasses,Routes,Index)
+
+    def Unregister(self) -> bool:
+        return self.Factory.Unregister()
+
+    def HandleEvent(self,InputEvent: Dict[str, Any]) -> Dict[str, Any]:
+        return self.EventManager.HandleEvent(InputEvent)
+
+#==================================================#
+#Default Wiring
+#==================================================#
+#The module level classes double as the process-wide default instance
+RADGUI_PROPERTYGROUP_SHELL.EventManager = RADGUI_EVENT_MANAGER
+RADGUI_PROPERTYGROUP_SHELL.EnumCache = RADGUI_ENUM_CACHE
+RADGUI_PROPERTYGROUP_SHELL.Computed = RADGUI_COMPUTED
+RADGUI_PROPERTYGROUP_SHELL.Sparse = RADGUI_SPARSE
+RADGUI_PROPERTYGROUP_SHELL.Aggregator = RADGUI_AGGREGATOR
+RADGUI_OPERATOR_SHELL.EventManager = RADGUI_EVENT_MANAGER
+RADGUI_OPERATOR_SHELL.Console = RADGUI_CONSOLE
+RADGUI_PANEL_SHELL.Engine = RADGUI_ENGINE
+RADGUI_PANEL_SHELL.Profiler = RADGUI_MEMORY_PROFILER
+RADGUI_ENGINE.Console = RADGUI_CONSOLE
+RADGUI_ENGINE.Icons = RADGUI_ICONS
+RADGUI_ICONS.Console = RADGUI_CONSOLE
+RADGUI_FACTORY.Console = RADGUI_CONSOLE
+RADGUI_FACTORY.Engine = RADGUI_ENGINE
+RADGUI_FACTORY.EventManager = RADGUI_EVENT_MANAGER
+RADGUI_FACTORY.Lifecycle = RADGUI_LIFECYCLE
+RADGUI_FACTORY.EnumCache = RADGUI_ENUM_CACHE
+RADGUI_FACTORY.Computed = RADGUI_COMPUTED
+RADGUI_FACTORY.Sparse = RADGUI_SPARSE
+RADGUI_FACTORY.Profiler = RADGUI_MEMORY_PROFILER
+RADGUI_FACTORY.Aggregator = RADGUI_AGGREGATOR
+RADGUI_FACTORY.Icons = RADGUI_ICONS
+RADGUI_ENUM_CACHE.Console = RADGUI_CONSOLE
+RADGUI_COMPUTED.Console = RADGUI_CONSOLE
+RADGUI_COMPUTED.EventManager = RADGUI_EVENT_MANAGER
+RADGUI_AGGREGATOR.Console = RADGUI_CONSOLE
+RADGUI_AGGREGATOR.EventManager = RADGUI_EVENT_MANAGER
+RADGUI_SPARSE.Console = RADGUI_CONSOLE
+RADGUI_LIFECYCLE.Console = RADGUI_CONSOLE
+RADGUI_EVENT_MANAGER.Console = RADGUI_CONSOLE
+RADGUI_EVENT_MANAGER.Recorder = RADGUI_EVENT_RECORDER
+RADGUI_EVENT_MANAGER.Async = RADGUI_ASYNC
+RADGUI_EVENT_MANAGER.IPC = RADGUI_IPC
+RADGUI_EVENT_MANAGER.Profiler = RADGUI_MEMORY_PROFILER
+RADGUI_MEMORY_PROFILER.Console = RADGUI_CONSOLE
+RADGUI_IPC.Console = RADGUI_CONSOLE
+RADGUI_IPC.EventManager = RADGUI_EVENT_MANAGER
+RADGUI_ASYNC.Console = RADGUI_CONSOLE
+RADGUI_EVENT_RECORDER.Console = RADGUI_CONSOLE
+RADGUI_EVENT_REPLAYER.Console = RADGUI_CONSOLE
+RADGUI_EVENT_REPLAYER.EventManager = RADGUI_EVENT_MANAGER
@@ -0,0 +1,473 @@
+import json, sys, os, py_compile
+from typing import List, Dict, Any
+
+from . import RADGUI_FACTORY, RADGUI_ENGINE, RADGUI_CONSOLE, RADGUI_EVENT_MANAGER, RADGUI_BATCH_OPERATOR_SHELL
+
+#==================================================#
+#RAD GUI Compiler
+#==================================================#
+#GOAL:
+#   Turn a RADGUI JSON definition into a plain python module holding the
+#   same classes RADGUI_FACTORY.Register would have built at runtime, so
+#   an addon can skip JSON parsing, class synthesis and the Content
+#   interpreter on every enable.
+#
+#USAGE:
+#   Needs bpy to be importable (Blender's python or the bpy module)
+#   python -m RADGUI.compiler <INPUT.json> <OUTPUT.py> [--package RADGUI] [--prefix NAME] [--pyc]
+#
+#   The generated module exposes register() / unregister() and can be
+#   shipped as .py or .pyc
+#
+#   Generated class names start with the prefix (the output file name by
+#   default), so two compiled addons don't register panels over each other.
+#   Event associations are merged and indexed by EVENT_TYPE here, register()
+#   only looks up the handler methods they name.
+#==================================================#
+
+#Already python source, Literal leaves it as is
+class RADGUI_COMPILER_SOURCE(str):
+    def __repr__(self) -> str:
+        return str(self)
+
+class RADGUI_COMPILER():
+
+    #Python source for a JSON value, JSON only ever holds python literals
+    @classmethod
+    def Literal(cls,Input: Any) -> str:
+        return repr(Input)
+
+    #icon_value argument - a CUSTOM_ICON is only given a value once its preview exists, so look it up when drawing
+    @classmethod
+    def IconValue(cls,Attributes: Dict[str, Any]) -> str:
+        if (Attributes["CUSTOM_ICON"] != ""):
+            return "self.Engine.Icons.Value({})".format(cls.Literal(Attributes["CUSTOM_ICON"]))
+        return cls.Literal(Attributes["ICON_VALUE"])
+
+    @classmethod
+    def CompileProperties(cls,ClassName: str,Input: Dict[str,Any],Built: Any) -> List[str]:
+
+        Result: List[str] = []
+        ContentIndex: Dict[str,Any] = {}
+        CurrentName: str = ""
+        CurrentType: str = ""
+        Params: Dict[str,Any] = {}
+        PropertyType: str = ""
+        Arguments: Dict[str,Any] = {}
+        Argument: str = ""
+
+        Result.append("class {}(RADGUI_PROPERTYGROUP_SHELL):".format(ClassName))
+        Result.append("    Domain = {}".format(cls.Literal(Built.Domain)))
+        Result.append("    Scope = {}".format(cls.Literal(Built.Scope)))
+        if (Built.Aggregate == True):
+            Result.append("    Aggregate = True")
+        if (Built.ComputedNodes != []):
+            Result.append("    ComputedNodes = {}".format(cls.Literal(Built.ComputedNodes)))
+        if (Built.Scope == "SPARSE"):
+            Result.append("    RADGUI_OWNER: PointerProperty(type=bpy.types.Object)")
+
+        #Same filtering as RADGUI_FACTORY.BuildProperties
+        for ContentIndex in Input["CONTENT"]:
+
+            if("NAME" not in ContentIndex) or ("TYPE" not in ContentIndex):
+                continue
+            elif (ContentIndex["NAME"].strip() == "") or (ContentIndex["TYPE"].strip() == ""):
+                continue
+
+            CurrentName = ContentIndex["NAME"]
+            CurrentType = ContentIndex["TYPE"].upper()
+            Params = RADGUI_FACTORY.PropertyParams(CurrentType,ContentIndex)
+
+            if (Params == {}):
+                continue
+
+            if (CurrentName.isidentifier() == False):
+                raise ValueError("Property name \"{}\" in domain \"{}\" is not a valid identifier".format(CurrentName,Built.Domain))
+
+            PropertyType, Arguments = RADGUI_FACTORY.PropertyArguments(CurrentType,Params)
+
+            #Dynamic enum items are a callback, rebuild it from its parameters instead
+            if ("items" in Arguments) and callable(Arguments["items"]):
+                Arguments["items"] = RADGUI_COMPILER_SOURCE("RADGUI_ENUM_CACHE.Callback({},{},{},{})".format(
+                    cls.Literal(Params["NAME"]),
+                    cls.Literal(str(Params["ITEMS_HANDLER"]).strip()),
+                    cls.Literal(list(Params["DEPENDS"])),
+                    cls.Literal(float(Params["TTL"]))
+                ))
+
+            Argument = "update=lambda Part1,Part2: RADGUI_PROPERTYGROUP_SHELL.PropertyUpdate(Part1,Part2,{})".format(cls.Literal(CurrentName))
+            Argument += "".join(", {}={}".format(Key,cls.Literal(Value)) for Key, Value in Arguments.items())
+            Result.append("    {}: {}({})".format(CurrentName,PropertyType,Argument))
+
+        return Result
+
+    @classmethod
+    def CompileOperator(cls,ClassName: str,Built: Any) -> List[str]:
+
+        Result: List[str] = []
+
+        if issubclass(Built,RADGUI_BATCH_OPERATOR_SHELL):
+            Result.append("class {}(RADGUI_BATCH_OPERATOR_SHELL):".format(ClassName))
+            Result.append("    ItemSource = {}".format(cls.Literal(Built.ItemSource)))
+            Result.append("    ChunkSize = {}".format(cls.Literal(Built.ChunkSize)))
+            Result.append("    TimeBudget = {}".format(cls.Literal(Built.TimeBudget)))
+        else:
+            Result.append("class {}(RADGUI_OPERATOR_SHELL):".format(ClassName))
+        Result.append("    bl_idname = {}".format(cls.Literal(Built.bl_idname)))
+        Result.append("    bl_label = {}".format(cls.Literal(Built.bl_label)))
+        Result.append("    EventID: StringProperty(name='Event_ID')")
+
+        return Result
+
+    @classmethod
+    def CompilePanel(cls,ClassName: str,Built: Any) -> List[str]:
+
+        Result: List[str] = []
+
+        Result.append("class {}(RADGUI_PANEL_SHELL):".format(ClassName))
+        Result.append("    bl_space_type = {}".format(cls.Literal(Built.bl_space_type)))
+        Result.append("    bl_region_type = {}".format(cls.Literal(Built.bl_region_type)))
+        Result.append("    bl_label = {}".format(cls.Literal(Built.bl_label)))
+        #An empty Content makes the shell use CompiledDraw
+        Result.append("    Content = []")
+        Result.append("")
+        Result.append("    def CompiledDraw(self,Context) -> None:")
+        Result.extend("        " + x for x in cls.CompileDraw(Built.Content))
+
+        return Result
+
+    #Unrolls RADGUI_ENGINE.Draw over a fixed instruction list
+    @classmethod
+    def CompileDraw(cls,Instructions: List[Dict[str, Any]]) -> List[str]:
+
+        Result: List[str] = ["Layout = self.layout","Row = None","Column = None","ContextObject = None"]
+        #Draw's context state machine only depends on the instruction order, so it can be walked here
+        LastContext: str = "LAYOUT"
+        CurrentContext: str = ""
+        HasRow: bool = False
+        HasColumn: bool = False
+        CurrentType: str = ""
+        CurrentInstruction: Dict[str, Any] = {}
+        Attributes: Dict[str, Any] = {}
+        Data: str = ""
+        Target: str = ""
+
+        for CurrentInstruction in Instructions:
+
+            if "CONTEXT" not in CurrentInstruction:
+                CurrentContext = LastContext.upper()
+            else:
+                CurrentContext = str(CurrentInstruction["CONTEXT"]).upper()
+
+            if CurrentContext == "LAYOUT":
+                Result.append("ContextObject = Layout")
+                LastContext = "LAYOUT"
+
+            elif CurrentContext == "ROW":
+                Result.append("ContextObject = Row" if HasRow == True else "ContextObject = Layout.row()")
+                LastContext = "ROW"
+
+            elif CurrentContext == "COLUMN":
+                Result.append("ContextObject = Column" if HasColumn == True else "ContextObject = Layout.column()")
+                LastContext = "COLUMN"
+
+            if "TYPE" not in CurrentInstruction:
+                continue
+
+            CurrentType = str(CurrentInstruction["TYPE"]).upper()
+
+            if (CurrentType == "ROW") or (CurrentType == "COLUMN"):
+
+                Attributes = {
+                    "ALIGN":False,
+                    "SAVE":False
+                }
+
+                if "ALIGN" in CurrentInstruction:
+                    Attributes["ALIGN"] = CurrentInstruction["ALIGN"]
+                if "SAVE" in CurrentInstruction:
+                    Attributes["SAVE"] = CurrentInstruction["SAVE"]
+
+                Target = ""
+                if Attributes["SAVE"] == True:
+                    if CurrentType == "ROW":
+                        Target = "Row = "
+                        HasRow = True
+                    else:
+                        Target = "Column = "
+                        HasColumn = True
+
+                Result.append("{}ContextObject.{}(align={})".format(Target,CurrentType.lower(),cls.Literal(Attributes["ALIGN"])))
+
+            elif CurrentType == "OPERATOR":
+
+                Attributes = RADGUI_ENGINE.ParseOperator(CurrentInstruction)
+                if (Attributes == {}):
+                    continue
+
+                Result.append("Action = ContextObject.operator({}, text={}, text_ctxt={}, translate={}, icon={}, emboss={}, depress={}, icon_value={})".format(
+                    cls.Literal(Attributes["CLASS"]),
+                    cls.Literal(Attributes["TEXT"]),
+                    cls.Literal(Attributes["TEXT_CTXT"]),
+                    cls.Literal(Attributes["TRANSLATE"]),
+                    cls.Literal(Attributes["ICON"]),
+                    cls.Literal(Attributes["EMBOSS"]),
+                    cls.Literal(Attributes["DEPRESS"]),
+                    cls.IconValue(Attributes)
+                ))
+                if (Attributes["EVENT_ID"] != ""):
+                    Result.append("Action.EventID = {}".format(cls.Literal(Attributes["EVENT_ID"])))
+
+            elif CurrentType == "LABEL":
+
+                Attributes = RADGUI_ENGINE.ParseLabel(CurrentInstruction)
+                if (Attributes == {}):
+                    continue
+
+                #Line breaks depend on the region width, so those are left to the engine at draw time
+                if (Attributes["WRAP"] == True):
+                    Result.append("self.Engine.WriteWrappedLabel(ContextObject, Context, {})".format(cls.Literal(Attributes)))
+                    continue
+
+                Result.append("ContextObject.label(text={}, text_ctxt={}, translate={}, icon={}, icon_value={})".format(
+                    cls.Literal(Attributes["TEXT"]),
+                    cls.Literal(Attributes["TEXT_CTXT"]),
+                    cls.Literal(Attributes["TRANSLATE"]),
+                    cls.Literal(Attributes["ICON"]),
+                    cls.IconValue(Attributes)
+                ))
+
+            elif CurrentType == "PROPERTY":
+
+                Attributes = RADGUI_ENGINE.ParseProperty(CurrentInstruction)
+                if (Attributes == {}):
+                    continue
+
+                Data = "getattr(Context.{},{})".format(Attributes["VARIABLE"][0].lower(),cls.Literal(Attributes["VARIABLE"][1]))
+                #Sparse domains hand out a view for objects without values, draw the defaults for those
+                if (Attributes["VARIABLE"][0] == "OBJECT"):
+                    Data = "RADGUI_SPARSE_VIEW.Drawable(" + Data + ")"
+
+                #The domain is only known to exist once its group is registered, so keep the draw-time check
+                Result.append("if hasattr(bpy.types.{},{}):".format(Attributes["VARIABLE"][0].title(),cls.Literal(Attributes["VARIABLE"][1])))
+                Result.append("    ContextObject.prop({}, {}, text={}, text_ctxt={}, translate={}, icon={}, expand={}, slider={}, toggle={}, icon_only={}, event={}, full_event={}, emboss={}, index={}, icon_value={}, invert_checkbox={})".format(
+                    Data,
+                    cls.Literal(Attributes["VARIABLE"][2]),
+                    cls.Literal(Attributes["TEXT"]),
+                    cls.Literal(Attributes["TEXT_CTXT"]),
+                    cls.Literal(Attributes["TRANSLATE"]),
+                    cls.Literal(Attributes["ICON"]),
+                    cls.Literal(Attributes["EXPAND"]),
+                    cls.Literal(Attributes["SLIDER"]),
+                    cls.Literal(Attributes["TOGGLE"]),
+                    cls.Literal(Attributes["ICON_ONLY"]),
+                    cls.Literal(Attributes["EVENT"]),
+                    cls.Literal(Attributes["FULL_EVENT"]),
+                    cls.Literal(Attributes["EMBOSS"]),
+                    cls.Literal(Attributes["INDEX"]),
+                    cls.IconValue(Attributes),
+                    cls.Literal(Attributes["INVERT_CHECKBOX"])
+                ))
+
+        return Result
+
+    #Event routing table - what AddEvent and BuildIndex leave behind for the associations in Config
+    @classmethod
+    def CompileRoutes(cls,Config: List[Dict[str,Any]]) -> Any:
+
+        Manager: Any = RADGUI_EVENT_MANAGER.Spawn("RADGUI_COMPILER",{"Console":RADGUI_CONSOLE})
+        Routes: Dict[str,Dict[str,Any]] = {}
+        ConfigIndex: Dict[str,Any] = {}
+        MethodIndex: str = ""
+        Association: Any = None
+
+        for ConfigIndex in Config:
+
+            if ("EVENTS" not in ConfigIndex) or ("ASSOCIATIONS" not in ConfigIndex["EVENTS"]):
+                continue
+
+            #Same order and shapes as RADGUI_FACTORY.ApplyConfig
+            for MethodIndex in ConfigIndex["EVENTS"]["ASSOCIATIONS"]:
+
+                Association = ConfigIndex["EVENTS"]["ASSOCIATIONS"][MethodIndex]
+                if (isinstance(Association,dict) == True):
+                    Association = Association.get("EVENTS",[])
+
+                if (MethodIndex.strip() == "") or (len(Association) == 0):
+                    continue
+
+                if (MethodIndex not in Manager.RegisteredEvents):
+                    Manager.RegisteredEvents[MethodIndex] = {"TARGETS":[],"EVENTS":[],"REQUESTS":[]}
+
+                Manager.RegisteredEvents[MethodIndex]["REQUESTS"] = Manager.RegisteredEvents[MethodIndex]["REQUESTS"] + list(Association)
+                Manager.RegisteredEvents[MethodIndex]["EVENTS"] = Manager.MergeEvents(Manager.RegisteredEvents[MethodIndex]["EVENTS"],Association)
+
+        Manager.BuildIndex()
+
+        for MethodIndex in Manager.RegisteredEvents:
+            Routes[MethodIndex] = {
+                "EVENTS":Manager.RegisteredEvents[MethodIndex]["EVENTS"],
+                "REQUESTS":Manager.RegisteredEvents[MethodIndex]["REQUESTS"]
+            }
+
+        return Routes, Manager.DispatchIndex
+
+    @classmethod
+    def Compile(cls,JSONContent: Dict[str,Any],Package: str = "RADGUI",Source: str = "",Prefix: str = "") -> str:
+
+        RADGUI_CONSOLE.WriteTags = {"RADGUI_COMPILER":1}
+
+        Prefix = RADGUI_FACTORY.MakePrefix(Prefix)
+
+        Result: List[str] = []
+        ClassLines: List[str] = []
+        ClassNames: List[str] = []
+        Config: List[Dict[str,Any]] = []
+        ContentIndex: str = ""
+        CurrentEntry: Dict[str,Any] = {}
+        CurrentType: str = ""
+        ClassName: str = ""
+        Built: Any = None
+        Routes: Dict[str,Dict[str,Any]] = {}
+        Index: Dict[str,List[str]] = {}
+
+        #Panels get their components expanded by BuildPanel, same as at runtime
+        RADGUI_FACTORY.LoadComponents(JSONContent)
+
+        #Walk the definitions in the same order as RADGUI_FACTORY.Register
+        for ContentIndex in JSONContent:
+
+            CurrentEntry = JSONContent[ContentIndex]
+
+            if "TYPE" not in CurrentEntry:
+                continue
+
+            CurrentType = str(CurrentEntry["TYPE"]).upper()
+
+            #Build with the runtime factory so validation is identical, then read the result back out
+            if (CurrentType == "CONFIG") or (CurrentType == "CONFIGURATION") or (CurrentType == "SETTINGS"):
+                Config.append(CurrentEntry)
+                continue
+
+            elif (CurrentType == "COMPONENT"):
+                continue
+
+            elif (CurrentType == "PANEL"):
+                Built = RADGUI_FACTORY.BuildPanel(CurrentEntry)
+                ClassName = Prefix + "PANEL_PT_" + str(len(ClassNames)) + "_DYNAMIC"
+                if (Built != None):
+                    ClassLines = cls.CompilePanel(ClassName,Built)
+
+            elif (CurrentType == "PROPERTIES"):
+                Built = RADGUI_FACTORY.BuildProperties(CurrentEntry)
+                ClassName = Prefix + "PROPERTIES_" + str(len(ClassNames)) + "_DYNAMIC"
+                if (Built != None):
+                    ClassLines = cls.CompileProperties(ClassName,CurrentEntry,Built)
+
+            elif (CurrentType == "OPERATOR"):
+                Built = RADGUI_FACTORY.BuildOperator(CurrentEntry)
+                ClassName = Prefix + "OPERATOR_OT_" + str(len(ClassNames)) + "_DYNAMIC"
+                if (Built != None):
+                    ClassLines = cls.CompileOperator(ClassName,Built)
+
+            else:
+                RADGUI_CONSOLE.WriteTags = {"RADGUI_COMPILER":1}
+                RADGUI_CONSOLE.Write("(RADGUI_COMPILER) Failed to understand type - \"" + CurrentType + "\"")
+                continue
+
+            if (Built == None):
+                continue
+
+            ClassNames.append(ClassName)
+            Result.extend(ClassLines)
+            Result.append("")
+
+        Routes, Index = cls.CompileRoutes(Config)
+
+        Header: List[str] = [
+            "#Generated by the RADGUI compiler" + ((" from \"" + Source + "\"") if Source != "" else "") + " - do not edit",
+            "import bpy, os",
+            "from bpy.props import StringProperty, IntProperty, FloatProperty, BoolProperty, EnumProperty, PointerProperty",
+            #Package may be relative (".RADGUI") when RADGUI is vendored inside the addon
+            "from {} import RADGUI_PROPERTYGROUP_SHELL, RADGUI_OPERATOR_SHELL, RADGUI_BATCH_OPERATOR_SHELL, RADGUI_PANEL_SHELL, RADGUI_FACTORY, RADGUI_ENUM_CACHE, RADGUI_SPARSE_VIEW".format(Package),
+            "",
+            ""
+        ]
+
+        Footer: List[str] = [
+            "CLASSES = [" + ", ".join(ClassNames) + "]",
+            "",
+            "#Configuration, applied at register time",
+            "CONFIG = " + cls.Literal(Config),
+            "",
+            "#Event routing - merged criteria per handler and the EVENT_TYPE index, only the handlers are looked up at register time",
+            "ROUTES = " + cls.Literal(Routes),
+            "INDEX = " + cls.Literal(Index),
+            "",
+            "#Pass a RADGUI_APP's Factory to register into that instance instead of the default one",
+            "def register(InputClasses = [],Factory = RADGUI_FACTORY) -> bool:",
+            #Relative paths in the config (ICONS) are shipped alongside the generated module
+            "    Factory.BasePath = os.path.dirname(os.path.abspath(__file__))",
+            "    return Factory.RegisterCompiled(CLASSES,CONFIG,InputClasses,ROUTES,INDEX)",
+            "",
+            "def unregister(Factory = RADGUI_FACTORY) -> bool:",
+            "    return Factory.Unregister()",
+            ""
+        ]
+
+        return "\n".join(Header + Result + Footer)
+
+    @classmethod
+    def CompileFile(cls,Input: str,Output: str,Package: str = "RADGUI",WriteBytecode: bool = False,Prefix: str = "") -> bool:
+
+        Result: bool = False
+        JSONContent: Dict[str,Any] = {}
+
+        with open(Input,"r") as fileInput:
+            JSONContent = json.load(fileInput,object_pairs_hook=RADGUI_FACTORY.InternPairs)
+
+        #Each generated module is its own addon, name its classes after it
+        if (Prefix.strip() == ""):
+            Prefix = os.path.splitext(os.path.basename(Output))[0]
+
+        with open(Output,"w") as fileOutput:
+            fileOutput.write(cls.Compile(JSONContent,Package,Input,Prefix))
+
+        if (WriteBytecode == True):
+            py_compile.compile(Output,doraise=True)
+
+        Result = True
+        return Result
+
+def main(Arguments: List[str] = []) -> int:
+
+    Package: str = "RADGUI"
+    Prefix: str = ""
+    WriteBytecode: bool = False
+    Positional: List[str] = []
+    Index: int = 0
+
+    while (Index < len(Arguments)):
+        if (Arguments[Index] == "--package") and (Index + 1 < len(Arguments)):
+            Package = Arguments[Index + 1]
+            Index += 1
+        elif (Arguments[Index] == "--prefix") and (Index + 1 < len(Arguments)):
+            Prefix = Arguments[Index + 1]
+            Index += 1
+        elif (Arguments[Index] == "--pyc"):
+            WriteBytecode = True
+        else:
+            Positional.append(Arguments[Index])
+        Index += 1
+
+    if (len(Positional) != 2):
+        print("usage: python -m RADGUI.compiler <INPUT.json> <OUTPUT.py> [--package RADGUI] [--prefix NAME] [--pyc]")
+        return 2
+
+    if (RADGUI_COMPILER.CompileFile(Positional[0],Positional[1],Package,WriteBytecode,Prefix) == False):
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
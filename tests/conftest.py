@@ -0,0 +1,124 @@
+#==================================================#
+#Test Setup
+#==================================================#
+#RADGUI needs bpy, which only exists inside Blender. This stands in a
+#minimal fake of the parts RADGUI touches, then loads the repository as
+#the RADGUI package so the tests can run under plain pytest.
+import sys, os, types, importlib.util
+
+from typing import List, Dict, Any
+
+#==================================================#
+#Fake bpy
+#==================================================#
+class FAKE_TIMERS():
+    Registered: List[Any] = []
+
+    @classmethod
+    def register(cls,Function: Any,first_interval: float = 0.0,persistent: bool = False) -> None:
+        if (Function not in cls.Registered):
+            cls.Registered.append(Function)
+
+    @classmethod
+    def unregister(cls,Function: Any) -> None:
+        if (Function not in cls.Registered):
+            raise ValueError("timer not registered")
+        cls.Registered.remove(Function)
+
+    @classmethod
+    def is_registered(cls,Function: Any) -> bool:
+        return Function in cls.Registered
+
+    #Runs every timer once, like a single tick of Blender's event loop
+    @classmethod
+    def Tick(cls) -> None:
+
+        Function: Any = None
+
+        for Function in list(cls.Registered):
+            if (Function in cls.Registered) and (Function() == None):
+                if (Function in cls.Registered):
+                    cls.Registered.remove(Function)
+
+class FAKE_UTILS():
+    Registered: List[Any] = []
+
+    @classmethod
+    def register_class(cls,Class: Any) -> None:
+        cls.Registered.append(Class)
+        if hasattr(Class,"register"):
+            Class.register()
+
+    @classmethod
+    def unregister_class(cls,Class: Any) -> None:
+        cls.Registered.remove(Class)
+        if hasattr(Class,"unregister"):
+            Class.unregister()
+
+class FAKE_ID():
+    def __init__(self,Name: str) -> None:
+        self.name: str = Name
+
+    def as_pointer(self) -> int:
+        return id(self)
+
+#bpy.data collections iterate over their values and look up by name
+class FAKE_COLLECTION(dict):
+    def __iter__(self) -> Any:
+        return iter(list(self.values()))
+
+def FakeProperty(Name: str) -> Any:
+    return lambda **Arguments: (Name,Arguments)
+
+def BuildFakeBpy() -> Any:
+
+    Bpy: Any = types.ModuleType("bpy")
+    Props: Any = types.ModuleType("bpy.props")
+    Types: Any = types.ModuleType("bpy.types")
+    Utils: Any = types.ModuleType("bpy.utils")
+    Previews: Any = types.ModuleType("bpy.utils.previews")
+    Name: str = ""
+
+    for Name in ["StringProperty","IntProperty","FloatProperty","BoolProperty","EnumProperty","PointerProperty","CollectionProperty"]:
+        setattr(Props,Name,FakeProperty(Name))
+
+    for Name in ["Operator","PropertyGroup","Panel","WindowManager"]:
+        setattr(Types,Name,type(Name,(),{}))
+    Types.Scene = type("Scene",(FAKE_ID,),{})
+    Types.Object = type("Object",(FAKE_ID,),{})
+
+    Utils.register_class = FAKE_UTILS.register_class
+    Utils.unregister_class = FAKE_UTILS.unregister_class
+    Utils.Registered = FAKE_UTILS.Registered
+    Utils.previews = Previews
+    Previews.new = lambda: {}
+    Previews.remove = lambda Collection: None
+
+    Bpy.props = Props
+    Bpy.types = Types
+    Bpy.utils = Utils
+    Bpy.app = types.SimpleNamespace(
+        timers = FAKE_TIMERS,
+        handlers = types.SimpleNamespace(save_pre = [],persistent = lambda Function: Function),
+        translations = types.SimpleNamespace(pgettext_iface = lambda Text,Context = None: Text)
+    )
+    Bpy.data = types.SimpleNamespace(objects = FAKE_COLLECTION(),scenes = FAKE_COLLECTION())
+    Bpy.context = types.SimpleNamespace(scene = None,object = None,region = None)
+
+    return Bpy
+
+Bpy: Any = BuildFakeBpy()
+sys.modules["bpy"] = Bpy
+sys.modules["bpy.props"] = Bpy.props
+sys.modules["bpy.types"] = Bpy.types
+sys.modules["bpy.utils"] = Bpy.utils
+sys.modules["bpy.utils.previews"] = Bpy.utils.previews
+
+#==================================================#
+#RADGUI package
+#==================================================#
+Root: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+Spec: Any = importlib.util.spec_from_file_location("RADGUI",os.path.join(Root,"__init__.py"),submodule_search_locations=[Root])
+Package: Any = importlib.util.module_from_spec(Spec)
+sys.modules["RADGUI"] = Package
+Spec.loader.exec_module(Package)
@@ -0,0 +1,64 @@
+import types
+import bpy, RADGUI
+
+from typing import List, Dict, Any
+
+class AGGREGATE_HANDLER():
+    Events: List[Dict[str, Any]] = []
+
+    @classmethod
+    def OnEvent(cls,InputEvent: Dict[str, Any]) -> None:
+        cls.Events.append(InputEvent)
+
+def BuildObject(Name: str,Value: float) -> Any:
+
+    Object: Any = bpy.types.Object(Name)
+
+    Object.AGGREGATE_VALUES = types.SimpleNamespace(Domain="AGGREGATE_VALUES",SCALE=Value,id_data=Object)
+    bpy.data.objects[Name] = Object
+    return Object
+
+def test_groups_are_looked_up_again_on_flush() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("AGGREGATOR_TEST")
+    App.Console.OutputFilter = {"NONE":0}
+    MethodID: str = "test_aggregator.AGGREGATE_HANDLER.OnEvent"
+    Objects: List[Any] = [BuildObject(x,1.0) for x in ["A","B","C"]]
+
+    AGGREGATE_HANDLER.Events = []
+    App.EventManager.AddEvent(MethodID,[{"EVENT_ID":"SCALE"}])
+
+    try:
+        for Object in Objects:
+            assert App.Aggregator.Buffer(Object.AGGREGATE_VALUES,bpy.context,"SCALE") == True
+
+        #One deleted, one renamed and given a new group before the tick
+        del bpy.data.objects["C"]
+        del bpy.data.objects["B"]
+        Objects[1].name = "B.001"
+        Objects[1].AGGREGATE_VALUES = types.SimpleNamespace(Domain="AGGREGATE_VALUES",SCALE=2.0,id_data=Objects[1])
+        bpy.data.objects["B.001"] = Objects[1]
+
+        bpy.app.timers.Tick()
+        assert len(AGGREGATE_HANDLER.Events) == 1
+        assert AGGREGATE_HANDLER.Events[0]["EVENT_TYPE"] == "VARIABLE_MULTI_CHANGED"
+        assert AGGREGATE_HANDLER.Events[0]["DOMAIN"] == "AGGREGATE_VALUES"
+        assert AGGREGATE_HANDLER.Events[0]["OBJECTS"] == Objects[:2]
+        assert AGGREGATE_HANDLER.Events[0]["VALUES"] == [1.0,2.0]
+
+        #A single change has the same DOMAIN field
+        App.Aggregator.Buffer(Objects[0].AGGREGATE_VALUES,bpy.context,"SCALE")
+        bpy.app.timers.Tick()
+        assert AGGREGATE_HANDLER.Events[1]["EVENT_TYPE"] == "VARIABLE_CHANGED"
+        assert AGGREGATE_HANDLER.Events[1]["DOMAIN"] == "AGGREGATE_VALUES"
+
+        #Clearing takes a pending flush back
+        App.Aggregator.Buffer(Objects[0].AGGREGATE_VALUES,bpy.context,"SCALE")
+        App.Aggregator.Clear()
+        assert App.Aggregator.IsScheduled == False
+        assert bpy.app.timers.Registered == []
+
+    finally:
+        App.EventManager.RemoveEvent(MethodID,[{"EVENT_ID":"SCALE"}])
+        App.Aggregator.Clear()
+        bpy.data.objects.clear()
@@ -0,0 +1,88 @@
+import bpy, RADGUI
+
+from typing import List, Dict, Any
+
+class FIRST_HANDLER():
+    Events: List[Dict[str, Any]] = []
+
+    @classmethod
+    def OnEvent(cls,InputEvent: Dict[str, Any]) -> None:
+        cls.Events.append(InputEvent)
+
+class SECOND_HANDLER():
+    Events: List[Dict[str, Any]] = []
+
+    @classmethod
+    def OnEvent(cls,InputEvent: Dict[str, Any]) -> None:
+        cls.Events.append(InputEvent)
+
+#The same addon layout, only the handler and the names differ
+def Definition(Handler: str,Domain: str,Filter: Dict[str, int]) -> Dict[str, Any]:
+    return {
+        "SETTINGS":{
+            "TYPE":"CONFIG",
+            "CONSOLE_FILTER":Filter,
+            "EVENTS":{"ASSOCIATIONS":{"test_app." + Handler + ".OnEvent":[{"EVENT_ID":"RUN"}]}}
+        },
+        "VALUES":{"TYPE":"PROPERTIES","DOMAIN":Domain,"CONTENT":[{"NAME":"COUNT","TYPE":"INTEGER","DEFAULT":1}]},
+        "RUN":{"TYPE":"OPERATOR","DOMAIN":Domain.lower(),"CLASS":"run","TEXT":"Run"},
+        "MAIN":{"TYPE":"PANEL","LABEL":"Main","SPACE":"VIEW_3D","REGION":"UI","CONTENT":[{"TYPE":"OPERATOR","CLASS":Domain.lower() + ".run","EVENT_ID":"RUN"}]}
+    }
+
+def Registered(Prefix: str) -> List[Any]:
+    return [x for x in bpy.utils.Registered if x.__name__.startswith(Prefix)]
+
+def Press(App: Any) -> None:
+
+    Operator: Any = [x for x in App.Factory.DynamicClasses if hasattr(x,"bl_idname")][0]()
+
+    Operator.EventID = "RUN"
+    Operator.execute(bpy.context)
+
+def test_two_apps_share_nothing() -> None:
+
+    First: Any = RADGUI.RADGUI_APP("APP_FIRST")
+    Second: Any = RADGUI.RADGUI_APP("APP_SECOND")
+
+    FIRST_HANDLER.Events = []
+    SECOND_HANDLER.Events = []
+    First.Factory.JSONContent = Definition("FIRST_HANDLER","APP_FIRST_VALUES",{"NONE":0})
+    Second.Factory.JSONContent = Definition("SECOND_HANDLER","APP_SECOND_VALUES",{"APP":2})
+
+    try:
+        assert First.Register() == True
+        assert Second.Register() == True
+
+        #Own classes, each bound to its own services
+        assert len(Registered("APP_FIRST_")) == 3
+        assert len(Registered("APP_SECOND_")) == 3
+        assert all(x.EventManager is First.EventManager for x in Registered("APP_FIRST_")) == True
+        assert all(x.EventManager is Second.EventManager for x in Registered("APP_SECOND_")) == True
+
+        #Own handlers, the same EVENT_ID only reaches the app that raised it
+        Press(First)
+        assert (len(FIRST_HANDLER.Events),len(SECOND_HANDLER.Events)) == (1,0)
+        Press(Second)
+        assert (len(FIRST_HANDLER.Events),len(SECOND_HANDLER.Events)) == (1,1)
+        assert list(First.EventManager.RegisteredEvents) == ["test_app.FIRST_HANDLER.OnEvent"]
+        assert RADGUI.RADGUI_EVENT_MANAGER.RegisteredEvents == {}
+
+        #Own console settings
+        assert First.Console.OutputFilter == {"NONE":0}
+        assert Second.Console.OutputFilter == {"APP":2}
+        assert RADGUI.RADGUI_CONSOLE.OutputFilter == {}
+
+        #Taking one down leaves the other standing
+        First.Unregister()
+        assert Registered("APP_FIRST_") == []
+        assert len(Registered("APP_SECOND_")) == 3
+        assert hasattr(bpy.types.Scene,"APP_SECOND_VALUES") == True
+        Press(Second)
+        assert len(SECOND_HANDLER.Events) == 2
+
+    finally:
+        First.Unregister()
+        Second.Unregister()
+
+    assert Registered("APP_SECOND_") == []
+    assert Second.EventManager.RegisteredEvents == {}
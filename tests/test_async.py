@@ -0,0 +1,90 @@
+import asyncio, time
+import bpy, RADGUI
+
+from typing import List, Dict, Any
+
+class ASYNC_HANDLER():
+    Started: List[Any] = []
+    Finished: List[Any] = []
+    Cancelled: List[Any] = []
+
+    @classmethod
+    async def OnEvent(cls,InputEvent: Dict[str, Any]) -> None:
+
+        cls.Started.append(InputEvent["VALUE"])
+        try:
+            #Stands in for I/O, takes a few ticks
+            await asyncio.sleep(0.02)
+        except asyncio.CancelledError:
+            cls.Cancelled.append(InputEvent["VALUE"])
+            raise
+        cls.Finished.append(InputEvent["VALUE"])
+
+def Reset() -> None:
+    ASYNC_HANDLER.Started = []
+    ASYNC_HANDLER.Finished = []
+    ASYNC_HANDLER.Cancelled = []
+
+#The loop only moves when a tick steps it, like inside Blender
+def TickUntil(Condition: Any,Timeout: float = 5.0) -> bool:
+
+    StartTime: float = time.monotonic()
+
+    while ((time.monotonic() - StartTime) < Timeout):
+        if (Condition() == True):
+            return True
+        bpy.app.timers.Tick()
+        time.sleep(0.005)
+
+    return False
+
+def test_newer_event_cancels_the_stale_run() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("ASYNC_STALE")
+    App.Console.OutputFilter = {"NONE":0}
+    MethodID: str = "test_async.ASYNC_HANDLER.OnEvent"
+
+    Reset()
+    App.EventManager.AddEvent(MethodID,[{"EVENT_TYPE":"VARIABLE_CHANGED"}])
+
+    try:
+        App.HandleEvent({"EVENT_ID":"SIZE","EVENT_TYPE":"VARIABLE_CHANGED","VALUE":1})
+        bpy.app.timers.Tick()
+        App.HandleEvent({"EVENT_ID":"SIZE","EVENT_TYPE":"VARIABLE_CHANGED","VALUE":2})
+        #A different EVENT_ID is not stale
+        App.HandleEvent({"EVENT_ID":"NAME","EVENT_TYPE":"VARIABLE_CHANGED","VALUE":3})
+        assert bpy.app.timers.Registered.count(App.Async.Step) == 1
+
+        assert TickUntil(lambda: App.Async.IsStepping == False) == True
+        assert ASYNC_HANDLER.Started == [1,2,3]
+        assert ASYNC_HANDLER.Cancelled == [1]
+        assert sorted(ASYNC_HANDLER.Finished) == [2,3]
+        assert App.Async.InFlight == {}
+        assert bpy.app.timers.Registered == []
+
+    finally:
+        App.Async.Shutdown()
+        App.EventManager.RemoveEvent(MethodID)
+
+def test_shutdown_cancels_what_is_left() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("ASYNC_SHUTDOWN")
+    App.Console.OutputFilter = {"NONE":0}
+    MethodID: str = "test_async.ASYNC_HANDLER.OnEvent"
+
+    Reset()
+    App.EventManager.AddEvent(MethodID,[{"EVENT_TYPE":"VARIABLE_CHANGED"}])
+
+    App.HandleEvent({"EVENT_ID":"SIZE","EVENT_TYPE":"VARIABLE_CHANGED","VALUE":1})
+    bpy.app.timers.Tick()
+    App.Async.Shutdown()
+    App.EventManager.RemoveEvent(MethodID)
+
+    assert ASYNC_HANDLER.Cancelled == [1]
+    assert ASYNC_HANDLER.Finished == []
+    assert (App.Async.Loop,App.Async.InFlight) == (None,{})
+
+    #The timer finds the loop gone and stops on its own
+    bpy.app.timers.Tick()
+    assert App.Async.IsStepping == False
+    assert bpy.app.timers.Registered == []
@@ -0,0 +1,149 @@
+import types
+import bpy, RADGUI
+
+from typing import List, Dict, Any
+
+class BATCH_HANDLER():
+    Events: List[Dict[str, Any]] = []
+
+    @classmethod
+    def OnEvent(cls,InputEvent: Dict[str, Any]) -> None:
+        cls.Events.append(InputEvent)
+
+#Only what the batch operator asks of Blender's window manager
+class FAKE_WINDOW_MANAGER():
+    def __init__(self) -> None:
+        self.Timers: List[Any] = []
+        self.Handlers: List[Any] = []
+        self.Progress: List[Any] = []
+
+    def event_timer_add(self,Interval: float,window: Any = None) -> Any:
+        self.Timers.append(object())
+        return self.Timers[-1]
+
+    def event_timer_remove(self,Timer: Any) -> None:
+        self.Timers.remove(Timer)
+
+    def modal_handler_add(self,Operator: Any) -> None:
+        self.Handlers.append(Operator)
+
+    def progress_begin(self,Minimum: int,Maximum: int) -> None:
+        self.Progress.append(("BEGIN",Maximum))
+
+    def progress_update(self,Value: int) -> None:
+        self.Progress.append(("UPDATE",Value))
+
+    def progress_end(self) -> None:
+        self.Progress.append(("END",))
+
+def BuildOperator(App: Any,Name: str,ChunkSize: int) -> Any:
+    #Any budget runs out after the first chunk, so each tick does exactly one
+    return App.Factory.BuildOperator({
+        "TYPE":"OPERATOR",
+        "DOMAIN":"batch",
+        "CLASS":Name,
+        "TEXT":"Batch",
+        "MODE":"BATCH",
+        "ITEMS":"SELECTED_OBJECTS",
+        "CHUNK_SIZE":ChunkSize,
+        "TIME_BUDGET":1e-9
+    })
+
+def BuildContext(Count: int) -> Any:
+
+    Objects: List[Any] = [bpy.types.Object("Item" + str(x)) for x in range(Count)]
+
+    for Object in Objects:
+        bpy.data.objects[Object.name] = Object
+
+    return types.SimpleNamespace(window_manager=FAKE_WINDOW_MANAGER(),workspace=None,window=None,selected_objects=Objects)
+
+def Tick(Operator: Any,Context: Any) -> Any:
+    return Operator.modal(Context,types.SimpleNamespace(type='TIMER',timer=Operator.Timer))
+
+def Raised(EventType: str) -> List[Dict[str, Any]]:
+    return [x for x in BATCH_HANDLER.Events if x["EVENT_TYPE"] == EventType]
+
+def test_batch_runs_one_chunk_per_tick() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("BATCH_CHUNKS")
+    App.Console.OutputFilter = {"NONE":0}
+    MethodID: str = "test_batch_operator.BATCH_HANDLER.OnEvent"
+    Context: Any = BuildContext(5)
+    Operator: Any = BuildOperator(App,"chunks",2)()
+
+    BATCH_HANDLER.Events = []
+    Operator.EventID = "BATCH"
+    App.EventManager.AddEvent(MethodID,[{"EVENT_ID":"BATCH"}])
+
+    try:
+        assert Operator.invoke(Context,None) == {'RUNNING_MODAL'}
+        assert Context.window_manager.Handlers == [Operator]
+        assert Raised("BATCH_CHUNK") == []
+
+        #Other events go past without doing any work
+        assert Operator.modal(Context,types.SimpleNamespace(type='MOUSEMOVE',timer=None)) == {'PASS_THROUGH'}
+
+        assert Tick(Operator,Context) == {'RUNNING_MODAL'}
+        assert Tick(Operator,Context) == {'RUNNING_MODAL'}
+        assert [x["ITEMS"] for x in Raised("BATCH_CHUNK")] == [("Item0","Item1"),("Item2","Item3")]
+
+        assert Tick(Operator,Context) == {'FINISHED'}
+        assert Raised("BATCH_CHUNK")[-1]["ITEMS"] == ("Item4",)
+        assert [x.name for x in Raised("BATCH_CHUNK")[-1]["OBJECTS"]] == ["Item4"]
+        assert (Raised("BATCH_FINISHED")[0]["DONE"],Raised("BATCH_FINISHED")[0]["TOTAL"]) == (5,5)
+        assert Context.window_manager.Progress == [("BEGIN",5),("UPDATE",2),("UPDATE",4),("UPDATE",5),("END",)]
+        assert Context.window_manager.Timers == []
+
+    finally:
+        App.EventManager.RemoveEvent(MethodID)
+        bpy.data.objects.clear()
+
+def test_cancel_stops_between_ticks() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("BATCH_CANCEL")
+    App.Console.OutputFilter = {"NONE":0}
+    MethodID: str = "test_batch_operator.BATCH_HANDLER.OnEvent"
+    Context: Any = BuildContext(6)
+    Operator: Any = BuildOperator(App,"cancel",2)()
+
+    BATCH_HANDLER.Events = []
+    Operator.EventID = "BATCH"
+    App.EventManager.AddEvent(MethodID,[{"EVENT_ID":"BATCH"}])
+
+    try:
+        Operator.invoke(Context,None)
+        Tick(Operator,Context)
+
+        assert Operator.modal(Context,types.SimpleNamespace(type='ESC',timer=None)) == {'CANCELLED'}
+        assert len(Raised("BATCH_CHUNK")) == 1
+        assert (Raised("BATCH_CANCELLED")[0]["DONE"],Raised("BATCH_CANCELLED")[0]["TOTAL"]) == (2,6)
+        assert Raised("BATCH_FINISHED") == []
+        #The timer goes with it, so no more chunks arrive
+        assert Context.window_manager.Timers == []
+        assert Context.window_manager.Progress[-1] == ("END",)
+
+    finally:
+        App.EventManager.RemoveEvent(MethodID)
+        bpy.data.objects.clear()
+
+def test_execute_runs_everything_at_once() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("BATCH_EXECUTE")
+    App.Console.OutputFilter = {"NONE":0}
+    MethodID: str = "test_batch_operator.BATCH_HANDLER.OnEvent"
+    Context: Any = BuildContext(5)
+    Operator: Any = BuildOperator(App,"execute",2)()
+
+    BATCH_HANDLER.Events = []
+    Operator.EventID = "BATCH"
+    App.EventManager.AddEvent(MethodID,[{"EVENT_ID":"BATCH"}])
+
+    try:
+        assert Operator.execute(Context) == {'FINISHED'}
+        assert [len(x["ITEMS"]) for x in Raised("BATCH_CHUNK")] == [2,2,1]
+        assert [x["EVENT_TYPE"] for x in BATCH_HANDLER.Events] == ["BATCH_STARTED","BATCH_CHUNK","BATCH_CHUNK","BATCH_CHUNK","BATCH_FINISHED"]
+
+    finally:
+        App.EventManager.RemoveEvent(MethodID)
+        bpy.data.objects.clear()
@@ -0,0 +1,84 @@
+import json, os
+import RADGUI
+
+from typing import List, Dict, Any
+
+def WriteBundle(Folder: Any,Files: Dict[str, Any]) -> str:
+
+    Name: str = ""
+
+    for Name in Files:
+        with open(os.path.join(str(Folder),Name),"w") as fileOutput:
+            json.dump(Files[Name],fileOutput)
+
+    return str(Folder)
+
+def BuildApp(Name: str) -> Any:
+
+    App: Any = RADGUI.RADGUI_APP(Name)
+    App.Console.OutputFilter = {"NONE":0}
+    return App
+
+def test_bundle_merges_in_file_order(tmp_path: Any) -> None:
+
+    App: Any = BuildApp("BUNDLE_MERGE")
+    Folder: str = WriteBundle(tmp_path,{
+        "a.json":{"SETTINGS_A":{"TYPE":"CONFIG","CONSOLE_FILTER":{"NONE":0},"ICONS":{"ONE":"one.png"}}},
+        "b.json":{
+            "SETTINGS_B":{"TYPE":"CONFIG","CONSOLE_FILTER":{"NONE":0},"ICONS":{"TWO":"two.png"}},
+            "RUN":{"TYPE":"OPERATOR","DOMAIN":"bundle","CLASS":"run","TEXT":"Run"}
+        }
+    })
+
+    assert App.LoadBundle(Folder) == True
+    assert list(App.Factory.JSONContent) == ["SETTINGS_A","SETTINGS_B","RUN"]
+    #Same result on a pool
+    assert App.LoadBundle(Folder,Workers=2) == True
+    assert list(App.Factory.JSONContent) == ["SETTINGS_A","SETTINGS_B","RUN"]
+
+def test_bundle_rejects_what_register_would_skip(tmp_path: Any) -> None:
+
+    App: Any = BuildApp("BUNDLE_REJECT")
+    Folder: str = WriteBundle(tmp_path,{
+        "a.json":{"SETTINGS_A":{"TYPE":"CONFIG","CONSOLE_FILTER":{"NONE":0}}},
+        "b.json":{
+            "SETTINGS_B":{"TYPE":"CONFIG","CONSOLE_FILTER":{"ALL":2}},
+            "RUN":{"TYPE":"OPERATOR","DOMAIN":"bundle","CLASS":"run"}
+        }
+    })
+
+    App.Factory.JSONContent = {}
+    assert App.LoadBundle(Folder) == False
+    assert App.Factory.JSONContent == {}
+    assert len(App.Factory.LoadErrors) == 2
+    assert "\"RUN\" has no TEXT" in App.Factory.LoadErrors[0]
+    assert "CONSOLE_FILTER" in App.Factory.LoadErrors[1]
+
+def test_manifest_asks_for_a_process_pool(tmp_path: Any,monkeypatch: Any) -> None:
+
+    App: Any = BuildApp("BUNDLE_PROCESSES")
+    Pools: List[int] = []
+    Pool: Any = RADGUI.concurrent.futures.ProcessPoolExecutor
+
+    #The real pool, counting how often it's made
+    class COUNTED_POOL(Pool):
+        def __init__(self,max_workers: int) -> None:
+            Pools.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(RADGUI.concurrent.futures,"ProcessPoolExecutor",COUNTED_POOL)
+    WriteBundle(tmp_path,{
+        "a.json":{"SETTINGS_A":{"TYPE":"CONFIG","CONSOLE_FILTER":{"NONE":0}}},
+        "b.json":{"RUN":{"TYPE":"OPERATOR","DOMAIN":"bundle","CLASS":"run","TEXT":"Run"}},
+        "c.json":{"STOP":{"TYPE":"OPERATOR","DOMAIN":"bundle","CLASS":"stop","TEXT":"Stop"}},
+        "manifest.json":{"TYPE":"MANIFEST","FILES":["a.json","b.json","c.json"],"WORKERS":2,"PROCESSES":True}
+    })
+
+    #LoadJSON hands the manifest to LoadBundle without any arguments
+    assert App.LoadJSON(str(tmp_path / "manifest.json")) == True
+    assert Pools == [2]
+    assert list(App.Factory.JSONContent) == ["SETTINGS_A","RUN","STOP"]
+
+    #Arguments given to LoadBundle win over the manifest
+    assert App.LoadBundle(str(tmp_path / "manifest.json"),Workers=1) == True
+    assert Pools == [2]
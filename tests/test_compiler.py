@@ -0,0 +1,164 @@
+import importlib.util, json, copy
+import bpy, RADGUI
+
+from RADGUI.compiler import RADGUI_COMPILER
+from typing import List, Dict, Any
+
+class COMPILED_HANDLER():
+    Events: List[Dict[str, Any]] = []
+
+    @classmethod
+    def OnEvent(cls,InputEvent: Dict[str, Any]) -> None:
+        cls.Events.append(InputEvent)
+
+    @classmethod
+    def OnAny(cls,InputEvent: Dict[str, Any]) -> None:
+        cls.Events.append(InputEvent)
+
+DEFINITION: Dict[str, Any] = {
+    "SETTINGS":{
+        "TYPE":"CONFIG",
+        "CONSOLE_FILTER":{"NONE":0},
+        "EVENTS":{
+            "ASSOCIATIONS":{
+                #The narrower criteria is folded into the looser one
+                "test_compiler.COMPILED_HANDLER.OnEvent":[{"EVENT_TYPE":"VARIABLE_CHANGED","EVENT_ID":"COUNT"},{"EVENT_TYPE":"VARIABLE_CHANGED"},{"EVENT_ID":"RUN"}],
+                "test_compiler.COMPILED_HANDLER.OnAny":{"EVENTS":[{"OBJECT_TYPE":"OPERATOR"}],"CACHE":{"SIZE":4}},
+                "test_compiler.COMPILED_HANDLER.Missing":[{"EVENT_ID":"RUN"}]
+            }
+        }
+    },
+    "VALUES":{
+        "TYPE":"PROPERTIES",
+        "DOMAIN":"COMPILED_VALUES",
+        "CONTENT":[
+            {"NAME":"COUNT","TYPE":"INTEGER","DEFAULT":1,"SOFT_MIN":0},
+            {"NAME":"LABEL","TYPE":"STRING","DEFAULT":"Hello"},
+            {"NAME":"MODE","TYPE":"ENUM","ITEMS":[["A","A","First"],["B","B","Second"]]}
+        ]
+    },
+    "RUN":{
+        "TYPE":"OPERATOR",
+        "DOMAIN":"compiled",
+        "CLASS":"run",
+        "TEXT":"Run"
+    },
+    "MAIN":{
+        "TYPE":"PANEL",
+        "LABEL":"Compiled",
+        "SPACE":"VIEW_3D",
+        "REGION":"UI",
+        "CONTENT":[
+            {"TYPE":"LABEL","TEXT":"Compiled","ICON":"INFO"},
+            {"TYPE":"ROW","ALIGN":True,"SAVE":True},
+            {"TYPE":"PROPERTY","CONTEXT":"ROW","VARIABLE":"COMPILED_VALUES.COUNT","SLIDER":True},
+            {"TYPE":"PROPERTY","VARIABLE":"COMPILED_VALUES.LABEL"},
+            {"TYPE":"OPERATOR","CONTEXT":"LAYOUT","CLASS":"compiled.run","EVENT_ID":"RUN"}
+        ]
+    }
+}
+
+#Writes down every layout call, rows, columns and operators hand back their own recorder
+class FAKE_LAYOUT():
+    def __init__(self,Calls: List[Any],Path: str = "layout") -> None:
+        object.__setattr__(self,"Calls",Calls)
+        object.__setattr__(self,"Path",Path)
+
+    def __getattr__(self,Name: str) -> Any:
+        def Call(*Arguments: Any,**Keywords: Any) -> Any:
+            self.Calls.append((self.Path,Name,Arguments,Keywords))
+            return FAKE_LAYOUT(self.Calls,self.Path + "." + Name)
+        return Call
+
+    def __setattr__(self,Name: str,Value: Any) -> None:
+        self.Calls.append((self.Path,"=" + Name,Value))
+
+def Built(Prefix: str,Kind: str) -> Any:
+    return [x for x in bpy.utils.Registered if x.__name__.startswith(Prefix) and (Kind in x.__name__)][0]
+
+#Property arguments without the update callbacks, those are new functions either way
+def Annotations(Class: Any) -> Dict[str, Any]:
+    return {Key: (Value[0],{x: y for x, y in Value[1].items() if x != "update"}) for Key, Value in Class.__annotations__.items()}
+
+def Draw(Class: Any) -> List[Any]:
+
+    Calls: List[Any] = []
+    Panel: Any = Class()
+
+    Panel.layout = FAKE_LAYOUT(Calls)
+    Panel.draw(bpy.context)
+    return Calls
+
+def Capture(App: Any,Prefix: str) -> Dict[str, Any]:
+
+    if (App.EventManager.IsIndexed == False):
+        App.EventManager.BuildIndex()
+
+    return {
+        "ANNOTATIONS":Annotations(Built(Prefix,"PROPERTIES")),
+        "OPERATOR":Built(Prefix,"OPERATOR").bl_idname,
+        "DRAW":Draw(Built(Prefix,"PANEL")),
+        #Copies, unregistering takes the requests back in place
+        "EVENTS":copy.deepcopy({x: (y["EVENTS"],y["REQUESTS"]) for x, y in App.EventManager.RegisteredEvents.items()}),
+        "CACHES":sorted(App.EventManager.Caches),
+        #What each EVENT_TYPE actually dispatches to
+        "INDEX":{x: [z for z in y if z in App.EventManager.RegisteredEvents] for x, y in App.EventManager.DispatchIndex.items()}
+    }
+
+def test_compiled_module_matches_the_runtime_path(tmp_path: Any) -> None:
+
+    Runtime: Any = RADGUI.RADGUI_APP("COMPILER_RUNTIME")
+    Compiled: Any = RADGUI.RADGUI_APP("COMPILER_COMPILED")
+    InputFile: Any = tmp_path / "definition.json"
+    OutputFile: Any = tmp_path / "compiled_addon.py"
+    Spec: Any = None
+    Module: Any = None
+    Expected: Dict[str, Any] = {}
+    Result: Dict[str, Any] = {}
+
+    Runtime.Console.OutputFilter = {"NONE":0}
+    Compiled.Console.OutputFilter = {"NONE":0}
+    bpy.context.scene = bpy.types.Scene("Scene")
+    #Both registrations draw from the same group
+    bpy.context.scene.COMPILED_VALUES = "COMPILED_VALUES"
+
+    try:
+        Runtime.Factory.JSONContent = dict(DEFINITION)
+        assert Runtime.Register() == True
+        Expected = Capture(Runtime,"COMPILER_RUNTIME_")
+        Runtime.Unregister()
+
+        InputFile.write_text(json.dumps(DEFINITION))
+        assert RADGUI_COMPILER.CompileFile(str(InputFile),str(OutputFile)) == True
+        Spec = importlib.util.spec_from_file_location("compiled_addon",str(OutputFile))
+        Module = importlib.util.module_from_spec(Spec)
+        Spec.loader.exec_module(Module)
+
+        #The routing table is written out, nothing is left for register() to merge
+        assert Module.ROUTES["test_compiler.COMPILED_HANDLER.OnEvent"]["EVENTS"] == [{"EVENT_TYPE":"VARIABLE_CHANGED"},{"EVENT_ID":"RUN"}]
+        assert Module.INDEX["VARIABLE_CHANGED"] == ["test_compiler.COMPILED_HANDLER.OnEvent","test_compiler.COMPILED_HANDLER.OnAny","test_compiler.COMPILED_HANDLER.Missing"]
+
+        Compiled.EventManager.MergeEvents = None
+        Compiled.EventManager.BuildIndex = None
+        assert Module.register(Factory=Compiled.Factory) == True
+        del Compiled.EventManager.MergeEvents
+        del Compiled.EventManager.BuildIndex
+        Result = Capture(Compiled,"COMPILED_ADDON_")
+
+        #A handler that can't be found is left out, the same as at runtime
+        assert "test_compiler.COMPILED_HANDLER.Missing" not in Result["EVENTS"]
+        assert Result == Expected
+
+        COMPILED_HANDLER.Events = []
+        Compiled.HandleEvent({"EVENT_ID":"COUNT","EVENT_TYPE":"VARIABLE_CHANGED","OBJECT_TYPE":"VARIABLE"})
+        assert len(COMPILED_HANDLER.Events) == 1
+
+        #Registering again starts from the same table
+        Module.unregister(Factory=Compiled.Factory)
+        assert Compiled.EventManager.RegisteredEvents == {}
+        assert Module.register(Factory=Compiled.Factory) == True
+        assert Capture(Compiled,"COMPILED_ADDON_") == Expected
+        Module.unregister(Factory=Compiled.Factory)
+
+    finally:
+        bpy.context.scene = None
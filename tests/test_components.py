@@ -0,0 +1,83 @@
+import RADGUI
+
+from typing import List, Dict, Any
+
+DEFINITION: Dict[str, Any] = {
+    "SIZE_FIELDS":{
+        "TYPE":"COMPONENT",
+        "PARAMS":{"DOMAIN":"DEFAULT_VALUES","SLIDER":False},
+        "CONTENT":[
+            {"TYPE":"LABEL","TEXT":"{DOMAIN} size"},
+            {"TYPE":"PROPERTY","VARIABLE":"{DOMAIN}.WIDTH","SLIDER":"{SLIDER}"}
+        ]
+    },
+    "SIZE_BOX":{
+        "TYPE":"COMPONENT",
+        "NAME":"box",
+        "CONTENT":[
+            {"TYPE":"COLUMN","SAVE":True},
+            #Handed on to the nested component
+            {"TYPE":"COMPONENT","NAME":"SIZE_FIELDS","PARAMS":{"DOMAIN":"{DOMAIN}"}}
+        ]
+    },
+    "LOOP_A":{"TYPE":"COMPONENT","CONTENT":[{"TYPE":"LABEL","TEXT":"A"},{"TYPE":"COMPONENT","NAME":"LOOP_B"}]},
+    "LOOP_B":{"TYPE":"COMPONENT","CONTENT":[{"TYPE":"LABEL","TEXT":"B"},{"TYPE":"COMPONENT","NAME":"LOOP_A"}]}
+}
+
+def BuildApp(Name: str) -> Any:
+
+    App: Any = RADGUI.RADGUI_APP(Name)
+
+    App.Console.OutputFilter = {"NONE":0}
+    App.Factory.LoadComponents(DEFINITION)
+    return App
+
+def test_params_are_substituted() -> None:
+
+    App: Any = BuildApp("COMPONENT_PARAMS")
+    Result: List[Dict[str, Any]] = App.Factory.ExpandComponents([
+        {"TYPE":"LABEL","TEXT":"Before"},
+        {"TYPE":"COMPONENT","NAME":"size_fields","PARAMS":{"DOMAIN":"CUBE_VALUES","SLIDER":True}},
+        {"TYPE":"COMPONENT","NAME":"SIZE_FIELDS"}
+    ])
+
+    assert Result == [
+        {"TYPE":"LABEL","TEXT":"Before"},
+        {"TYPE":"LABEL","TEXT":"CUBE_VALUES size"},
+        #A value that is only the placeholder keeps its type
+        {"TYPE":"PROPERTY","VARIABLE":"CUBE_VALUES.WIDTH","SLIDER":True},
+        #The component's own defaults
+        {"TYPE":"LABEL","TEXT":"DEFAULT_VALUES size"},
+        {"TYPE":"PROPERTY","VARIABLE":"DEFAULT_VALUES.WIDTH","SLIDER":False}
+    ]
+    #The definition itself is left alone
+    assert DEFINITION["SIZE_FIELDS"]["CONTENT"][0]["TEXT"] == "{DOMAIN} size"
+
+def test_nested_components_and_shared_expansions() -> None:
+
+    App: Any = BuildApp("COMPONENT_NESTED")
+    First: List[Dict[str, Any]] = App.Factory.ExpandComponents([{"TYPE":"COMPONENT","NAME":"BOX","PARAMS":{"DOMAIN":"CUBE_VALUES"}}])
+    Second: List[Dict[str, Any]] = App.Factory.ExpandComponents([{"TYPE":"COMPONENT","NAME":"BOX","PARAMS":{"DOMAIN":"CUBE_VALUES"}}])
+
+    assert [x.get("TEXT",x.get("VARIABLE","")) for x in First] == ["","CUBE_VALUES size","CUBE_VALUES.WIDTH"]
+    #Same component and parameters, the same instructions
+    assert all(x is y for x, y in zip(First,Second)) == True
+
+def test_recursive_components_stop_and_say_so() -> None:
+
+    App: Any = BuildApp("COMPONENT_LOOP")
+    Written: List[str] = []
+    Result: List[Dict[str, Any]] = []
+
+    App.Console.Write = lambda Message: Written.append(Message)
+    try:
+        Result = App.Factory.ExpandComponents([{"TYPE":"COMPONENT","NAME":"LOOP_A"},{"TYPE":"COMPONENT","NAME":"MISSING"}])
+    finally:
+        del App.Console.Write
+
+    #Each goes in once, the include that would start over is left out
+    assert [x["TEXT"] for x in Result] == ["A","B"]
+    assert Written == [
+        "(RADGUI_FACTORY) Component \"LOOP_A\" includes itself - LOOP_A > LOOP_B",
+        "(RADGUI_FACTORY) Unknown component \"MISSING\""
+    ]
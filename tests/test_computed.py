@@ -0,0 +1,75 @@
+import types
+import bpy, RADGUI
+
+from typing import List, Dict, Any
+
+class COMPUTE_HANDLER():
+    @classmethod
+    def Size(cls,InputEvent: Dict[str, Any]) -> Any:
+        return InputEvent["INPUTS"]["SCENE_INPUTS.SCALE"] * 10
+
+def BuildScene(Name: str,Scale: float,ObjectNames: List[str]) -> Any:
+
+    Scene: Any = bpy.types.Scene(Name)
+    Object: Any = None
+
+    Scene.SCENE_INPUTS = types.SimpleNamespace(Domain="SCENE_INPUTS",SCALE=Scale,id_data=Scene)
+    Scene.objects = []
+    for Name in ObjectNames:
+        Object = bpy.types.Object(Name)
+        Object.OBJECT_VALUES = types.SimpleNamespace(SIZE=0.0)
+        Object.users_scene = [Scene]
+        Scene.objects.append(Object)
+        bpy.data.objects[Name] = Object
+
+    bpy.data.scenes[Scene.name] = Scene
+    return Scene
+
+def test_scene_input_only_reaches_its_own_objects() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("COMPUTED_TEST")
+    App.Console.OutputFilter = {"NONE":0}
+    First: Any = BuildScene("First",1.0,["A"])
+    Second: Any = BuildScene("Second",2.0,["B","C"])
+
+    App.Computed.AddDomain("SCENE_INPUTS","SCENE")
+    App.Computed.AddDomain("OBJECT_VALUES","OBJECT")
+    App.Computed.AddNode("OBJECT_VALUES","SIZE",["SCENE_INPUTS.SCALE"],"test_computed.COMPUTE_HANDLER.Size")
+    bpy.context.scene = First
+
+    try:
+        #Edited in a scene that isn't the current one, notified twice before the tick
+        App.Computed.Notify(Second.SCENE_INPUTS,bpy.context,"SCALE")
+        App.Computed.Notify(Second.SCENE_INPUTS,bpy.context,"SCALE")
+        assert sorted(x[1] for x in App.Computed.Pending) == sorted(id(x) for x in Second.objects)
+        assert bpy.app.timers.Registered.count(App.Computed.Flush) == 1
+
+        bpy.app.timers.Tick()
+        #Values of the owner's scene, not of the current one
+        assert [x.OBJECT_VALUES.SIZE for x in Second.objects] == [20.0,20.0]
+        assert First.objects[0].OBJECT_VALUES.SIZE == 0.0
+        assert App.Computed.IsScheduled == False
+        assert bpy.app.timers.Registered == []
+
+    finally:
+        App.Computed.RemoveDomain("OBJECT_VALUES")
+        App.Computed.RemoveDomain("SCENE_INPUTS")
+        App.Computed.Clear()
+        bpy.data.scenes.clear()
+        bpy.data.objects.clear()
+        bpy.context.scene = None
+
+def test_input_listed_twice_is_not_a_cycle() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("COMPUTED_DUPLICATE")
+    App.Console.OutputFilter = {"NONE":0}
+
+    App.Computed.AddNode("X","A",[],"test_computed.COMPUTE_HANDLER.Size")
+    App.Computed.AddNode("X","B",["A","X.A"],"test_computed.COMPUTE_HANDLER.Size")
+    App.Computed.BuildOrder()
+
+    assert App.Computed.Nodes["X.B"]["INPUTS"] == ["X.A"]
+    assert App.Computed.Order["X.A"] < App.Computed.Order["X.B"]
+
+    App.Computed.RemoveDomain("X")
+    assert App.Computed.Dependents == {}
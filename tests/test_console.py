@@ -0,0 +1,107 @@
+import os, time
+import RADGUI
+
+from typing import List, Dict, Any
+
+def ReadFile(FileName: str) -> str:
+
+    if (os.path.exists(FileName) == False):
+        return ""
+
+    with open(FileName,"r") as fileInput:
+        return fileInput.read()
+
+#The file sink writes from its own thread
+def WaitUntil(Condition: Any,Timeout: float = 5.0) -> bool:
+
+    StartTime: float = time.monotonic()
+
+    while ((time.monotonic() - StartTime) < Timeout):
+        if (Condition() == True):
+            return True
+        time.sleep(0.01)
+
+    return False
+
+def test_configured_sinks_get_every_message(tmp_path: Any) -> None:
+
+    App: Any = RADGUI.RADGUI_APP("CONSOLE_SINKS")
+    LogFile: str = str(tmp_path / "console.log")
+    Ring: Any = None
+    File: Any = None
+
+    App.Factory.ApplyConfig({"CONSOLE_SINKS":[{"TYPE":"RING","SIZE":2},{"TYPE":"FILE","PATH":LogFile}]})
+    Ring, File = App.Console.Sinks
+
+    App.Console.WriteTags = {"TEST":1}
+    App.Console.Write("First")
+    App.Console.Write("Second")
+    App.Console.Write("Third")
+
+    #The ring only keeps the last SIZE
+    assert Ring.Lines() == ["Second","Third"]
+
+    #Unregistering puts the old sinks back and closes the file, which writes out what's queued
+    App.Unregister()
+    assert App.Console.Sinks == []
+    assert File.Thread.is_alive() == False
+    assert ReadFile(LogFile).endswith("First\nSecond\nThird\n") == True
+
+def test_rate_limit_drops_and_reports(capsys: Any) -> None:
+
+    App: Any = RADGUI.RADGUI_APP("CONSOLE_RATE")
+    Ring: Any = RADGUI.RADGUI_RING_SINK()
+    Index: int = 0
+
+    App.Console.Sinks = [Ring]
+    App.Console.RateLimits = {"NOISY":2}
+
+    App.Console.WriteTags = {"NOISY":1}
+    for Index in range(5):
+        App.Console.Write("Noisy " + str(Index))
+    #Other tags have their own budget
+    App.Console.WriteTags = {"QUIET":1}
+    App.Console.Write("Quiet")
+
+    assert Ring.Lines() == ["Noisy 0","Noisy 1","Quiet"]
+    assert App.Console.Dropped == {"NOISY":3}
+
+    #A second later the bucket has refilled, and the next message says what was missed
+    App.Console.RateState["NOISY"][1] -= 1.0
+    App.Console.WriteTags = {"NOISY":1}
+    App.Console.Write("Noisy again")
+
+    assert Ring.Lines()[-2:] == ["(RADGUI_CONSOLE) 3 message(s) dropped for \"NOISY\"","Noisy again"]
+    assert App.Console.PendingDrops == {"NOISY":0}
+    #Nothing went to the terminal while a sink is set
+    assert capsys.readouterr().out == ""
+
+def test_file_sink_rotates_and_keeps_backups(tmp_path: Any) -> None:
+
+    LogFile: str = str(tmp_path / "rotate.log")
+    Sink: Any = RADGUI.RADGUI_FILE_SINK(LogFile,MaxBytes=10,Backups=2,FlushInterval=0.05)
+    Index: int = 0
+
+    try:
+        #Each message is over MAX_BYTES, so every one ends up in its own file
+        for Index in range(1,5):
+            Sink.Emit("TEST","Message number " + str(Index))
+            assert WaitUntil(lambda: ReadFile(LogFile + ".1") == "Message number {}\n".format(Index)) == True
+    finally:
+        Sink.Close()
+
+    assert ReadFile(LogFile + ".2") == "Message number 3\n"
+    assert os.path.exists(LogFile + ".3") == False
+    assert ReadFile(LogFile) == ""
+    assert Sink.Dropped == 0
+
+def test_full_file_sink_counts_drops(tmp_path: Any) -> None:
+
+    Sink: Any = RADGUI.RADGUI_FILE_SINK(str(tmp_path / "full.log"),QueueSize=1)
+
+    #Stop the writer from taking anything off the queue
+    Sink.Close()
+    Sink.Emit("TEST","Kept")
+    Sink.Emit("TEST","Dropped")
+
+    assert Sink.Dropped == 1
@@ -0,0 +1,46 @@
+import types
+import RADGUI
+
+from typing import List, Dict, Any
+
+class ENUM_HANDLER():
+    Calls: int = 0
+
+    @classmethod
+    def Items(cls,InputEvent: Dict[str, Any]) -> List[Any]:
+        cls.Calls += 1
+        return ["A",["B","Bee"]]
+
+class FAKE_OWNER():
+    Domain: str = "ENUM_VALUES"
+
+    def __init__(self,EnumCache: Any,EventManager: Any) -> None:
+        self.EnumCache: Any = EnumCache
+        self.EventManager: Any = EventManager
+
+    def as_pointer(self) -> int:
+        return id(self)
+
+def test_entries_stay_bounded() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("ENUM_CACHE_TEST")
+    App.Console.OutputFilter = {"NONE":0}
+    Handler: str = "test_enum_cache.ENUM_HANDLER.Items"
+    Owners: List[Any] = [FAKE_OWNER(App.EnumCache,App.EventManager) for x in range(10)]
+    Owner: Any = None
+
+    App.EnumCache.EntriesSize = 4
+    ENUM_HANDLER.Calls = 0
+
+    assert App.EnumCache.Items(Owners[0],None,"MODE",Handler,[],0) == [("A","A",""),("B","Bee","")]
+    App.EnumCache.Items(Owners[0],None,"MODE",Handler,[],0)
+    assert ENUM_HANDLER.Calls == 1
+
+    #Owners drawn once and never again make way for newer ones
+    for Owner in Owners[1:]:
+        App.EnumCache.Items(Owner,None,"MODE",Handler,[],0)
+    assert len(App.EnumCache.Entries) == 4
+    assert list(App.EnumCache.Entries)[-1][2] == Owners[-1].as_pointer()
+
+    App.EnumCache.Clear()
+    assert len(App.EnumCache.Entries) == 0
@@ -0,0 +1,83 @@
+import types
+import RADGUI
+
+from typing import List, Dict, Any
+
+class CACHED_HANDLER():
+    Calls: int = 0
+
+    @classmethod
+    def OnEvent(cls,InputEvent: Dict[str, Any]) -> Any:
+        cls.Calls += 1
+        return InputEvent["VALUE"] * 2
+
+def Changed(Domain: str,Name: str,Value: Any) -> Dict[str, Any]:
+    return {
+        "EVENT_ID":Name,
+        "EVENT_CLASS":types.SimpleNamespace(Domain=Domain),
+        "OBJECT_TYPE":"VARIABLE",
+        "EVENT_TYPE":"VARIABLE_CHANGED",
+        "VALUE":Value
+    }
+
+def test_cached_outcome_is_returned_and_invalidated() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("EVENT_CACHE")
+    App.Console.OutputFilter = {"NONE":0}
+    MethodID: str = "test_event_cache.CACHED_HANDLER.OnEvent"
+
+    CACHED_HANDLER.Calls = 0
+    App.EventManager.SetCache(MethodID,["EVENT_ID","VALUE"],8,["VALUES.SCALE"])
+    App.EventManager.AddEvent(MethodID,[{"EVENT_ID":"COUNT"}])
+
+    #Seen key values skip the handler, the remembered outcome still comes back
+    assert App.HandleEvent(Changed("VALUES","COUNT",2))[MethodID] == 4
+    assert App.HandleEvent(Changed("VALUES","COUNT",3))[MethodID] == 6
+    assert App.HandleEvent(Changed("VALUES","COUNT",2))[MethodID] == 4
+    assert CACHED_HANDLER.Calls == 2
+    assert App.EventManager.CacheStats(MethodID)[MethodID]["HITS"] == 1
+
+    #A property the handler doesn't depend on leaves the cache alone
+    App.HandleEvent(Changed("VALUES","OFFSET",1))
+    assert App.EventManager.CacheStats(MethodID)[MethodID]["ENTRIES"] == 2
+
+    #One it depends on forgets everything
+    App.HandleEvent(Changed("VALUES","SCALE",1))
+    assert App.EventManager.CacheStats(MethodID)[MethodID]["ENTRIES"] == 0
+    assert App.HandleEvent(Changed("VALUES","COUNT",2))[MethodID] == 4
+    assert CACHED_HANDLER.Calls == 3
+
+    App.EventManager.RemoveEvent(MethodID,[{"EVENT_ID":"COUNT"}])
+    assert App.EventManager.Caches == {}
+
+def test_default_key_tells_domains_and_objects_apart() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("EVENT_CACHE_SCOPE")
+    App.Console.OutputFilter = {"NONE":0}
+    MethodID: str = "test_event_cache.CACHED_HANDLER.OnEvent"
+    Cube: Any = types.SimpleNamespace(as_pointer=lambda: 1)
+    Sphere: Any = types.SimpleNamespace(as_pointer=lambda: 2)
+    Event: Dict[str, Any] = {}
+
+    CACHED_HANDLER.Calls = 0
+    App.EventManager.SetCache(MethodID)
+    #Both criteria match every WIDTH change
+    App.EventManager.AddEvent(MethodID,[{"EVENT_ID":"WIDTH"},{"EVENT_TYPE":"VARIABLE_CHANGED"}])
+
+    #Same property and value in two domains
+    App.HandleEvent(Changed("A","WIDTH",5))
+    App.HandleEvent(Changed("B","WIDTH",5))
+    assert CACHED_HANDLER.Calls == 2
+
+    #Same domain on two objects
+    for Owner in (Cube,Sphere,Cube):
+        Event = Changed("C","WIDTH",5)
+        Event["EVENT_CLASS"].Scope = "OBJECT"
+        Event["EVENT_CLASS"].id_data = Owner
+        App.HandleEvent(Event)
+    assert CACHED_HANDLER.Calls == 4
+
+    #The last one was a single hit, not one per matching criteria
+    assert App.EventManager.CacheStats(MethodID)[MethodID]["HITS"] == 1
+
+    App.EventManager.RemoveEvent(MethodID,[{"EVENT_ID":"WIDTH"},{"EVENT_TYPE":"VARIABLE_CHANGED"}])
@@ -0,0 +1,88 @@
+import os
+import bpy, RADGUI
+
+from typing import List, Dict, Any
+
+#Stands in for a bpy.utils.previews collection, counting what gets loaded
+class FAKE_PREVIEWS(dict):
+    Loaded: List[str] = []
+    Removed: List[Any] = []
+
+    def load(self,Name: str,FileName: str,FileType: str) -> Any:
+        FAKE_PREVIEWS.Loaded.append(os.path.basename(FileName))
+        self[Name] = type("PREVIEW",(),{"icon_id":100 + len(FAKE_PREVIEWS.Loaded)})()
+        return self[Name]
+
+def Previews(monkeypatch: Any) -> None:
+    FAKE_PREVIEWS.Loaded = []
+    FAKE_PREVIEWS.Removed = []
+    monkeypatch.setattr(bpy.utils.previews,"new",FAKE_PREVIEWS)
+    monkeypatch.setattr(bpy.utils.previews,"remove",lambda Collection: FAKE_PREVIEWS.Removed.append(Collection))
+
+def BuildIcons(Folder: Any) -> str:
+
+    Name: str = ""
+
+    os.mkdir(str(Folder / "icons"))
+    for Name in ["icons/cube.png","icons/sphere.png","icons/notes.txt","logo.png"]:
+        (Folder / Name).write_bytes(b"")
+
+    return str(Folder)
+
+def test_icons_load_when_drawn_or_on_the_timer(tmp_path: Any,monkeypatch: Any) -> None:
+
+    App: Any = RADGUI.RADGUI_APP("ICONS_DEFERRED")
+    App.Console.OutputFilter = {"NONE":0}
+    Previews(monkeypatch)
+
+    try:
+        App.Factory.BasePath = BuildIcons(tmp_path)
+        #Two names for one file share its preview
+        App.Factory.ApplyConfig({"ICONS":{"DIRECTORY":"icons","LOGO":"logo.png","BRAND":"logo.png"}})
+
+        #Registering only maps names to files
+        assert FAKE_PREVIEWS.Loaded == []
+        assert App.Icons.Collection == None
+        assert sorted(App.Icons.Paths) == ["BRAND","LOGO","cube","sphere"]
+        assert bpy.app.timers.Registered == [App.Icons.Load]
+
+        #Drawn before its turn, loaded on the spot and only once
+        assert App.Icons.Value("LOGO") == App.Icons.Value("BRAND") != 0
+        assert FAKE_PREVIEWS.Loaded == ["logo.png"]
+        assert App.Icons.Value("UNKNOWN") == 0
+
+        #However small the budget, each tick gets through at least one
+        App.Icons.Budget = 0.0
+        bpy.app.timers.Tick()
+        assert FAKE_PREVIEWS.Loaded == ["logo.png","cube.png"]
+        bpy.app.timers.Tick()
+        bpy.app.timers.Tick()
+        #The logo was already loaded, the timer has nothing left
+        assert FAKE_PREVIEWS.Loaded == ["logo.png","cube.png","sphere.png"]
+        assert (App.Icons.IsScheduled,bpy.app.timers.Registered) == (False,[])
+
+    finally:
+        App.Unregister()
+
+    assert App.Icons.Paths == {}
+    assert App.Icons.Value("LOGO") == 0
+
+def test_release_gives_the_previews_back(tmp_path: Any,monkeypatch: Any) -> None:
+
+    App: Any = RADGUI.RADGUI_APP("ICONS_RELEASE")
+    App.Console.OutputFilter = {"NONE":0}
+    Collection: Any = None
+    Previews(monkeypatch)
+
+    App.Factory.BasePath = BuildIcons(tmp_path)
+    App.Factory.ApplyConfig({"ICONS":{"DIRECTORY":"icons"}})
+    App.Icons.Value("cube")
+    Collection = App.Icons.Collection
+
+    #Released with the sphere still waiting
+    App.Unregister()
+
+    assert FAKE_PREVIEWS.Removed == [Collection]
+    assert FAKE_PREVIEWS.Loaded == ["cube.png"]
+    assert (App.Icons.Collection,App.Icons.IsScheduled,len(App.Icons.Waiting)) == (None,False,0)
+    assert bpy.app.timers.Registered == []
@@ -0,0 +1,158 @@
+import os, socket, threading, time, types
+import bpy, RADGUI
+
+from typing import List, Dict, Any
+
+class IPC_HANDLER():
+    Events: List[Dict[str, Any]] = []
+
+    @classmethod
+    def OnEvent(cls,InputEvent: Dict[str, Any]) -> None:
+        cls.Events.append(InputEvent)
+
+def BuildApp(Name: str) -> Any:
+
+    App: Any = RADGUI.RADGUI_APP(Name)
+    App.Console.OutputFilter = {"NONE":0}
+    return App
+
+#Runs the timers until Condition holds, the readers are real threads
+def TickUntil(Condition: Any,Timeout: float = 5.0) -> bool:
+
+    StartTime: float = time.monotonic()
+
+    while ((time.monotonic() - StartTime) < Timeout):
+        bpy.app.timers.Tick()
+        if (Condition() == True):
+            return True
+        time.sleep(0.01)
+
+    return False
+
+def test_lines_from_a_unix_socket_reach_the_handlers(tmp_path: Any) -> None:
+
+    App: Any = BuildApp("IPC_SOCKET")
+    MethodID: str = "test_ipc.IPC_HANDLER.OnEvent"
+    Address: str = str(tmp_path / "radgui.sock")
+    Client: Any = None
+
+    IPC_HANDLER.Events = []
+    App.EventManager.AddEvent(MethodID,[{"EVENT_TYPE":"EXTERNAL"}])
+
+    try:
+        assert App.IPC.Start("unix:" + Address) == True
+        Client = socket.socket(socket.AF_UNIX,socket.SOCK_STREAM)
+        Client.connect(Address)
+        #A line split across sends, a list of events, a broken line, and a last line without a newline
+        Client.sendall(b'{"EVENT_TYPE":"EXTERNAL","EVENT_ID":"A"}\n{"EVENT_TYPE":"EXT')
+        time.sleep(0.05)
+        Client.sendall(b'ERNAL","EVENT_ID":"B"}\n[{"EVENT_TYPE":"EXTERNAL","EVENT_ID":"C"},3]\nnot json\n')
+        Client.sendall(b'{"EVENT_TYPE":"EXTERNAL","EVENT_ID":"D"}')
+        Client.close()
+
+        assert TickUntil(lambda: len(IPC_HANDLER.Events) == 4) == True
+        assert [x["EVENT_ID"] for x in IPC_HANDLER.Events] == ["A","B","C","D"]
+        assert IPC_HANDLER.Events[0]["CONTEXT"] is bpy.context
+        assert App.IPC.Rejected == 2
+
+    finally:
+        App.IPC.Stop()
+        App.EventManager.RemoveEvent(MethodID,[{"EVENT_TYPE":"EXTERNAL"}])
+        TickUntil(lambda: bpy.app.timers.Registered == [])
+
+    #The socket goes with the server
+    assert os.path.exists(Address) == False
+
+def test_unix_path_that_is_not_a_socket_is_left_alone(tmp_path: Any) -> None:
+
+    App: Any = BuildApp("IPC_FILE")
+    Address: str = str(tmp_path / "settings.txt")
+
+    with open(Address,"w") as fileOutput:
+        fileOutput.write("keep me")
+
+    assert App.IPC.Start("unix:" + Address) == False
+    with open(Address,"r") as fileInput:
+        assert fileInput.read() == "keep me"
+
+def test_stop_leaves_a_file_that_took_the_path(tmp_path: Any) -> None:
+
+    App: Any = BuildApp("IPC_REPLACED")
+    Address: str = str(tmp_path / "radgui.sock")
+
+    assert App.IPC.Start("unix:" + Address) == True
+    os.remove(Address)
+    with open(Address,"w") as fileOutput:
+        fileOutput.write("not ours")
+
+    App.IPC.Stop()
+    TickUntil(lambda: bpy.app.timers.Registered == [])
+    assert os.path.exists(Address) == True
+
+def test_only_loopback_addresses_are_served() -> None:
+
+    App: Any = BuildApp("IPC_REMOTE")
+
+    assert App.IPC.Start("tcp:0.0.0.0:7447") == False
+    assert App.IPC.Start("tcp:192.168.1.10:7447") == False
+    assert App.IPC.IsRunning == False
+
+def test_full_queue_holds_the_reader_back() -> None:
+
+    App: Any = BuildApp("IPC_BACKPRESSURE")
+    Reader: Any = None
+
+    #Running without a listener, only the queue and the drain timer
+    App.IPC.Queue = RADGUI.queue.Queue(maxsize=1)
+    App.IPC.IsRunning = True
+    App.IPC.Dispatch = lambda CurrentEvent: None
+
+    try:
+        Reader = threading.Thread(target=App.IPC.ReadLine,args=(b'[{"EVENT_ID":1},{"EVENT_ID":2},{"EVENT_ID":3}]',))
+        Reader.start()
+        time.sleep(0.1)
+        assert Reader.is_alive() == True
+        assert App.IPC.Queue.qsize() == 1
+
+        bpy.app.timers.register(App.IPC.Drain)
+        assert TickUntil(lambda: App.IPC.Received == 3) == True
+        Reader.join(1.0)
+        assert Reader.is_alive() == False
+
+    finally:
+        App.IPC.IsRunning = False
+        TickUntil(lambda: bpy.app.timers.Registered == [])
+
+def test_set_variable_writes_the_scene_property() -> None:
+
+    App: Any = BuildApp("IPC_SET")
+    Scene: Any = bpy.types.Scene("Scene")
+
+    Scene.IPC_VALUES = types.SimpleNamespace(COUNT=1)
+    bpy.context.scene = Scene
+
+    try:
+        App.IPC.Dispatch({"EVENT_TYPE":"SET_VARIABLE","VARIABLE":"IPC_VALUES.COUNT","VALUE":9})
+        assert Scene.IPC_VALUES.COUNT == 9
+
+        App.IPC.Dispatch({"EVENT_TYPE":"SET_VARIABLE","VARIABLE":"COUNT","VALUE":3})
+        assert Scene.IPC_VALUES.COUNT == 9
+        assert App.IPC.Rejected == 1
+    finally:
+        bpy.context.scene = None
+
+def test_stale_socket_is_replaced(tmp_path: Any) -> None:
+
+    App: Any = BuildApp("IPC_STALE")
+    Address: str = str(tmp_path / "radgui.sock")
+    Stale: Any = socket.socket(socket.AF_UNIX,socket.SOCK_STREAM)
+
+    #Closing doesn't remove the file, as after a crash
+    Stale.bind(Address)
+    Stale.close()
+
+    try:
+        assert App.IPC.Start("unix:" + Address) == True
+    finally:
+        App.IPC.Stop()
+        TickUntil(lambda: bpy.app.timers.Registered == [])
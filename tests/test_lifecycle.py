@@ -0,0 +1,156 @@
+import gc, tracemalloc
+import bpy, RADGUI
+
+from typing import List, Dict, Any
+
+class LIFECYCLE_HANDLER():
+    @classmethod
+    def OnEvent(cls,InputEvent: Dict[str, Any]) -> None:
+        pass
+
+#Something of every kind Register builds, plus event associations
+DEFINITION: Dict[str, Any] = {
+    "SETTINGS":{
+        "TYPE":"CONFIG",
+        "CONSOLE_FILTER":{"NONE":0},
+        "EVENTS":{
+            "ASSOCIATIONS":{
+                "test_lifecycle.LIFECYCLE_HANDLER.OnEvent":[{"EVENT_TYPE":"VARIABLE_CHANGED"},{"EVENT_ID":"RUN"}]
+            }
+        }
+    },
+    "VALUES":{
+        "TYPE":"PROPERTIES",
+        "DOMAIN":"LIFECYCLE_VALUES",
+        "CONTENT":[
+            {"NAME":"COUNT","TYPE":"INTEGER","DEFAULT":1},
+            {"NAME":"LABEL","TYPE":"STRING","DEFAULT":"Hello"}
+        ]
+    },
+    "RUN":{
+        "TYPE":"OPERATOR",
+        "DOMAIN":"lifecycle",
+        "CLASS":"run",
+        "TEXT":"Run"
+    },
+    "MAIN":{
+        "TYPE":"PANEL",
+        "LABEL":"Lifecycle",
+        "SPACE":"VIEW_3D",
+        "REGION":"UI",
+        "CONTENT":[
+            {"TYPE":"LABEL","TEXT":"Lifecycle"},
+            {"TYPE":"PROPERTY","VARIABLE":"LIFECYCLE_VALUES.COUNT"},
+            {"TYPE":"OPERATOR","CLASS":"lifecycle.run"}
+        ]
+    }
+}
+
+def Cycle(App: Any) -> None:
+    App.Factory.JSONContent = dict(DEFINITION)
+    assert App.Register() == True
+    App.Unregister()
+
+def test_unregister_releases_everything() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("LIFECYCLE_RELEASE")
+    App.Console.OutputFilter = {"NONE":0}
+
+    App.Factory.JSONContent = dict(DEFINITION)
+    assert App.Register() == True
+    assert len(App.Factory.DynamicClasses) == 3
+    assert "test_lifecycle.LIFECYCLE_HANDLER.OnEvent" in App.EventManager.RegisteredEvents
+    assert hasattr(bpy.types.Scene,"LIFECYCLE_VALUES") == True
+
+    App.Unregister()
+
+    assert App.EventManager.RegisteredEvents == {}
+    assert App.Lifecycle.IsEmpty() == True
+    assert App.Factory.DynamicClasses == []
+    assert [x for x in bpy.utils.Registered if x.__name__.startswith("LIFECYCLE_RELEASE_")] == []
+    assert bpy.app.timers.Registered == []
+    assert hasattr(bpy.types.Scene,"LIFECYCLE_VALUES") == False
+    #The console filter came from the config, and goes back with it
+    assert App.Console.OutputFilter == {"NONE":0}
+
+def test_memory_stays_flat_across_cycles() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("LIFECYCLE_MEMORY")
+    App.Console.OutputFilter = {"NONE":0}
+    Index: int = 0
+    Before: int = 0
+    Growth: int = 0
+
+    #Let interned strings and first-use caches settle before measuring
+    for Index in range(20):
+        Cycle(App)
+
+    gc.collect()
+    tracemalloc.start()
+    Before = tracemalloc.get_traced_memory()[0]
+
+    for Index in range(400):
+        Cycle(App)
+
+    gc.collect()
+    Growth = tracemalloc.get_traced_memory()[0] - Before
+    tracemalloc.stop()
+
+    #A leak of even one small class per cycle would be several hundred kilobytes by now
+    assert Growth < 64 * 1024
+    assert App.EventManager.RegisteredEvents == {}
+    assert App.Lifecycle.IsEmpty() == True
+    assert bpy.app.timers.Registered == []
+    assert [x for x in bpy.utils.Registered if x.__name__.startswith("LIFECYCLE_MEMORY_")] == []
+
+def test_shared_method_keeps_other_owners_criteria() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("LIFECYCLE_SHARED")
+    App.Console.OutputFilter = {"NONE":0}
+    MethodID: str = "test_lifecycle.LIFECYCLE_HANDLER.OnEvent"
+    Narrow: Dict[str, Any] = {"EVENT_ID":"A","EVENT_TYPE":"VARIABLE_CHANGED"}
+    Loose: Dict[str, Any] = {"EVENT_ID":"A"}
+
+    App.EventManager.AddEvent(MethodID,[Narrow])
+    #The looser criteria absorbs the narrower one
+    App.EventManager.AddEvent(MethodID,[Loose])
+    assert App.EventManager.RegisteredEvents[MethodID]["EVENTS"] == [Loose]
+
+    #Taking the looser one back must leave the first owner's criteria in place
+    App.EventManager.RemoveEvent(MethodID,[Loose])
+    assert App.EventManager.RegisteredEvents[MethodID]["EVENTS"] == [Narrow]
+
+    #Same criteria added twice needs to be taken back twice
+    App.EventManager.AddEvent(MethodID,[Narrow])
+    App.EventManager.RemoveEvent(MethodID,[Narrow])
+    assert App.EventManager.RegisteredEvents[MethodID]["EVENTS"] == [Narrow]
+
+    App.EventManager.RemoveEvent(MethodID,[Narrow])
+    assert MethodID not in App.EventManager.RegisteredEvents
+
+def test_failed_cleanup_step_does_not_skip_the_rest() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("LIFECYCLE_FAILING")
+    App.Console.OutputFilter = {"NONE":0}
+    Written: List[str] = []
+
+    App.Factory.JSONContent = dict(DEFINITION)
+    assert App.Register() == True
+
+    #Something for the steps after the failing one to clear
+    App.Computed.Pending = {("LIFECYCLE_VALUES.COUNT",0):None}
+    App.Aggregator.Pending = {"LIFECYCLE_VALUES":None}
+    App.Icons.Release = None
+    App.Console.Write = lambda Message: Written.append(Message)
+
+    try:
+        assert App.Unregister() == False
+    finally:
+        del App.Icons.Release
+        del App.Console.Write
+
+    assert [x for x in Written if "failed" in x] == ["(RADGUI_FACTORY.UNREGISTER) Icons.Release failed"]
+    assert App.Lifecycle.IsEmpty() == True
+    assert App.Computed.Pending == {}
+    assert App.Aggregator.Pending == {}
+    assert hasattr(bpy.types.Scene,"LIFECYCLE_VALUES") == False
@@ -0,0 +1,47 @@
+import tracemalloc
+import RADGUI
+
+from typing import List, Dict, Any
+
+class PROFILED_HANDLER():
+    @classmethod
+    def OnEvent(cls,InputEvent: Dict[str, Any]) -> List[int]:
+        return list(range(100))
+
+def test_tracemalloc_outlives_the_first_stop() -> None:
+
+    First: Any = RADGUI.RADGUI_APP("PROFILER_FIRST")
+    Second: Any = RADGUI.RADGUI_APP("PROFILER_SECOND")
+
+    assert tracemalloc.is_tracing() == False
+    First.Profiler.Start()
+    Second.Profiler.Start()
+    First.Profiler.Start()
+
+    #Second is still profiling
+    First.Profiler.Stop()
+    assert tracemalloc.is_tracing() == True
+    assert Second.Profiler.IsProfiling == True
+
+    Second.Profiler.Stop()
+    assert tracemalloc.is_tracing() == False
+    assert RADGUI.RADGUI_MEMORY_PROFILER.Users == 0
+
+def test_handlers_are_profiled_while_timed() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("PROFILER_TIMED")
+    App.Console.OutputFilter = {"NONE":0}
+    MethodID: str = "test_profiler.PROFILED_HANDLER.OnEvent"
+
+    App.EventManager.AddEvent(MethodID,[{"EVENT_ID":"RUN"}])
+    App.EventManager.IsTiming = True
+    App.Profiler.Start()
+
+    try:
+        assert len(App.HandleEvent({"EVENT_ID":"RUN"})[MethodID]) == 100
+        assert App.Profiler.Stats[("HANDLER",MethodID)]["CALLS"] == 1
+        assert App.EventManager.HandlerStats[MethodID]["CALLS"] == 1
+    finally:
+        App.Profiler.Stop()
+        App.EventManager.IsTiming = False
+        App.EventManager.RemoveEvent(MethodID,[{"EVENT_ID":"RUN"}])
@@ -0,0 +1,68 @@
+import types
+import bpy, RADGUI
+
+from typing import List, Dict, Any
+
+class RECORDED_HANDLER():
+    Events: List[Dict[str, Any]] = []
+
+    @classmethod
+    def OnEvent(cls,InputEvent: Dict[str, Any]) -> None:
+        cls.Events.append(InputEvent)
+
+def BuildObject(Name: str) -> Any:
+
+    Object: Any = bpy.types.Object(Name)
+
+    Object.RECORDED_VALUES = types.SimpleNamespace(Domain="RECORDED_VALUES",Scope="OBJECT",id_data=Object)
+    bpy.data.objects[Name] = Object
+    return Object
+
+def test_batch_event_survives_record_and_replay(tmp_path: Any) -> None:
+
+    App: Any = RADGUI.RADGUI_APP("RECORDER_TEST")
+    App.Console.OutputFilter = {"NONE":0}
+    MethodID: str = "test_recorder.RECORDED_HANDLER.OnEvent"
+    LogFile: str = str(tmp_path / "events.log")
+    First: Any = BuildObject("First")
+    Second: Any = BuildObject("Second")
+    Replayed: Dict[str, Any] = {}
+
+    RECORDED_HANDLER.Events = []
+    App.EventManager.AddEvent(MethodID,[{"EVENT_TYPE":"VARIABLE_BATCH_CHANGED"}])
+
+    try:
+        assert App.Recorder.Start(LogFile) == True
+        App.HandleEvent({
+            "EVENT_ID":"RECORDED_VALUES",
+            "EVENT_CLASS":First.RECORDED_VALUES,
+            "CONTEXT":bpy.context,
+            "OBJECT_TYPE":"VARIABLE",
+            "EVENT_TYPE":"VARIABLE_BATCH_CHANGED",
+            "CHANGES":[
+                {"EVENT_CLASS":First.RECORDED_VALUES,"EVENT_ID":"COUNT","VALUE":3},
+                {"EVENT_CLASS":Second.RECORDED_VALUES,"EVENT_ID":"SIZE","VALUE":(1.0,2.0)}
+            ]
+        })
+        App.Recorder.Stop()
+
+        #Written down without any Blender objects
+        Replayed = App.Replayer.Load(LogFile)[0]["E"]
+        assert "EVENT_CLASS" not in Replayed["CHANGES"][0]
+        assert Replayed["CHANGES"][1]["EVENT_OWNER"] == ["OBJECT","Second"]
+
+        assert App.Replayer.Replay(LogFile,Speed=0) == True
+        while (App.Replayer.IsReplaying == True):
+            bpy.app.timers.Tick()
+
+        assert len(RECORDED_HANDLER.Events) == 2
+        Replayed = RECORDED_HANDLER.Events[1]
+        assert Replayed["EVENT_CLASS"] is First.RECORDED_VALUES
+        assert [x["EVENT_CLASS"] for x in Replayed["CHANGES"]] == [First.RECORDED_VALUES,Second.RECORDED_VALUES]
+        assert [x["VALUE"] for x in Replayed["CHANGES"]] == [3,[1.0,2.0]]
+        assert App.Replayer.Result["EVENTS"] == 1
+
+    finally:
+        App.Recorder.Stop()
+        App.EventManager.RemoveEvent(MethodID,[{"EVENT_TYPE":"VARIABLE_BATCH_CHANGED"}])
+        bpy.data.objects.clear()
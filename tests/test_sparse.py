@@ -0,0 +1,143 @@
+import types
+import bpy, RADGUI
+
+from typing import List, Dict, Any
+
+DEFINITION: Dict[str, Any] = {
+    "SETTINGS":{
+        "TYPE":"CONFIG",
+        "CONSOLE_FILTER":{"NONE":0}
+    },
+    "VALUES":{
+        "TYPE":"PROPERTIES",
+        "DOMAIN":"SPARSE_VALUES",
+        "SCOPE":"SPARSE",
+        "CONTENT":[
+            {"NAME":"COUNT","TYPE":"INTEGER","DEFAULT":1}
+        ]
+    }
+}
+
+#Blender keeps property values in RNA. This keeps them in a dict, runs the
+#update callbacks on assignment and can unset a value back to its default
+def FakeGroupClass(DomainClass: Any) -> Any:
+
+    Annotations: Dict[str, Any] = DomainClass.__annotations__
+
+    class FAKE_GROUP(DomainClass):
+        bl_rna = types.SimpleNamespace(properties=dict.fromkeys(["rna_type","name"] + list(Annotations)))
+
+        def __init__(self) -> None:
+            object.__setattr__(self,"Values",{})
+            object.__setattr__(self,"RADGUI_OWNER",None)
+
+        def __getattr__(self,Name: str) -> Any:
+            if (Name in Annotations):
+                return self.Values.get(Name,Annotations[Name][1].get("default"))
+            raise AttributeError(Name)
+
+        def __setattr__(self,Name: str,Value: Any) -> None:
+            if (Name in Annotations) and (Name != "RADGUI_OWNER"):
+                self.Values[Name] = Value
+                Annotations[Name][1]["update"](self,bpy.context)
+            else:
+                object.__setattr__(self,Name,Value)
+
+        def property_unset(self,Name: str) -> None:
+            self.Values.pop(Name,None)
+
+        def as_pointer(self) -> int:
+            return id(self)
+
+    return FAKE_GROUP
+
+class FAKE_ENTRIES(list):
+    def __init__(self,GroupClass: Any) -> None:
+        self.GroupClass: Any = GroupClass
+
+    def add(self) -> Any:
+        self.append(self.GroupClass())
+        return self[-1]
+
+    def remove(self,Position: int) -> None:
+        del self[Position]
+
+class FAKE_TABLE():
+    def __init__(self,GroupClass: Any) -> None:
+        self.Entries: Any = FAKE_ENTRIES(GroupClass)
+        self.Default: Any = GroupClass()
+        self.IsHome: bool = False
+
+    def as_pointer(self) -> int:
+        return id(self)
+
+def test_sparse_round_trip() -> None:
+
+    App: Any = RADGUI.RADGUI_APP("SPARSE_TEST")
+    App.Console.OutputFilter = {"NONE":0}
+    App.Factory.JSONContent = dict(DEFINITION)
+    assert App.Register() == True
+
+    GroupClass: Any = FakeGroupClass(App.Factory.DynamicClasses[0])
+    First: Any = bpy.types.Scene("First")
+    Second: Any = bpy.types.Scene("Second")
+    Cube: Any = bpy.types.Object("Cube")
+    View: Any = None
+    Entry: Any = None
+
+    for Scene in (First,Second):
+        Scene.RADGUI_SPARSE_SPARSE_VALUES = FAKE_TABLE(GroupClass)
+        bpy.data.scenes[Scene.name] = Scene
+    bpy.data.objects[Cube.name] = Cube
+    bpy.context.scene = First
+    bpy.context.object = Cube
+
+    try:
+        #Nothing stored, the view reads the defaults
+        View = Cube.SPARSE_VALUES
+        assert isinstance(View,RADGUI.RADGUI_SPARSE_VIEW)
+        assert View.COUNT == 1
+        assert len(First.RADGUI_SPARSE_SPARSE_VALUES.Entries) == 0
+
+        #Writing through the view creates the entry, in the scene that becomes the home
+        View.COUNT = 5
+        Entry = Cube.SPARSE_VALUES
+        assert isinstance(Entry,RADGUI.RADGUI_SPARSE_VIEW) == False
+        assert Entry.COUNT == 5
+        assert First.RADGUI_SPARSE_SPARSE_VALUES.IsHome == True
+
+        #One table per file, switching scenes changes nothing
+        bpy.context.scene = Second
+        assert Cube.SPARSE_VALUES.COUNT == 5
+        assert len(Second.RADGUI_SPARSE_SPARSE_VALUES.Entries) == 0
+
+        #Back to the default - compacted on the next compaction, not right away
+        Entry.COUNT = 1
+        assert len(First.RADGUI_SPARSE_SPARSE_VALUES.Entries) == 1
+        assert App.Sparse.Compact in bpy.app.timers.Registered
+        bpy.app.timers.Tick()
+        assert len(First.RADGUI_SPARSE_SPARSE_VALUES.Entries) == 0
+        assert isinstance(Cube.SPARSE_VALUES,RADGUI.RADGUI_SPARSE_VIEW)
+
+        #Editing the defaults a panel draws moves the change onto the active object
+        First.RADGUI_SPARSE_SPARSE_VALUES.Default.COUNT = 7
+        assert First.RADGUI_SPARSE_SPARSE_VALUES.Default.COUNT == 1
+        assert Cube.SPARSE_VALUES.COUNT == 7
+
+        #Saving sweeps entries whose object is gone
+        Cube.SPARSE_VALUES.RADGUI_OWNER = None
+        for Handler in list(bpy.app.handlers.save_pre):
+            Handler()
+        assert len(First.RADGUI_SPARSE_SPARSE_VALUES.Entries) == 0
+
+    finally:
+        App.Unregister()
+        bpy.data.scenes.clear()
+        bpy.data.objects.clear()
+        bpy.context.scene = None
+        bpy.context.object = None
+        while (len(bpy.app.timers.Registered) != 0):
+            bpy.app.timers.Tick()
+
+    assert bpy.app.handlers.save_pre == []
+    assert hasattr(bpy.types.Object,"SPARSE_VALUES") == False
@@ -0,0 +1,130 @@
+import pytest
+import bpy, RADGUI
+
+from typing import List, Dict, Any
+
+class TRANSACTION_HANDLER():
+    Events: List[Dict[str, Any]] = []
+
+    @classmethod
+    def OnEvent(cls,InputEvent: Dict[str, Any]) -> None:
+        cls.Events.append(InputEvent)
+
+DEFINITION: Dict[str, Any] = {
+    "SETTINGS":{
+        "TYPE":"CONFIG",
+        "CONSOLE_FILTER":{"NONE":0},
+        "EVENTS":{
+            "ASSOCIATIONS":{
+                "test_transaction.TRANSACTION_HANDLER.OnEvent":[{"OBJECT_TYPE":"VARIABLE"}]
+            }
+        }
+    },
+    "VALUES":{
+        "TYPE":"PROPERTIES",
+        "DOMAIN":"TRANSACTION_VALUES",
+        "CONTENT":[
+            {"NAME":"COUNT","TYPE":"INTEGER","DEFAULT":1},
+            {"NAME":"LABEL","TYPE":"STRING","DEFAULT":"A"}
+        ]
+    }
+}
+
+#Sets a property the way Blender does, the update callback runs right after the write
+def Write(Instance: Any,Name: str,Value: Any) -> None:
+    setattr(Instance,Name,Value)
+    type(Instance).__annotations__[Name][1]["update"](Instance,bpy.context)
+
+def BuildScene(DomainClass: Any,Name: str) -> Any:
+
+    Scene: Any = bpy.types.Scene(Name)
+
+    Scene.TRANSACTION_VALUES = DomainClass()
+    Scene.TRANSACTION_VALUES.COUNT = 1
+    Scene.TRANSACTION_VALUES.LABEL = "A"
+    bpy.data.scenes[Name] = Scene
+    return Scene
+
+@pytest.fixture
+def App() -> Any:
+
+    App: Any = RADGUI.RADGUI_APP("TRANSACTION_TEST")
+
+    App.Console.OutputFilter = {"NONE":0}
+    App.Factory.JSONContent = dict(DEFINITION)
+    assert App.Register() == True
+    TRANSACTION_HANDLER.Events = []
+
+    yield App
+
+    App.Unregister()
+    bpy.data.scenes.clear()
+
+def Domain(App: Any) -> Any:
+    return [x for x in App.Factory.DynamicClasses if getattr(x,"Domain","") == "TRANSACTION_VALUES"][0]
+
+def test_commit_raises_one_batch_event(App: Any) -> None:
+
+    DomainClass: Any = Domain(App)
+    First: Any = BuildScene(DomainClass,"First")
+    Second: Any = BuildScene(DomainClass,"Second")
+
+    with DomainClass.Transaction():
+        Write(First.TRANSACTION_VALUES,"COUNT",2)
+        Write(First.TRANSACTION_VALUES,"COUNT",3)
+        #Nested transactions hand their changes to the outer one
+        with Second.TRANSACTION_VALUES.Transaction():
+            Write(Second.TRANSACTION_VALUES,"LABEL","B")
+        Write(First.TRANSACTION_VALUES,"LABEL","C")
+
+    assert len(TRANSACTION_HANDLER.Events) == 1
+    assert TRANSACTION_HANDLER.Events[0]["EVENT_TYPE"] == "VARIABLE_BATCH_CHANGED"
+    assert TRANSACTION_HANDLER.Events[0]["EVENT_CLASS"] is DomainClass
+    #Each property once, with its final value, in the order it was first changed
+    assert [(x["EVENT_CLASS"],x["EVENT_ID"],x["VALUE"]) for x in TRANSACTION_HANDLER.Events[0]["CHANGES"]] == [
+        (First.TRANSACTION_VALUES,"COUNT",3),
+        (Second.TRANSACTION_VALUES,"LABEL","B"),
+        (First.TRANSACTION_VALUES,"LABEL","C")
+    ]
+    assert DomainClass.ActiveTransaction == None
+
+    #Outside a transaction every write is its own event again
+    Write(First.TRANSACTION_VALUES,"COUNT",4)
+    assert TRANSACTION_HANDLER.Events[1]["EVENT_TYPE"] == "VARIABLE_CHANGED"
+
+def test_atomic_transaction_rolls_back_when_the_block_raises(App: Any) -> None:
+
+    DomainClass: Any = Domain(App)
+    First: Any = BuildScene(DomainClass,"First")
+    Second: Any = BuildScene(DomainClass,"Second")
+
+    with pytest.raises(ValueError):
+        with DomainClass.Transaction(IsAtomic=True):
+            Write(First.TRANSACTION_VALUES,"COUNT",5)
+            Write(Second.TRANSACTION_VALUES,"LABEL","B")
+            raise ValueError("stop")
+
+    assert (First.TRANSACTION_VALUES.COUNT,Second.TRANSACTION_VALUES.LABEL) == (1,"A")
+    #Nothing changed in the end, so nothing is raised
+    assert TRANSACTION_HANDLER.Events == []
+    assert DomainClass.ActiveTransaction == None
+
+    #Without IsAtomic the writes stay, and are still reported
+    with pytest.raises(ValueError):
+        with First.TRANSACTION_VALUES.Transaction():
+            Write(First.TRANSACTION_VALUES,"COUNT",5)
+            raise ValueError("stop")
+
+    assert First.TRANSACTION_VALUES.COUNT == 5
+    assert [x["VALUE"] for x in TRANSACTION_HANDLER.Events[0]["CHANGES"]] == [5]
+
+def test_atomic_transaction_commits_when_the_block_finishes(App: Any) -> None:
+
+    DomainClass: Any = Domain(App)
+    First: Any = BuildScene(DomainClass,"First")
+
+    with First.TRANSACTION_VALUES.Transaction(IsAtomic=True):
+        Write(First.TRANSACTION_VALUES,"COUNT",7)
+
+    assert First.TRANSACTION_VALUES.COUNT == 7
+    assert [x["VALUE"] for x in TRANSACTION_HANDLER.Events[0]["CHANGES"]] == [7]
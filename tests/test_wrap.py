@@ -0,0 +1,68 @@
+import types
+import RADGUI
+
+from typing import List, Dict, Any
+
+TEXT: str = "RADGUI breaks long label text into lines that fit the region it is drawn in.\nLine breaks of its own stay."
+
+class FAKE_COLUMN():
+    def __init__(self) -> None:
+        self.Labels: List[Dict[str, Any]] = []
+
+    def column(self,align: bool = False) -> Any:
+        return self
+
+    def label(self,**Arguments: Any) -> None:
+        self.Labels.append(Arguments)
+
+def BuildEngine(Name: str) -> Any:
+
+    App: Any = RADGUI.RADGUI_APP(Name)
+
+    App.Console.OutputFilter = {"NONE":0}
+    return App.Engine
+
+def test_widths_in_one_bucket_share_the_lines() -> None:
+
+    Engine: Any = BuildEngine("WRAP_BUCKETS")
+    Lines: Any = Engine.WrapText(TEXT,300)
+
+    #A few pixels of resizing hits the cache
+    assert Engine.WrapText(TEXT,310) is Lines
+    assert Engine.WrapText(TEXT,319) is Lines
+    assert len(Engine.LabelCache) == 1
+
+    #Measured against the bottom of the bucket, so the lines fit every width in it
+    assert all(len(x) * Engine.CharacterWidth <= 300 for x in Lines) == True
+    assert Lines[-1] == "Line breaks of its own stay."
+
+    #The next bucket and another UI scale are worked out again
+    assert Engine.WrapText(TEXT,320) is not Lines
+    assert len(Engine.WrapText(TEXT,300,2.0)) > len(Lines)
+    assert len(Engine.LabelCache) == 3
+
+def test_cache_keeps_the_most_recent_texts() -> None:
+
+    Engine: Any = BuildEngine("WRAP_LRU")
+    Engine.LabelCacheSize = 2
+
+    Engine.WrapText("First",300)
+    Engine.WrapText("Second",300)
+    #Using First again makes Second the oldest
+    Engine.WrapText("First",300)
+    Engine.WrapText("Third",300)
+
+    assert [x[0] for x in Engine.LabelCache] == ["First","Third"]
+
+def test_wrapped_label_draws_a_line_per_label() -> None:
+
+    Engine: Any = BuildEngine("WRAP_DRAW")
+    Column: Any = FAKE_COLUMN()
+    Context: Any = types.SimpleNamespace(region=types.SimpleNamespace(width=300),preferences=types.SimpleNamespace(system=types.SimpleNamespace(ui_scale=1.0)))
+    Attributes: Dict[str, Any] = Engine.ParseLabel({"TYPE":"LABEL","TEXT":TEXT,"ICON":"INFO","WRAP":True})
+
+    Engine.WriteWrappedLabel(Column,Context,Attributes)
+
+    assert [x["text"] for x in Column.Labels] == list(Engine.WrapText(TEXT,300))
+    #Only the first line carries the icon
+    assert [x["icon"] for x in Column.Labels] == ["INFO"] + ["NONE"] * (len(Column.Labels) - 1)